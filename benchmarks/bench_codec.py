@@ -0,0 +1,41 @@
+import json
+import pickle
+from src.rustymonad import Ok, Err, Some, Nothing
+from src.rustymonad import codec
+from .harness import case
+
+
+_batch = [Ok({'id': i, 'name': f'user{i}', 'score': i / 3}) if i % 5 else Err(f'row {i} invalid') for i in range(100)]
+_options = [Some(i) if i % 2 else Nothing() for i in range(100)]
+_encoded = codec.dumps(_batch)
+_pickled = pickle.dumps(_batch)
+
+
+@case('codec', 'codec.dumps x100')
+def codec_dumps():
+    return codec.dumps(_batch)
+
+
+@case('codec', 'codec.loads x100')
+def codec_loads():
+    return codec.loads(_encoded)
+
+
+@case('codec', 'pickle.dumps x100')
+def pickle_dumps():
+    return pickle.dumps(_batch)
+
+
+@case('codec', 'pickle.loads x100')
+def pickle_loads():
+    return pickle.loads(_pickled)
+
+
+@case('codec', 'pickle.dumps Option x100')
+def pickle_dumps_options():
+    return pickle.dumps(_options)
+
+
+@case('codec', 'json.dumps plain payloads x100', baseline=True)
+def json_dumps():
+    return json.dumps([result.unwrap_or(None) for result in _batch])
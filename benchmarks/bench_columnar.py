@@ -0,0 +1,35 @@
+from src.rustymonad import Ok, Err, ResultArray
+from src.rustymonad import columnar
+from .harness import case
+
+
+_SIZE = 1000
+_results = [Ok(float(i)) if i % 10 else Err(f'row {i} invalid') for i in range(_SIZE)]
+_array = ResultArray.from_results(_results, typecode='d')
+
+
+@case('columnar', f'ResultArray.map x{_SIZE}')
+def columnar_map():
+    return _array.map(lambda x: x * 2, typecode='d')
+
+
+# vectorized=True requires the optional numpy dependency
+if columnar.np is not None:
+    @case('columnar', f'ResultArray.map(vectorized=True) x{_SIZE}')
+    def columnar_map_vectorized():
+        return _array.map(lambda xs: xs * 2, typecode='d', vectorized=True)
+
+
+@case('columnar', f'ResultArray.unwrap_or x{_SIZE}')
+def columnar_unwrap_or():
+    return _array.unwrap_or(0.0)
+
+
+@case('columnar', f'list[Result].map x{_SIZE}', baseline=True)
+def list_map():
+    return [result.map(lambda x: x * 2) for result in _results]
+
+
+@case('columnar', f'list[Result].unwrap_or x{_SIZE}', baseline=True)
+def list_unwrap_or():
+    return [result.unwrap_or(0.0) for result in _results]
@@ -0,0 +1,115 @@
+from typing import Optional
+from src.rustymonad import Some, Nothing, Ok, Err
+from .harness import case
+
+
+@case('construction', 'Some(x)')
+def construct_some():
+    return Some(1)
+
+
+@case('construction', 'Ok(x)')
+def construct_ok():
+    return Ok(1)
+
+
+@case('construction', 'Err(e)')
+def construct_err():
+    return Err('error')
+
+
+@case('construction', 'Nothing()')
+def construct_nothing():
+    return Nothing()
+
+
+@case('construction', 'tuple (ok, value)', baseline=True)
+def construct_tuple():
+    return (True, 1)
+
+
+def _inc_ok(x: int):
+    return Ok(x + 1)
+
+
+def _double(x: int) -> int:
+    return x * 2
+
+
+def _recover(e: str):
+    return Ok(0)
+
+
+def _inc_some(x: int):
+    return Some(x + 1)
+
+
+def _inc_raising(x: int) -> int:
+    if x < 0:
+        raise ValueError('negative')
+    return x + 1
+
+
+def _inc_optional(x: int) -> Optional[int]:
+    if x < 0:
+        return None
+    return x + 1
+
+
+@case('chaining', 'Ok.and_then.map.or_else')
+def chain_ok():
+    return Ok(1).and_then(_inc_ok).map(_double).or_else(_recover)
+
+
+@case('chaining', 'Err.and_then.map.or_else')
+def chain_err():
+    return Err('error').and_then(_inc_ok).map(_double).or_else(_recover)
+
+
+@case('chaining', 'Some.and_then.map.or_else')
+def chain_some():
+    return Some(1).and_then(_inc_some).map(_double).or_else(lambda: Some(0))
+
+
+@case('chaining', 'try/except', baseline=True)
+def chain_try_except():
+    try:
+        return _double(_inc_raising(1))
+    except ValueError:
+        return 0
+
+
+@case('chaining', 'Optional', baseline=True)
+def chain_optional():
+    value = _inc_optional(1)
+    if value is None:
+        return 0
+    return _double(value)
+
+
+@case('rshift', 'Ok >> f >> g >> h')
+def rshift_ok():
+    return Ok(1) >> _inc_ok >> _inc_ok >> _inc_ok
+
+
+@case('rshift', 'Err >> f >> g >> h')
+def rshift_err():
+    return Err('error') >> _inc_ok >> _inc_ok >> _inc_ok
+
+
+@case('rshift', 'nested calls', baseline=True)
+def rshift_plain():
+    return _inc_raising(_inc_raising(_inc_raising(1)))
+
+
+_DUPLICATES = [Ok(i % 100) if i % 3 else Err(f'error {i % 7}') for i in range(1000)]
+
+
+@case('hashing', 'set(results) 1000 items')
+def dedup_results():
+    return set(_DUPLICATES)
+
+
+@case('hashing', 'set of (ok, value) tuples 1000 items', baseline=True)
+def dedup_tuples():
+    return {(bool(result), result._value) for result in _DUPLICATES}
@@ -0,0 +1,120 @@
+from abc import ABC, abstractmethod
+from functools import wraps
+from types import GeneratorType
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation
+from src.rustymonad.monad import Monad
+from .harness import case
+
+
+# A replica of the previous `ABC` based hierarchy, dispatching on `__bool__`, as the baseline.
+class _AbcResult(Monad, ABC):
+    __slots__ = ()
+
+    @abstractmethod
+    def __bool__(self) -> bool:
+        raise NotImplementedError
+
+
+class _AbcOk(_AbcResult):
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class _AbcErr(_AbcResult):
+    __slots__ = ()
+
+    def flatmap(self, fn):
+        return self
+
+    def __bool__(self) -> bool:
+        return False
+
+
+def _abc_do_notation(func):
+    @wraps(func)
+    def _wrapper(*args, **kwargs):
+        generator = func(*args, **kwargs)
+        if isinstance(generator, GeneratorType):
+            monad = Monad(None)
+            while True:
+                try:
+                    result = monad.flatmap(generator.send)
+                    if not isinstance(result, Monad):
+                        raise TypeError(f'Expected monad type, got {type(result)}')
+                    elif (not result) or (result is monad):
+                        return result
+                    monad = result
+                except StopIteration as e:
+                    return e.value
+        else:
+            raise TypeError('do-notation expected a generator')
+    return _wrapper
+
+
+_OK = Ok(1)
+_ERR = Err('error')
+_ABC_OK = _AbcOk(1)
+_ABC_ERR = _AbcErr('error')
+
+
+@case('dispatch', 'isinstance(Ok, Result)')
+def isinstance_tagged():
+    return isinstance(_OK, Result) and isinstance(_ERR, Result)
+
+
+@case('dispatch', 'isinstance(Ok, Result) ABC', baseline=True)
+def isinstance_abc():
+    return isinstance(_ABC_OK, _AbcResult) and isinstance(_ABC_ERR, _AbcResult)
+
+
+@case('dispatch', 'match Ok/Err')
+def match_tagged():
+    for result in (_OK, _ERR):
+        match result:
+            case Err(e):
+                return e
+            case Ok(v):
+                pass
+
+
+@case('dispatch', 'match Ok/Err ABC', baseline=True)
+def match_abc():
+    for result in (_ABC_OK, _ABC_ERR):
+        match result:
+            case _AbcErr(e):
+                return e
+            case _AbcOk(v):
+                pass
+
+
+@case('dispatch', 'bool check _is_ok')
+def bool_tagged():
+    return _OK._is_ok and not _ERR._is_ok
+
+
+@case('dispatch', 'bool check __bool__ ABC', baseline=True)
+def bool_abc():
+    return bool(_ABC_OK) and not _ABC_ERR
+
+
+def _register_do_blocks(depth: int) -> None:
+    def do_block() -> DoRet[Result[int, str]]:
+        total = 0
+        for i in range(depth):
+            total += yield Ok(i)
+        return Ok(total)
+
+    def abc_do_block():
+        total = 0
+        for i in range(depth):
+            total += yield _AbcOk(i)
+        return _AbcOk(total)
+
+    case('dispatch', f'do_notation depth={depth}')(do_notation(do_block))
+    case('dispatch', f'do_notation depth={depth} ABC', baseline=True)(_abc_do_notation(abc_do_block))
+
+
+for _depth in (1, 10):
+    _register_do_blocks(_depth)
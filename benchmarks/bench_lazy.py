@@ -0,0 +1,81 @@
+from src.rustymonad import Some, Ok
+from .harness import case
+
+
+# the success path, where an eager default or error message is built and thrown away
+_SOME = Some(42)
+_OK = Ok(42)
+_USER_ID = 1234
+_DEFAULTS = {f'key{i}': i for i in range(16)}
+
+
+def _default() -> dict[str, int]:
+    return dict(_DEFAULTS)
+
+
+def _message() -> str:
+    return f'user {_USER_ID} not found in {sorted(_DEFAULTS)[:3]}'
+
+
+def _lookup() -> Ok:
+    return Ok(dict(_DEFAULTS))
+
+
+@case('lazy', 'Some.unwrap_or(default())', baseline=True)
+def unwrap_or_eager():
+    return _SOME.unwrap_or(_default())
+
+
+@case('lazy', 'Some.unwrap_or_else(default)')
+def unwrap_or_lazy():
+    return _SOME.unwrap_or_else(_default)
+
+
+@case('lazy', 'Some.ok_or(message())', baseline=True)
+def ok_or_eager():
+    return _SOME.ok_or(_message())
+
+
+@case('lazy', 'Some.ok_or_else(message)')
+def ok_or_lazy():
+    return _SOME.ok_or_else(_message)
+
+
+@case('lazy', 'Some.map(fn).unwrap_or(default())', baseline=True)
+def map_or_eager():
+    return _SOME.map(str).unwrap_or(_default())
+
+
+@case('lazy', 'Some.map_or_else(default, fn)')
+def map_or_lazy():
+    return _SOME.map_or_else(_default, str)
+
+
+@case('lazy', 'Ok.unwrap_or(default())', baseline=True)
+def result_unwrap_or_eager():
+    return _OK.unwrap_or(_default())
+
+
+@case('lazy', 'Ok.unwrap_or_else(default)')
+def result_unwrap_or_lazy():
+    return _OK.unwrap_or_else(_default)
+
+
+@case('lazy', 'Ok.or_(lookup())', baseline=True)
+def or_eager():
+    return _OK.or_(_lookup())
+
+
+@case('lazy', 'Ok.or_(lookup)')
+def or_lazy():
+    return _OK.or_(_lookup)
+
+
+@case('lazy', 'Ok.expect(message())', baseline=True)
+def expect_eager():
+    return _OK.expect(_message())
+
+
+@case('lazy', 'Ok.expect(message)')
+def expect_lazy():
+    return _OK.expect(_message)
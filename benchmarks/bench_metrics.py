@@ -0,0 +1,44 @@
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation, try_notation
+from src.rustymonad import InMemorySink, enable_metrics, disable_metrics
+from .harness import case
+
+
+class _NullSink(InMemorySink):
+    def increment(self, name, tags, value=1):
+        pass
+
+    def timing(self, name, seconds, tags):
+        pass
+
+
+def _enable() -> None:
+    enable_metrics(_NullSink())
+
+
+def _inc(x: int) -> Result[int, str]:
+    return Ok(x + 1)
+
+
+def _fail(x: int) -> Result[int, str]:
+    return Err('failed')
+
+
+def _and_then() -> Result[int, str]:
+    return Ok(1).and_then(_inc).and_then(_inc).and_then(_fail)
+
+
+@do_notation
+def _do_block() -> DoRet[Result[int, str]]:
+    a = yield _inc(1)
+    b = yield _inc(a)
+    return Ok(b)
+
+
+_parse = try_notation(int)
+
+case('metrics', 'and_then chain, metrics off')(_and_then)
+case('metrics', 'and_then chain, metrics on', setup=_enable, teardown=disable_metrics)(_and_then)
+case('metrics', 'do_notation, metrics off')(_do_block)
+case('metrics', 'do_notation, metrics on', setup=_enable, teardown=disable_metrics)(_do_block)
+case('metrics', 'try_notation, metrics off')(lambda: _parse('1'))
+case('metrics', 'try_notation, metrics on', setup=_enable, teardown=disable_metrics)(lambda: _parse('1'))
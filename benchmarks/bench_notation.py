@@ -0,0 +1,141 @@
+from typing import Optional
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation, try_notation
+from .harness import case
+
+
+def _step(i: int, fail_at: int) -> Result[int, str]:
+    if i == fail_at:
+        return Err(f'failed at {i}')
+    return Ok(i)
+
+
+def _step_raising(i: int, fail_at: int) -> int:
+    if i == fail_at:
+        raise ValueError(f'failed at {i}')
+    return i
+
+
+def _step_optional(i: int, fail_at: int) -> Optional[int]:
+    if i == fail_at:
+        return None
+    return i
+
+
+def _register_do_blocks(depth: int, fail_at: int) -> None:
+    label = f'depth={depth} exit={fail_at if fail_at >= 0 else "none"}'
+
+    def do_block() -> DoRet[Result[int, str]]:
+        total = 0
+        for i in range(depth):
+            total += yield _step(i, fail_at)
+        return Ok(total)
+
+    def try_except_block():
+        total = 0
+        try:
+            for i in range(depth):
+                total += _step_raising(i, fail_at)
+        except ValueError as e:
+            return str(e)
+        return total
+
+    def optional_block():
+        total = 0
+        for i in range(depth):
+            value = _step_optional(i, fail_at)
+            if value is None:
+                return None
+            total += value
+        return total
+
+    case('do_notation', f'do_notation {label}')(do_notation(do_block))
+    case('do_notation', f'do_notation(compile=True) {label}')(do_notation(compile=True)(do_block))
+    case('do_notation', f'try/except {label}', baseline=True)(try_except_block)
+    case('do_notation', f'Optional {label}', baseline=True)(optional_block)
+
+
+for _depth in (1, 5, 10):
+    _register_do_blocks(_depth, -1)
+    _register_do_blocks(_depth, 0)
+    if _depth > 1:
+        _register_do_blocks(_depth, _depth // 2)
+
+
+@try_notation
+def _parse(text: str) -> int:
+    return int(text)
+
+
+_parse_keep = try_notation(keep_exception=True)(int)
+_parse_keep_no_tb = try_notation(keep_exception=True, tb_frames=0)(int)
+
+
+def _parse_plain(text: str) -> int | str:
+    try:
+        return int(text)
+    except Exception as e:
+        return str(e)
+
+
+@case('try_notation', 'try_notation success')
+def try_notation_success():
+    return _parse('42')
+
+
+@case('try_notation', 'try_notation exception')
+def try_notation_exception():
+    return _parse('forty-two')
+
+
+@case('try_notation', 'try_notation(keep_exception=True) exception')
+def try_notation_keep_exception():
+    return _parse_keep('forty-two')
+
+
+@case('try_notation', 'try_notation(keep_exception=True, tb_frames=0) exception')
+def try_notation_keep_exception_no_traceback():
+    return _parse_keep_no_tb('forty-two')
+
+
+@case('try_notation', 'try/except success', baseline=True)
+def try_except_success():
+    return _parse_plain('42')
+
+
+@case('try_notation', 'try/except exception', baseline=True)
+def try_except_exception():
+    return _parse_plain('forty-two')
+
+
+_ok: Result[int, str] = Ok(1)
+_err: Result[int, str] = Err('error')
+
+
+def _match(result: Result[int, str]) -> int:
+    match result:
+        case Ok(v):
+            return v
+        case Err(_):
+            return -1
+    return 0
+
+
+@case('match', 'match Ok(v)')
+def match_ok():
+    return _match(_ok)
+
+
+@case('match', 'match Err(e)')
+def match_err():
+    return _match(_err)
+
+
+_plain_ok = (True, 1)
+
+
+@case('match', 'tuple unpacking', baseline=True)
+def match_tuple():
+    is_ok, value = _plain_ok
+    if is_ok:
+        return value
+    return -1
@@ -0,0 +1,51 @@
+from src.rustymonad import Option, Some, Nothing
+from .harness import case
+
+
+_DOC = {'user': {'addresses': [{'geo': {'city': 'Tokyo'}}]}}
+_DOCS = [_DOC, {'user': {'addresses': []}}, {'user': None}] * 100
+_PATH = Option.path('user.addresses[0].geo.city')
+
+
+def _option(value):
+    return Nothing() if value is None else Some(value)
+
+
+def _and_then(doc):
+    return (Some(doc).and_then(lambda d: _option(d.get('user')))
+            .and_then(lambda u: _option(u.get('addresses')))
+            .and_then(lambda a: _option(a[0] if a else None))
+            .and_then(lambda a: _option(a.get('geo')))
+            .and_then(lambda g: _option(g.get('city'))))
+
+
+def _plain(doc):
+    user = doc.get('user')
+    if not user or not user.get('addresses'):
+        return None
+    return user['addresses'][0].get('geo', {}).get('city')
+
+
+@case('path', "Option.path('user.addresses[0].geo.city')")
+def path_get():
+    return _PATH(_DOC)
+
+
+@case('path', 'Some(doc).and_then chain')
+def and_then_get():
+    return _and_then(_DOC)
+
+
+@case('path', 'dict.get chain', baseline=True)
+def plain_get():
+    return _plain(_DOC)
+
+
+@case('path', 'Path.batch 300 docs')
+def path_batch():
+    return _PATH.batch(_DOCS)
+
+
+@case('path', 'and_then chain 300 docs')
+def and_then_batch():
+    return [_and_then(doc) for doc in _DOCS]
@@ -0,0 +1,39 @@
+from src.rustymonad import Ok, Err, Pipeline
+from .harness import case
+
+
+def _parse(text: str):
+    if text.isdigit():
+        return Ok(int(text))
+    return Err('not a number')
+
+
+def _positive(x: int):
+    return Ok(x) if x > 0 else Err('not positive')
+
+
+def _scale(x: int) -> int:
+    return x * 10
+
+
+def _check(x: int):
+    return Ok(x) if x < 1000 else Err('too large')
+
+
+_pipe = Pipeline(_parse) >> _positive
+_pipe = _pipe.map(_scale) >> _check
+
+
+@case('pipeline', 'Pipeline(f) >> g .map(h) >> k')
+def pipeline_apply():
+    return _pipe('42')
+
+
+@case('pipeline', 'and_then.and_then.map.and_then')
+def pipeline_method_chain():
+    return _parse('42').and_then(_positive).map(_scale).and_then(_check)
+
+
+@case('pipeline', 'plain calls', baseline=True)
+def pipeline_plain():
+    return _scale(int('42'))
@@ -0,0 +1,44 @@
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation, propagate
+from .harness import case
+
+
+def _step(i: int, fail_at: int) -> Result[int, str]:
+    if i == fail_at:
+        return Err(f'failed at {i}')
+    return Ok(i)
+
+
+def _register(depth: int, fail_at: int) -> None:
+    label = f'depth={depth} exit={fail_at if fail_at >= 0 else "none"}'
+
+    @propagate
+    def propagated() -> Result[int, str]:
+        total = 0
+        for i in range(depth):
+            total += _step(i, fail_at).q()
+        return Ok(total)
+
+    def do_block() -> DoRet[Result[int, str]]:
+        total = 0
+        for i in range(depth):
+            total += yield _step(i, fail_at)
+        return Ok(total)
+
+    def early_return() -> Result[int, str]:
+        total = 0
+        for i in range(depth):
+            result = _step(i, fail_at)
+            if not result:
+                return result
+            total += result._value
+        return Ok(total)
+
+    case('propagate', f'@propagate {label}')(propagated)
+    case('propagate', f'do_notation {label}')(do_notation(do_block))
+    case('propagate', f'do_notation(compile=True) {label}')(do_notation(compile=True)(do_block))
+    case('propagate', f'if not result: return {label}', baseline=True)(early_return)
+
+
+for _depth in (1, 5, 10, 20):
+    _register(_depth, -1)
+    _register(_depth, _depth - 1)
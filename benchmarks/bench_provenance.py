@@ -0,0 +1,21 @@
+from src.rustymonad import Err, enable_provenance, disable_provenance, clear_origins
+from .harness import case
+
+
+def _enable(interval: float):
+    return lambda: enable_provenance(interval)
+
+
+def _disable() -> None:
+    disable_provenance()
+    clear_origins()
+
+
+def _construct_err():
+    return Err('failed')
+
+
+case('provenance', 'Err(e), provenance off')(_construct_err)
+# between two samples the plain constructor is installed
+case('provenance', 'Err(e), provenance interval=0.01', setup=_enable(0.01), teardown=_disable)(_construct_err)
+case('provenance', 'Err(e), provenance interval=0', setup=_enable(0.0), teardown=_disable)(_construct_err)
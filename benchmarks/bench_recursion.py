@@ -0,0 +1,62 @@
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation, trampoline, recur
+from .harness import case
+
+
+def _step(n: int) -> Result[int, str]:
+    return Ok(n) if n >= 0 else Err('negative')
+
+
+@trampoline
+def _count_trampoline(n: int, total: int) -> Result[int, str]:
+    if n == 0:
+        return Ok(total)
+    return _step(n).and_then(lambda x: recur(x - 1, total + x))
+
+
+def _count_and_then(n: int, total: int) -> Result[int, str]:
+    if n == 0:
+        return Ok(total)
+    return _step(n).and_then(lambda x: _count_and_then(x - 1, total + x))
+
+
+def _count_block(n: int, total: int) -> DoRet[Result[int, str]]:
+    value = yield _step(n)
+    if value == 0:
+        return Ok(total)
+    return recur(value - 1, total + value)
+
+
+_count_do_trampoline = do_notation(trampoline=True)(_count_block)
+_count_do_compiled = do_notation(compile=True, trampoline=True)(_count_block)
+
+
+@do_notation
+def _count_do(n: int, total: int) -> DoRet[Result[int, str]]:
+    value = yield _step(n)
+    if value == 0:
+        return Ok(total)
+    return _count_do(value - 1, total + value)
+
+
+def _count_loop(n: int) -> int:
+    total = 0
+    while n:
+        total += n
+        n -= 1
+    return total
+
+
+# Per step overhead at a depth the recursive versions still survive, and the trampolines
+# at depths that raise RecursionError without them.
+_SHALLOW = 150
+case('recursion', f'@trampoline depth={_SHALLOW}', number=1000)(lambda: _count_trampoline(_SHALLOW, 0))
+case('recursion', f'do_notation(trampoline=True) depth={_SHALLOW}', number=1000)(lambda: _count_do_trampoline(_SHALLOW, 0))
+case('recursion', f'recursive and_then depth={_SHALLOW}', baseline=True, number=1000)(lambda: _count_and_then(_SHALLOW, 0))
+case('recursion', f'recursive do_notation depth={_SHALLOW}', baseline=True, number=1000)(lambda: _count_do(_SHALLOW, 0))
+
+for _depth in (10 ** 5, 10 ** 6):
+    case('recursion', f'@trampoline depth={_depth}', number=1)(lambda depth=_depth: _count_trampoline(depth, 0))
+    case('recursion', f'do_notation(trampoline=True) depth={_depth}', number=1)(lambda depth=_depth: _count_do_trampoline(depth, 0))
+    case('recursion', f'do_notation(compile=True, trampoline=True) depth={_depth}', number=1)(
+        lambda depth=_depth: _count_do_compiled(depth, 0))
+    case('recursion', f'while loop depth={_depth}', baseline=True, number=1)(lambda depth=_depth: _count_loop(depth))
@@ -0,0 +1,45 @@
+from src.rustymonad import Result, Ok, Err, Validated
+from .harness import case
+
+
+def _check_name(record: dict) -> Result[str, str]:
+    return Ok(record['name']) if record['name'] else Err('name is required')
+
+
+def _check_age(record: dict) -> Result[int, str]:
+    return Ok(record['age']) if 0 <= record['age'] < 150 else Err('age is out of range')
+
+
+def _check_email(record: dict) -> Result[str, str]:
+    return Ok(record['email']) if '@' in record['email'] else Err('email is invalid')
+
+
+_CHECKS = (_check_name, _check_age, _check_email)
+_RECORDS = [{'name': '' if i % 3 == 0 else 'aki', 'age': 200 if i % 2 == 0 else 20, 'email': 'a@b' if i % 5 else 'ab'}
+            for i in range(100)]
+_VALIDATE = Validated(*_CHECKS)
+
+
+@case('validated', 'Validated.batch 100 records')
+def validated_batch():
+    return _VALIDATE.batch(_RECORDS)
+
+
+@case('validated', 'and_then rerun per error 100 records', baseline=True)
+def rerun_per_error():
+    # the first-error-only approach: validate, report, skip the failing check and run the record again
+    invalid = {}
+    for index, record in enumerate(_RECORDS):
+        skipped: set = set()
+        while True:
+            result = Ok(record)
+            for check in _CHECKS:
+                if check not in skipped:
+                    result = result.and_then(lambda r, check=check: check(r).map(lambda _: r))
+                    if not result:
+                        skipped.add(check)
+                        break
+            if result:
+                break
+            invalid.setdefault(index, []).append(result.unwrap_err())
+    return invalid
@@ -0,0 +1,59 @@
+from __future__ import annotations
+import timeit
+import tracemalloc
+from dataclasses import dataclass
+from typing import Callable, Any
+
+
+@dataclass(frozen=True)
+class Case:
+    group: str
+    name: str
+    fn: Callable[[], Any]
+    baseline: bool = False
+    setup: Callable[[], Any] | None = None
+    teardown: Callable[[], Any] | None = None
+    number: int | None = None
+
+
+CASES: list[Case] = []
+
+
+def case(group: str, name: str | None = None, *, baseline: bool = False,
+         setup: Callable[[], Any] | None = None, teardown: Callable[[], Any] | None = None, number: int | None = None):
+    # `setup`/`teardown` run once around the measurements of the case, e.g. to toggle global state.
+    # `number` overrides the calls per timing run for cases that are too slow for the default.
+    def _register(fn: Callable[[], Any]) -> Callable[[], Any]:
+        CASES.append(Case(group, name or fn.__name__, fn, baseline, setup, teardown, number))
+        return fn
+    return _register
+
+
+def measure(case: Case, number: int, repeat: int) -> dict[str, Any]:
+    number = case.number or number
+    if case.setup is not None:
+        case.setup()
+    try:
+        timer = timeit.Timer(case.fn)
+        best = min(timer.repeat(repeat=repeat, number=number))
+
+        tracemalloc.start()
+        try:
+            for _ in range(number):
+                case.fn()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        if case.teardown is not None:
+            case.teardown()
+
+    return {
+        'group': case.group,
+        'name': case.name,
+        'baseline': case.baseline,
+        'ns_per_op': best / number * 1e9,
+        'peak_bytes': peak,
+        'number': number,
+        'repeat': repeat,
+    }
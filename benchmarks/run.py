@@ -0,0 +1,61 @@
+"""
+Execute the command `python -m benchmarks.run` in the root dir of this project to start benchmarking.
+"""
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+from pathlib import Path
+from .harness import CASES, measure
+
+
+def load_cases() -> None:
+    package_dir = Path(__file__).parent
+    for module in pkgutil.iter_modules([str(package_dir)]):
+        if module.name.startswith('bench_'):
+            importlib.import_module(f'{__package__}.{module.name}')
+
+
+def compare(results: list[dict], previous: list[dict]) -> None:
+    before = {(r['group'], r['name']): r['ns_per_op'] for r in previous}
+    for result in results:
+        key = (result['group'], result['name'])
+        if key in before:
+            ratio = result['ns_per_op'] / before[key]
+            print(f'{result["group"]:>24} {result["name"]:<40} {ratio:6.2f}x', file=sys.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='RustyMonad benchmarks')
+    parser.add_argument('-k', '--filter', default='', help='only run cases whose "group.name" contains this string')
+    parser.add_argument('-n', '--number', type=int, default=10000, help='calls per timing run')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='timing runs per case, the best one is reported')
+    parser.add_argument('-o', '--output', help='write the JSON report to this file instead of stdout')
+    parser.add_argument('--compare', help='JSON report of a previous run to compare against')
+    args = parser.parse_args()
+
+    load_cases()
+    results = []
+    for case in CASES:
+        if args.filter in f'{case.group}.{case.name}':
+            results.append(measure(case, args.number, args.repeat))
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'results': results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.compare:
+        compare(results, json.loads(Path(args.compare).read_text())['results'])
+
+
+if __name__ == '__main__':
+    main()
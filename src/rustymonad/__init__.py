@@ -1,7 +1,18 @@
 from .monad import Monad
 from .option import Option, Some, Nothing
 from .result import Result, Ok, Err
-from .utils import DoRet, do_notation, try_notation
+from .columnar import OptionArray, ResultArray
+from .pipeline import Pipeline
+from .stream import ResultStream, OptionStream
+from .validated import Validated, Errors
+from .recursion import trampoline, recur
+from .utils import DoRet, AsyncDoRet, do_notation, async_do_notation, try_notation, propagate, traverse, partition
+from .parallel import par_traverse
+from .cache import memoize_result
+from .resilience import circuit_breaker, retry_result
+from .deadlines import Deadline, DeadlineExceeded, deadline, current_deadline, call_with_deadline, wait_with_deadline
+from .metrics import MetricsSink, InMemorySink, enable_metrics, disable_metrics
+from .provenance import Origin, enable_provenance, disable_provenance, origin_of, top_origins, clear_origins
 
 
 __all__ = [
@@ -12,7 +23,41 @@ __all__ = [
     'Result',
     'Ok',
     'Err',
+    'OptionArray',
+    'ResultArray',
+    'Pipeline',
+    'ResultStream',
+    'OptionStream',
+    'Validated',
+    'Errors',
     'DoRet',
+    'AsyncDoRet',
     'do_notation',
-    'try_notation'
+    'async_do_notation',
+    'try_notation',
+    'propagate',
+    'traverse',
+    'partition',
+    'trampoline',
+    'recur',
+    'par_traverse',
+    'memoize_result',
+    'circuit_breaker',
+    'retry_result',
+    'Deadline',
+    'DeadlineExceeded',
+    'deadline',
+    'current_deadline',
+    'call_with_deadline',
+    'wait_with_deadline',
+    'MetricsSink',
+    'InMemorySink',
+    'enable_metrics',
+    'disable_metrics',
+    'Origin',
+    'enable_provenance',
+    'disable_provenance',
+    'origin_of',
+    'top_origins',
+    'clear_origins'
 ]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from functools import wraps
+from typing import TypeVar, Callable, ParamSpec, NamedTuple, Any, overload
+from .monad import Monad
+
+
+P = ParamSpec('P')
+M = TypeVar('M', bound=Monad)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    shared: int
+    evictions: int
+    currsize: int
+    maxsize: int | None
+
+
+_KWARGS_MARK = object()
+
+
+def _make_key(args: tuple, kwargs: dict[str, Any]) -> tuple:
+    # `Option`/`Result` arguments hash by variant and value, so they are used as they are
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,)
+        for item in kwargs.items():
+            key += item
+    return key
+
+
+@overload
+def memoize_result(func: Callable[P, M]) -> Callable[P, M]: ...
+@overload
+def memoize_result(*, maxsize: int | None = 128, ttl: float | None = None, err_ttl: float | None = None,
+                   clock: Callable[[], float] = time.monotonic) -> Callable[[Callable[P, M]], Callable[P, M]]: ...
+def memoize_result(func=None, *, maxsize=128, ttl=None, err_ttl=None, clock=time.monotonic):
+    # Caches successes for `ttl` seconds (forever when None) in an LRU of `maxsize` entries (unbounded
+    # when None), and failures for `err_ttl` seconds (not at all when None). Concurrent callers asking
+    # for the same key while it is being computed share that one computation.
+    if func is None:
+        return lambda func: memoize_result(func, maxsize=maxsize, ttl=ttl, err_ttl=err_ttl, clock=clock)
+
+    cache: OrderedDict[tuple, tuple[float | None, Monad[Any]]] = OrderedDict()
+    inflight: dict[tuple, Future] = {}
+    lock = threading.Lock()
+    hits = misses = shared = evictions = 0
+
+    @wraps(func)
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        nonlocal hits, misses, shared, evictions
+        key = _make_key(args, kwargs)
+        with lock:
+            entry = cache.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at is None or clock() < expires_at:
+                    cache.move_to_end(key)
+                    hits += 1
+                    return result  # type: ignore
+                del cache[key]
+                evictions += 1
+            future = inflight.get(key)
+            owner = future is None
+            if owner:
+                future = inflight[key] = Future()
+                misses += 1
+            else:
+                shared += 1
+        if not owner:
+            return future.result()
+
+        # whatever fails, the key leaves `inflight` and the waiting callers are released
+        try:
+            result = func(*args, **kwargs)
+            if not isinstance(result, Monad):
+                raise TypeError(f'Expected monad type, got {type(result)}')
+            lifetime = ttl if result._is_ok else err_ttl
+            expires_at = None if lifetime is None else clock() + lifetime
+        except BaseException as e:
+            with lock:
+                del inflight[key]
+            future.set_exception(e)
+            raise
+
+        with lock:
+            del inflight[key]
+            if result._is_ok or err_ttl is not None:
+                cache[key] = (expires_at, result)
+                if maxsize is not None and len(cache) > maxsize:
+                    cache.popitem(last=False)
+                    evictions += 1
+        future.set_result(result)
+        return result
+
+    def cache_info() -> CacheInfo:
+        with lock:
+            return CacheInfo(hits, misses, shared, evictions, len(cache), maxsize)
+
+    def cache_clear() -> None:
+        nonlocal hits, misses, shared, evictions
+        with lock:
+            cache.clear()
+            hits = misses = shared = evictions = 0
+
+    _wrapper.cache_info = cache_info  # type: ignore[attr-defined]
+    _wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return _wrapper
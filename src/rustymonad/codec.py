@@ -0,0 +1,221 @@
+from __future__ import annotations
+import struct
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+from .monad import Monad
+from .option import Some, Nothing
+from .result import Ok, Err
+
+
+# Compact binary encoding of `Option`/`Result` trees with JSON-compatible payloads. Every value is
+# a one byte tag followed by its payload, integers and lengths are LEB128 varints.
+_NOTHING = 0x00
+_SOME = 0x01
+_OK = 0x02
+_ERR = 0x03
+_NONE = 0x10
+_TRUE = 0x11
+_FALSE = 0x12
+_INT = 0x13
+_FLOAT = 0x14
+_STR = 0x15
+_LIST = 0x16
+_DICT = 0x17
+
+_VARIANT_TAGS: dict[type, int] = {Some: _SOME, Ok: _OK, Err: _ERR}
+_VARIANTS: dict[int, type] = {tag: cls for cls, tag in _VARIANT_TAGS.items()}
+_DOUBLE = struct.Struct('<d')
+
+
+def _write_varint(buffer: bytearray, value: int) -> None:
+    while value > 0x7f:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    if offset < len(data) and data[offset] < 0x80:
+        return data[offset], offset + 1
+    value = shift = 0
+    while True:
+        try:
+            byte = data[offset]
+        except IndexError:
+            raise ValueError('truncated data') from None
+        offset += 1
+        value |= (byte & 0x7f) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _write_str(buffer: bytearray, value: str) -> None:
+    encoded = value.encode()
+    _write_varint(buffer, len(encoded))
+    buffer += encoded
+
+
+def _encode(buffer: bytearray, obj: Any) -> None:
+    if (tag := _VARIANT_TAGS.get(type(obj))) is not None:
+        buffer.append(tag)
+        _encode(buffer, obj._value)
+    elif obj is None:
+        buffer.append(_NONE)
+    elif obj is True:
+        buffer.append(_TRUE)
+    elif obj is False:
+        buffer.append(_FALSE)
+    elif isinstance(obj, int):
+        buffer.append(_INT)
+        _write_varint(buffer, obj << 1 if obj >= 0 else (~obj << 1) | 1)  # zigzag
+    elif isinstance(obj, float):
+        buffer.append(_FLOAT)
+        buffer += _DOUBLE.pack(obj)
+    elif isinstance(obj, str):
+        buffer.append(_STR)
+        _write_str(buffer, obj)
+    elif isinstance(obj, Monad):
+        # `Nothing` and subclasses of the variants
+        if isinstance(obj, Nothing):
+            buffer.append(_NOTHING)
+            return
+        for cls, tag in _VARIANT_TAGS.items():
+            if isinstance(obj, cls):
+                buffer.append(tag)
+                _encode(buffer, obj._value)
+                return
+        raise TypeError(f'Cannot encode {type(obj).__name__}')
+    elif isinstance(obj, (list, tuple)):
+        buffer.append(_LIST)
+        _write_varint(buffer, len(obj))
+        for item in obj:
+            _encode(buffer, item)
+    elif isinstance(obj, dict):
+        buffer.append(_DICT)
+        _write_varint(buffer, len(obj))
+        for key, value in obj.items():
+            if not isinstance(key, str):
+                raise TypeError(f'Cannot encode dict key of type {type(key).__name__}')
+            _write_str(buffer, key)
+            _encode(buffer, value)
+    else:
+        raise TypeError(f'Cannot encode {type(obj).__name__}')
+
+
+def _decode(data: bytes, offset: int) -> tuple[Any, int]:
+    if offset >= len(data):
+        raise ValueError('truncated data')
+    decoder = _DECODERS[data[offset]]
+    if decoder is None:
+        raise ValueError(f'Unknown tag 0x{data[offset]:02x}')
+    return decoder(data, offset + 1)
+
+
+def _decode_variant(cls: type) -> Callable[[bytes, int], tuple[Any, int]]:
+    def _decoder(data: bytes, offset: int) -> tuple[Any, int]:
+        value, offset = _decode(data, offset)
+        return cls(value), offset
+    return _decoder
+
+
+def _decode_constant(value: Any) -> Callable[[bytes, int], tuple[Any, int]]:
+    return lambda data, offset: (value, offset)
+
+
+def _decode_int(data: bytes, offset: int) -> tuple[int, int]:
+    value, offset = _read_varint(data, offset)
+    return (value >> 1) ^ -(value & 1), offset
+
+
+def _decode_float(data: bytes, offset: int) -> tuple[float, int]:
+    if offset + 8 > len(data):
+        raise ValueError('truncated data')
+    return _DOUBLE.unpack_from(data, offset)[0], offset + 8
+
+
+def _decode_list(data: bytes, offset: int) -> tuple[list[Any], int]:
+    length, offset = _read_varint(data, offset)
+    items = []
+    for _ in range(length):
+        item, offset = _decode(data, offset)
+        items.append(item)
+    return items, offset
+
+
+def _decode_dict(data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+    length, offset = _read_varint(data, offset)
+    mapping = {}
+    for _ in range(length):
+        key, offset = _read_str(data, offset)
+        mapping[key], offset = _decode(data, offset)
+    return mapping, offset
+
+
+def _read_str(data: bytes, offset: int) -> tuple[str, int]:
+    length, offset = _read_varint(data, offset)
+    if offset + length > len(data):
+        raise ValueError('truncated data')
+    return data[offset:offset + length].decode(), offset + length
+
+
+_DECODERS: list[Any] = [None] * 256
+_DECODERS[_NOTHING] = _decode_constant(Nothing())
+_DECODERS[_NONE] = _decode_constant(None)
+_DECODERS[_TRUE] = _decode_constant(True)
+_DECODERS[_FALSE] = _decode_constant(False)
+_DECODERS[_INT] = _decode_int
+_DECODERS[_FLOAT] = _decode_float
+_DECODERS[_STR] = _read_str
+_DECODERS[_LIST] = _decode_list
+_DECODERS[_DICT] = _decode_dict
+for _tag, _cls in _VARIANTS.items():
+    _DECODERS[_tag] = _decode_variant(_cls)
+
+
+def dumps(obj: Any) -> bytes:
+    buffer = bytearray()
+    _encode(buffer, obj)
+    return bytes(buffer)
+
+
+def loads(data: bytes) -> Any:
+    obj, offset = _decode(bytes(data), 0)
+    if offset != len(data):
+        raise ValueError('trailing data')
+    return obj
+
+
+def iter_dumps(objs: Iterable[Any]) -> Iterator[bytes]:
+    # one length-prefixed frame per object, so that frames can be written to a stream as they come
+    for obj in objs:
+        buffer = bytearray()
+        _encode(buffer, obj)
+        frame = bytearray()
+        _write_varint(frame, len(buffer))
+        frame += buffer
+        yield bytes(frame)
+
+
+def dump_iter(objs: Iterable[Any], fp: BinaryIO) -> None:
+    for frame in iter_dumps(objs):
+        fp.write(frame)
+
+
+def load_iter(fp: BinaryIO) -> Iterator[Any]:
+    # decodes the frames written by `dump_iter` one at a time
+    while True:
+        length = shift = 0
+        while True:
+            byte = fp.read(1)
+            if not byte:
+                if shift:
+                    raise ValueError('truncated data')
+                return
+            length |= (byte[0] & 0x7f) << shift
+            if byte[0] < 0x80:
+                break
+            shift += 7
+        payload = fp.read(length)
+        if len(payload) != length:
+            raise ValueError('truncated data')
+        yield loads(payload)
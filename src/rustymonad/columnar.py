@@ -0,0 +1,254 @@
+from __future__ import annotations
+from array import array
+from operator import index as _index
+from typing import TypeVar, Generic, Callable, Iterable, Iterator, Any, overload
+from .option import Option, Some, Nothing
+from .result import Result, Ok, Err
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+T = TypeVar('T')
+U = TypeVar('U')
+E = TypeVar('E')
+
+
+def _new_values(values: list, typecode: str | None) -> Any:
+    # numeric columns are stored in a contiguous buffer, anything else in a plain list
+    if typecode is None:
+        return values
+    if np is not None:
+        return np.array(values, dtype=typecode)
+    return array(typecode, values)
+
+
+def _new_mask(flags: list[bool], typecode: str | None) -> Any:
+    if np is not None and typecode is not None:
+        return np.array(flags, dtype=bool)
+    return bytearray(flags)
+
+
+def _placeholder(typecode: str | None) -> Any:
+    return None if typecode is None else 0
+
+
+def _is_vectorizable(values: Any) -> bool:
+    return np is not None and isinstance(values, np.ndarray)
+
+
+def _require_vectorizable(values: Any) -> None:
+    # a function written for arrays must not silently receive the values one by one
+    if np is None:
+        raise ImportError('vectorized=True requires numpy')
+    if not isinstance(values, np.ndarray):
+        raise TypeError('vectorized=True requires a numeric column, created with a typecode')
+
+
+class _Columnar(Generic[T]):
+    __slots__ = ('_values', '_mask', '_typecode')
+
+    def __init__(self, values: Any, mask: Any, typecode: str | None) -> None:
+        self._values = values
+        self._mask = mask
+        self._typecode = typecode
+
+    @property
+    def typecode(self) -> str | None:
+        return self._typecode
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def _valid_indices(self) -> Iterator[int]:
+        mask = self._mask
+        return (i for i in range(len(mask)) if mask[i])
+
+    def _map_values(self, fn: Callable[[T], U], typecode: str | None, vectorized: bool) -> tuple[Any, Any, str | None]:
+        if vectorized:
+            _require_vectorizable(self._values)
+            selected = np.asarray(fn(self._values[self._mask]))
+            values = np.zeros(len(self), dtype=selected.dtype)
+            values[self._mask] = selected
+            return values, self._mask.copy(), selected.dtype.char
+        placeholder = _placeholder(typecode)
+        values = [fn(value) if valid else placeholder for value, valid in zip(self._values, self._mask)]
+        return _new_values(values, typecode), _new_mask(list(map(bool, self._mask)), typecode), typecode
+
+    def _filter_mask(self, fn: Callable[[T], bool], vectorized: bool) -> Any:
+        if vectorized:
+            _require_vectorizable(self._values)
+            mask = self._mask.copy()
+            mask[mask] = np.asarray(fn(self._values[mask]), dtype=bool)
+            return mask
+        mask = bytearray(self._mask) if isinstance(self._mask, bytearray) else self._mask.copy()
+        for i in self._valid_indices():
+            if not fn(self._values[i]):
+                mask[i] = False
+        return mask
+
+    def _unwrap_or(self, default: T) -> Any:
+        if _is_vectorizable(self._values):
+            return np.where(self._mask, self._values, default)
+        values = [value if valid else default for value, valid in zip(self._values, self._mask)]
+        if self._typecode is not None:
+            return _new_values(values, self._typecode)
+        return values
+
+    def _valid_values(self) -> Any:
+        if _is_vectorizable(self._values):
+            return self._values[self._mask]
+        values = [value for value, valid in zip(self._values, self._mask) if valid]
+        return _new_values(values, self._typecode)
+
+
+class OptionArray(_Columnar[T]):
+    __slots__ = ()
+
+    @classmethod
+    def from_options(cls, options: Iterable[Option[T]], typecode: str | None = None) -> OptionArray[T]:
+        values: list[Any] = []
+        flags: list[bool] = []
+        placeholder = _placeholder(typecode)
+        for option in options:
+            flags.append(option._is_ok)
+            values.append(option._value if option._is_ok else placeholder)
+        return cls(_new_values(values, typecode), _new_mask(flags, typecode), typecode)
+
+    @classmethod
+    def from_values(cls, values: Iterable[T | None], typecode: str | None = None) -> OptionArray[T]:
+        # `None` marks a missing value
+        values = list(values)
+        flags = [value is not None for value in values]
+        placeholder = _placeholder(typecode)
+        values = [placeholder if value is None else value for value in values]
+        return cls(_new_values(values, typecode), _new_mask(flags, typecode), typecode)
+
+    @overload
+    def __getitem__(self, index: int) -> Option[T]: ...
+    @overload
+    def __getitem__(self, index: slice) -> OptionArray[T]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return OptionArray(self._values[index], self._mask[index], self._typecode)
+        # anything else than an int, e.g. a numpy mask, would select several rows
+        index = _index(index)
+        if self._mask[index]:
+            return Some(self._values[index])
+        return Nothing()
+
+    def __iter__(self) -> Iterator[Option[T]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def map(self, fn: Callable[[T], U], typecode: str | None = None, vectorized: bool = False) -> OptionArray[U]:
+        return OptionArray(*self._map_values(fn, typecode, vectorized))
+
+    def and_then(self, fn: Callable[[T], Option[U]], typecode: str | None = None) -> OptionArray[U]:
+        placeholder = _placeholder(typecode)
+        values = [placeholder] * len(self)
+        flags = [False] * len(self)
+        for i in self._valid_indices():
+            if (option := fn(self._values[i]))._is_ok:
+                values[i] = option._value
+                flags[i] = True
+        return OptionArray(_new_values(values, typecode), _new_mask(flags, typecode), typecode)
+
+    def filter(self, fn: Callable[[T], bool], vectorized: bool = False) -> OptionArray[T]:
+        return OptionArray(self._values, self._filter_mask(fn, vectorized), self._typecode)
+
+    def unwrap_or(self, default: T) -> Any:
+        return self._unwrap_or(default)
+
+    def partition(self) -> tuple[Any, list[int]]:
+        # (the present values, the indices of the missing ones)
+        mask = self._mask
+        return self._valid_values(), [i for i in range(len(mask)) if not mask[i]]
+
+    def __repr__(self) -> str:
+        return f'OptionArray({list(self)!r})'
+
+
+class ResultArray(_Columnar[T], Generic[T, E]):
+    __slots__ = ('_errors',)
+
+    def __init__(self, values: Any, mask: Any, typecode: str | None, errors: dict[int, E]) -> None:
+        super().__init__(values, mask, typecode)
+        self._errors = errors
+
+    @classmethod
+    def from_results(cls, results: Iterable[Result[T, E]], typecode: str | None = None) -> ResultArray[T, E]:
+        values: list[Any] = []
+        flags: list[bool] = []
+        errors: dict[int, E] = {}
+        placeholder = _placeholder(typecode)
+        for i, result in enumerate(results):
+            if result._is_ok:
+                values.append(result._value)
+                flags.append(True)
+            else:
+                values.append(placeholder)
+                flags.append(False)
+                errors[i] = result._value
+        return cls(_new_values(values, typecode), _new_mask(flags, typecode), typecode, errors)
+
+    @overload
+    def __getitem__(self, index: int) -> Result[T, E]: ...
+    @overload
+    def __getitem__(self, index: slice) -> ResultArray[T, E]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            # the errors are keyed by row, so they are renumbered for the slice
+            errors = self._errors
+            rows = range(len(self))[index]
+            sliced = {i: errors[row] for i, row in enumerate(rows) if row in errors}
+            return ResultArray(self._values[index], self._mask[index], self._typecode, sliced)
+        index = _index(index)
+        if self._mask[index]:
+            return Ok(self._values[index])
+        return Err(self._errors[range(len(self))[index]])
+
+    def __iter__(self) -> Iterator[Result[T, E]]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def map(self, fn: Callable[[T], U], typecode: str | None = None, vectorized: bool = False) -> ResultArray[U, E]:
+        return ResultArray(*self._map_values(fn, typecode, vectorized), self._errors)
+
+    def map_err(self, fn: Callable[[E], U]) -> ResultArray[T, U]:
+        errors = {i: fn(error) for i, error in self._errors.items()}
+        return ResultArray(self._values, self._mask, self._typecode, errors)
+
+    def and_then(self, fn: Callable[[T], Result[U, E]], typecode: str | None = None) -> ResultArray[U, E]:
+        placeholder = _placeholder(typecode)
+        values = [placeholder] * len(self)
+        flags = [False] * len(self)
+        errors = dict(self._errors)
+        for i in self._valid_indices():
+            if (result := fn(self._values[i]))._is_ok:
+                values[i] = result._value
+                flags[i] = True
+            else:
+                errors[i] = result._value
+        return ResultArray(_new_values(values, typecode), _new_mask(flags, typecode), typecode, errors)
+
+    def filter(self, fn: Callable[[T], bool], error: E, vectorized: bool = False) -> ResultArray[T, E]:
+        # Ok values rejected by `fn` become `Err(error)`
+        mask = self._filter_mask(fn, vectorized)
+        errors = dict(self._errors)
+        for i in range(len(mask)):
+            if not mask[i] and i not in errors:
+                errors[i] = error
+        return ResultArray(self._values, mask, self._typecode, errors)
+
+    def unwrap_or(self, default: T) -> Any:
+        return self._unwrap_or(default)
+
+    def partition(self) -> tuple[Any, dict[int, E]]:
+        # (the Ok values, the sparse error column keyed by index)
+        return self._valid_values(), dict(self._errors)
+
+    def __repr__(self) -> str:
+        return f'ResultArray({list(self)!r})'
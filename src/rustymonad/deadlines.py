@@ -0,0 +1,112 @@
+from __future__ import annotations
+import asyncio
+import threading
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from contextvars import ContextVar, copy_context
+from typing import TypeVar, Callable, Awaitable, ParamSpec, NamedTuple, Any
+from .monad import Monad
+from .result import Err
+
+
+P = ParamSpec('P')
+M = TypeVar('M', bound=Monad)
+
+
+class DeadlineExceeded(NamedTuple):
+    # the error of the `Err` returned once the budget is spent
+    budget: float
+
+
+class Deadline:
+    # An absolute expiry time on `clock`, made current by `with`. A nested deadline can shorten the
+    # one it is entered in but never extend it. Each instance can only be entered once at a time.
+    __slots__ = ('budget', 'clock', 'expires_at', '_token')
+
+    def __init__(self, budget: float, clock: Callable[[], float]) -> None:
+        self.budget = budget
+        self.clock = clock
+        self.expires_at = float('inf')
+        self._token: Any = None
+
+    def __enter__(self) -> Deadline:
+        outer = _current.get()
+        budget = self.budget if outer is None else min(self.budget, outer.remaining())
+        self.expires_at = self.clock() + budget
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _current.reset(self._token)
+        self._token = None
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - self.clock())
+
+    def expired(self) -> bool:
+        return self.clock() >= self.expires_at
+
+    def exceeded(self) -> Err[DeadlineExceeded]:
+        return Err(DeadlineExceeded(self.budget))
+
+    def __repr__(self) -> str:
+        return f'Deadline({self.budget!r})'
+
+
+# Read by the do-notation drivers before every bind, None outside of `with deadline(...)`.
+_current: ContextVar[Deadline | None] = ContextVar('rustymonad_deadline', default=None)
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def deadline(seconds: float, *, clock: Callable[[], float] = time.monotonic) -> Deadline:
+    # `with deadline(0.25):` bounds the do-blocks and the `call_with_deadline`/`wait_with_deadline`
+    # calls made inside it, including the ones in nested functions
+    if seconds < 0:
+        raise ValueError('seconds must not be negative')
+    return Deadline(seconds, clock)
+
+
+def current_deadline() -> Deadline | None:
+    return _current.get()
+
+
+def _default_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix='rustymonad-deadline')
+        return _executor
+
+
+def call_with_deadline(func: Callable[P, M], *args: P.args, executor: Executor | None = None, **kwargs: P.kwargs) -> M:
+    # Runs `func` in a thread pool and waits for the remaining budget at most. The call isn't
+    # interrupted when the deadline passes, its result is just not waited for. Without a current
+    # deadline `func` is called directly.
+    limit = _current.get()
+    if limit is None:
+        return func(*args, **kwargs)
+    if limit.expired():
+        return limit.exceeded()  # type: ignore[return-value]
+    # the worker sees the same deadline, so that nested calls are bounded too
+    future = (executor or _default_executor()).submit(copy_context().run, func, *args, **kwargs)
+    try:
+        return future.result(timeout=limit.remaining())
+    except FutureTimeoutError:
+        future.cancel()
+        return limit.exceeded()  # type: ignore[return-value]
+
+
+async def wait_with_deadline(awaitable: Awaitable[M]) -> M:
+    # `asyncio.wait_for` with the remaining budget, the awaitable is cancelled when the deadline passes
+    limit = _current.get()
+    if limit is None:
+        return await awaitable
+    if limit.expired():
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        return limit.exceeded()  # type: ignore[return-value]
+    try:
+        return await asyncio.wait_for(awaitable, limit.remaining())
+    except asyncio.TimeoutError:
+        return limit.exceeded()  # type: ignore[return-value]
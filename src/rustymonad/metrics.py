@@ -0,0 +1,97 @@
+from __future__ import annotations
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from typing import Any, Mapping
+from .monad import _add_hook, _remove_hook
+from .option import Nothing
+from .result import Err
+
+
+class MetricsSink(ABC):
+    @abstractmethod
+    def increment(self, name: str, tags: Mapping[str, Any], value: int = 1) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def timing(self, name: str, seconds: float, tags: Mapping[str, Any]) -> None:
+        raise NotImplementedError
+
+
+class InMemorySink(MetricsSink):
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: Counter[tuple[str, frozenset]] = Counter()
+        self._timings: defaultdict[tuple[str, frozenset], list[float]] = defaultdict(list)
+
+    def increment(self, name: str, tags: Mapping[str, Any], value: int = 1) -> None:
+        with self._lock:
+            self._counters[name, frozenset(tags.items())] += value
+
+    def timing(self, name: str, seconds: float, tags: Mapping[str, Any]) -> None:
+        with self._lock:
+            self._timings[name, frozenset(tags.items())].append(seconds)
+
+    def count(self, name: str, **tags: Any) -> int:
+        # sums the counters of `name` whose tags include `tags`
+        with self._lock:
+            return sum(value for (key, key_tags), value in self._counters.items()
+                       if key == name and key_tags >= tags.items())
+
+    def timings(self, name: str, **tags: Any) -> list[float]:
+        with self._lock:
+            return [seconds for (key, key_tags), values in self._timings.items()
+                    if key == name and key_tags >= tags.items() for seconds in values]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._timings.clear()
+
+
+# Read by `do_notation`/`try_notation` on every call, None while metrics are disabled.
+_sink: MetricsSink | None = None
+_PACKAGE_DIR = os.path.dirname(__file__)
+_lock = threading.Lock()
+
+
+def _call_site(depth: int) -> dict[str, str]:
+    # the first frame outside of this package
+    frame = sys._getframe(depth)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    code = frame.f_code
+    return {'site': f'{code.co_filename}:{frame.f_lineno}', 'function': code.co_name}
+
+
+def _count_err(err: Err[Any]) -> None:
+    if (sink := _sink) is not None:
+        sink.increment('err.created', _call_site(3))
+
+
+def _count_nothing(nothing: Nothing) -> None:
+    if (sink := _sink) is not None:
+        sink.increment('nothing.created', _call_site(3))
+
+
+def enable_metrics(sink: MetricsSink) -> None:
+    # Creation counting hooks the constructors of `Err`/`Nothing`, so it costs nothing while disabled.
+    global _sink
+    with _lock:
+        _sink = sink
+        _add_hook(Err, 'metrics', _count_err)
+        _add_hook(Nothing, 'metrics', _count_nothing)
+
+
+def disable_metrics() -> None:
+    global _sink
+    with _lock:
+        _remove_hook(Err, 'metrics')
+        _remove_hook(Nothing, 'metrics')
+        _sink = None
+
+
+def get_sink() -> MetricsSink | None:
+    return _sink
@@ -1,5 +1,8 @@
 from __future__ import annotations
-from typing import TypeVar, Generic, Callable
+import inspect
+import threading
+from functools import lru_cache
+from typing import TypeVar, Generic, Callable, Iterable, Any
 
 
 T = TypeVar('T')
@@ -7,10 +10,22 @@ U = TypeVar('U')
 
 
 class Monad(Generic[T]):
+    # Immutable, `__setattr__` rejects assignments and the slots are written through their descriptors.
+    # `_hash` caches the hash once computed, it is keyed by `_variant` so that e.g. `Ok(1)` and `Err(1)` differ.
+    __slots__ = ('_value', '_hash')
     __match_args__ = ('_value',)
+    # False on the failure variants, read by internal dispatch instead of `bool(monad)`
+    _is_ok = True
+    _variant = 'Monad'
 
     def __init__(self, value: T) -> None:
-        self._value = value
+        _set_value(self, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f'{type(self).__name__} is immutable')
 
     def unwrap(self) -> T:
         return self._value
@@ -25,12 +40,109 @@ class Monad(Generic[T]):
         return True
 
     def __eq__(self, other: object) -> bool:
-        if isinstance(other, Monad):
+        if isinstance(other, Monad) and other._variant == self._variant:
             return self._value == other._value
         return False
 
+    def __hash__(self) -> int:
+        # an unhashable payload raises TypeError, like a tuple holding it would
+        try:
+            return self._hash
+        except AttributeError:
+            _set_hash(self, value := hash((self._variant, self._value)))
+            return value
+
     def __rshift__(self, fn: Callable[[T], Monad[U]]):
         return fn(self._value)
 
     def __repr__(self) -> str:
         return f'Monad({self._value!r})'
+
+    def __reduce__(self) -> tuple[type[Monad[T]], tuple[T]]:
+        # pickled as the variant plus its payload, without the generic slot state
+        return type(self), (self._value,)
+
+
+class _Propagate(BaseException):
+    # Raised by `.q()` on a failure and caught by `@propagate`, a BaseException so that `except Exception`
+    # in between doesn't swallow it.
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return f'`.q()` on {self.args[0]!r} outside of a `@propagate` function'
+
+
+def _force(value: T | Callable[[], T]) -> T:
+    # the lazy arguments (`expect` messages, `and_`/`or_` alternatives) are built only once they are needed
+    return value() if callable(value) else value
+
+
+_set_value = Monad._value.__set__  # type: ignore[attr-defined]
+_set_hash = Monad._hash.__set__  # type: ignore[attr-defined]
+
+# The constructor hooks of the failure variants, keyed by the feature that added them. Metrics and
+# provenance both register here, so that either can be enabled and disabled in any order; the plain
+# `__init__` is put back once the last hook of a class is removed.
+_hooks: dict[type, dict[str, Callable[[Any], None]]] = {}
+_plain_inits: dict[type, Any] = {}
+_hooks_lock = threading.Lock()
+
+
+def _add_hook(cls: type, name: str, callback: Callable[[Any], None]) -> None:
+    # `callback(instance)` runs after every construction, one frame below the constructing one
+    with _hooks_lock:
+        if cls not in _hooks:
+            _hooks[cls] = {}
+            _plain_inits[cls] = cls.__dict__['__init__']
+        _hooks[cls][name] = callback
+        _install_hooks(cls)
+
+
+def _remove_hook(cls: type, name: str) -> None:
+    with _hooks_lock:
+        if name in _hooks.get(cls, ()):
+            del _hooks[cls][name]
+            _install_hooks(cls)
+
+
+def _install_hooks(cls: type) -> None:
+    init = _plain_inits[cls]
+    if not _hooks[cls]:
+        type.__setattr__(cls, '__init__', init)
+        del _hooks[cls], _plain_inits[cls]
+        return
+    type.__setattr__(cls, '__init__', _generate_init(init, tuple(_hooks[cls].values())))
+
+
+@lru_cache(maxsize=32)
+def _generate_init(init: Any, callbacks: tuple[Callable[[Any], None], ...]) -> Any:
+    # The constructor with the callbacks inlined. It takes the same parameters as the plain one, packing
+    # `*args` would double the cost of a construction. Cached, as provenance installs and removes its
+    # hook for every sample.
+    code = init.__code__
+    if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS) or code.co_kwonlyargcount or init.__defaults__:
+        params = arguments = 'self, *args, **kwargs'
+    else:
+        params = arguments = ', '.join(code.co_varnames[:code.co_argcount])
+    lines = [f'def __init__({params}):', f'    _init({arguments})']
+    lines += [f'    _callback_{i}(self)' for i in range(len(callbacks))]
+    namespace: dict[str, Any] = {'_init': init}
+    namespace.update((f'_callback_{i}', callback) for i, callback in enumerate(callbacks))
+    exec('\n'.join(lines), namespace)
+    return namespace['__init__']
+
+
+def _collect(iterable: Iterable[Monad[T]], into: Callable[[Iterable[T]], U]) -> tuple[U, Monad[Any] | None]:
+    # Feeds the values of the leading successes into `into` and stops pulling items at the first failure,
+    # which is returned alongside so the caller can short-circuit.
+    failure = None
+
+    def _values():
+        nonlocal failure
+        for item in iterable:
+            if not item._is_ok:
+                failure = item
+                return
+            yield item._value
+
+    return into(_values()), failure
@@ -1,86 +1,114 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import TypeVar, Callable, Any
-from .monad import Monad
+from typing import TypeVar, Callable, Iterable, Any
+from .monad import Monad, _Propagate, _collect, _force, _set_value
 
 
 T = TypeVar('T')
 U = TypeVar('U')
 E = TypeVar('E')
+C = TypeVar('C')
 
 
-class Option(Monad[T], ABC):
-    @abstractmethod
-    def expect(self, msg: str) -> T:
+class Option(Monad[T]):
+    # A plain class rather than an ABC, so that `isinstance` and `match` take the fast path of `type`.
+    # Variants are told apart by the class-level `_is_ok` tag instead of calling `__bool__`.
+    __slots__ = ()
+
+    def __init__(self, value: Any) -> None:
+        raise TypeError(f'{type(self).__name__} cannot be instantiated directly, use `Some(value)` or `Nothing()`')
+
+    def expect(self, msg: str | Callable[[], str]) -> T:
         raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T:
         raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         raise NotImplementedError
 
-    @abstractmethod
+    def unwrap_or_else(self, fn: Callable[[], T]) -> T:
+        raise NotImplementedError
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        raise NotImplementedError
+
+    def map_or_else(self, default: Callable[[], U], fn: Callable[[T], U]) -> U:
+        raise NotImplementedError
+
+    def and_(self, other: Option[U] | Callable[[], Option[U]]) -> Option[U]:
+        raise NotImplementedError
+
+    def or_(self, other: Option[T] | Callable[[], Option[T]]) -> Option[T]:
+        raise NotImplementedError
+
     def and_then(self, fn: Callable[[T], Option[U]]) -> Option[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def or_else(self, fn: Callable[[], Option[U]]) -> Option[U]:
         raise NotImplementedError
     
-    @abstractmethod
     def inspect(self, fn: Callable[[T], None]) -> Option[T]:
         raise NotImplementedError
     
-    @abstractmethod
     def is_some_and(self, fn: Callable[[T], bool]) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def ok_or(self, err: E) -> Result[T, E]:
         raise NotImplementedError
+
+    def ok_or_else(self, fn: Callable[[], E]) -> Result[T, E]:
+        raise NotImplementedError
     
-    @abstractmethod
     def filter(self, fn: Callable[[T], bool]) -> Option[T]:
         raise NotImplementedError
 
-    @abstractmethod
     def map(self, fn: Callable[[T], U]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def flatmap(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def is_some(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def is_nothing(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
+    def q(self) -> T:
+        # like Rust's `?`, the value of `Some`, or `Nothing` returned by the enclosing `@propagate` function
+        raise NotImplementedError
+
     def __bool__(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def __repr__(self) -> str:
         raise NotImplementedError
 
+    @staticmethod
+    def path(expr: str) -> Path:
+        # `Option.path('a.b[0].c')(doc)` is `Some(doc['a']['b'][0]['c'])`, or `Nothing` when any step is missing
+        return _compile_path(expr)
+
+    @staticmethod
+    def collect(options: Iterable[Option[T]], into: Callable[[Iterable[T]], C] = list) -> Option[C]:
+        collected, failure = _collect(options, into)
+        return Some(collected) if failure is None else failure
+
 
 class Some(Option[T]):
-    def expect(self, msg: str) -> T:
+    __slots__ = ()
+    _variant = 'Some'
+
+    def __init__(self, value: T) -> None:
+        _set_value(self, value)
+
+    def expect(self, msg: str | Callable[[], str]) -> T:
         return self._value
 
     def unwrap(self) -> T:
@@ -89,6 +117,21 @@ class Some(Option[T]):
     def unwrap_or(self, default: T) -> T:
         return self._value
 
+    def unwrap_or_else(self, fn: Callable[[], T]) -> T:
+        return self._value
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        return fn(self._value)
+
+    def map_or_else(self, default: Callable[[], U], fn: Callable[[T], U]) -> U:
+        return fn(self._value)
+
+    def and_(self, other: Option[U] | Callable[[], Option[U]]) -> Option[U]:
+        return _force(other)
+
+    def or_(self, other: Option[T] | Callable[[], Option[T]]) -> Option[T]:
+        return self
+
     def and_then(self, fn: Callable[[T], Option[U]]) -> Option[U]:
         if isinstance(value := fn(self._value), Option):
             return value
@@ -107,6 +150,9 @@ class Some(Option[T]):
     
     def ok_or(self, err: E) -> Result[T, E]:
         return Ok(self._value)
+
+    def ok_or_else(self, fn: Callable[[], E]) -> Result[T, E]:
+        return Ok(self._value)
     
     def filter(self, fn: Callable[[T], bool]) -> Option[T]:
         if fn(self._value):
@@ -125,6 +171,9 @@ class Some(Option[T]):
     def is_nothing(self) -> bool:
         return False
 
+    def q(self) -> T:
+        return self._value
+
     def __bool__(self) -> bool:
         return True
 
@@ -133,6 +182,8 @@ class Some(Option[T]):
             return self._value == other._value
         return False
 
+    __hash__ = Monad.__hash__
+
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         return fn(self._value)
 
@@ -141,18 +192,24 @@ class Some(Option[T]):
 
 
 class Nothing(Option[Any]):
-    __instance: Nothing | None = None
+    # The singleton is created once when the module is imported, so `Nothing()` is a plain read
+    # that needs no lock, with or without the GIL.
+    __slots__ = ()
+    _is_ok = False
+    _variant = 'Nothing'
 
     def __new__(cls) -> Nothing:
-        if cls.__instance is None:
-            cls.__instance = super().__new__(cls)
-        return cls.__instance
+        return _NOTHING
     
     def __init__(self) -> None:
-        super().__init__(Ellipsis)
+        pass
+
+    def __reduce__(self) -> tuple[type[Nothing], tuple[()]]:
+        # unpickles through `Nothing()`, which keeps the singleton across process boundaries
+        return Nothing, ()
 
-    def expect(self, msg: str):
-        raise Exception(msg)
+    def expect(self, msg: str | Callable[[], str]):
+        raise Exception(_force(msg))
 
     def unwrap(self):
         raise Exception('called `Option::unwrap()` on a `Nothing` value')
@@ -160,6 +217,21 @@ class Nothing(Option[Any]):
     def unwrap_or(self, default: T) -> T:
         return default
 
+    def unwrap_or_else(self, fn: Callable[[], T]) -> T:
+        return fn()
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else(self, default: Callable[[], U], fn: Callable[[T], U]) -> U:
+        return default()
+
+    def and_(self, other: Option[U] | Callable[[], Option[U]]) -> Option[Any]:
+        return self
+
+    def or_(self, other: Option[T] | Callable[[], Option[T]]) -> Option[T]:
+        return _force(other)
+
     def and_then(self, fn: Callable[[Any], Option[U]]) -> Option[Any]:
         return self
 
@@ -175,6 +247,9 @@ class Nothing(Option[Any]):
     def ok_or(self, err: E) -> Result[T, E]:
         return Err(err)
 
+    def ok_or_else(self, fn: Callable[[], E]) -> Result[T, E]:
+        return Err(fn())
+
     def filter(self, fn: Callable[[T], bool]) -> Option[T]:
         return self
 
@@ -189,6 +264,9 @@ class Nothing(Option[Any]):
 
     def is_nothing(self) -> bool:
         return True
+
+    def q(self):
+        raise _Propagate(self)
     
     def __bool__(self) -> bool:
         return False
@@ -198,6 +276,8 @@ class Nothing(Option[Any]):
             return True
         return False
 
+    __hash__ = Monad.__hash__
+
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[Any]:
         return self
 
@@ -205,7 +285,9 @@ class Nothing(Option[Any]):
         return 'Option::Nothing'
 
 
-Nothing()
+_NOTHING = object.__new__(Nothing)
+_set_value(_NOTHING, Ellipsis)
 
 
 from .result import Result, Ok, Err
+from .path import Path, _compile as _compile_path
@@ -0,0 +1,88 @@
+from __future__ import annotations
+import os
+from concurrent.futures import Executor, Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from itertools import islice
+from typing import TypeVar, Callable, Iterable, Any, overload, Literal
+from .monad import Monad
+from .option import Some
+from .result import Ok
+from .utils import traverse, partition
+
+
+T = TypeVar('T')
+
+
+def _apply_chunk(fn: Callable[[T], Monad[Any]], chunk: list[T], fail_fast: bool) -> list[Monad[Any]]:
+    # runs inside the worker, module level so that it can be pickled for process pools
+    results = []
+    for item in chunk:
+        result = fn(item)
+        results.append(result)
+        if fail_fast and not result._is_ok:
+            break
+    return results
+
+
+def _chunks(items: Iterable[T], chunksize: int) -> Iterable[list[T]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def _identity(result: Monad[Any]) -> Monad[Any]:
+    return result
+
+
+@overload
+def par_traverse(fn: Callable[[T], Monad[Any]], items: Iterable[T], executor: Executor | None = None, *,
+                 chunksize: int = 1, ordered: bool = True, fail_fast: Literal[True] = True,
+                 unit: type[Ok] | type[Some] = Ok, window: int | None = None) -> Monad[list[Any]]: ...
+@overload
+def par_traverse(fn: Callable[[T], Monad[Any]], items: Iterable[T], executor: Executor | None = None, *,
+                 chunksize: int = 1, ordered: bool = True, fail_fast: Literal[False],
+                 unit: type[Ok] | type[Some] = Ok, window: int | None = None) -> tuple[list[Any], list[Any]]: ...
+def par_traverse(fn, items, executor=None, *, chunksize=1, ordered=True, fail_fast=True, unit=Ok, window=None):
+    # `fn` must return a `Result`/`Option` (wrap raising functions with `try_notation`) and, for process
+    # pools, be picklable. In fail-fast mode the first failure to arrive is returned and pending chunks
+    # are cancelled, otherwise the values and errors of all items are returned as `(oks, errs)`.
+    # Like `traverse`, `unit=Some` is needed when `fn` returns options. At most `window` chunks are in
+    # flight (twice the workers by default), the input is read as they complete and not past a failure.
+    if chunksize < 1:
+        raise ValueError('chunksize must be at least 1')
+    if window is not None and window < 1:
+        raise ValueError('window must be at least 1')
+    if executor is None:
+        with ThreadPoolExecutor() as owned_executor:
+            return par_traverse(fn, items, owned_executor, chunksize=chunksize, ordered=ordered, fail_fast=fail_fast,
+                                unit=unit, window=window)
+    if window is None:
+        window = 2 * (getattr(executor, '_max_workers', None) or os.cpu_count() or 1)
+
+    chunks = enumerate(_chunks(items, chunksize))
+    pending: dict[Future, int] = {}
+    completed: list[tuple[int, list[Monad[Any]]]] = []
+
+    def _submit(count: int) -> None:
+        for index, chunk in islice(chunks, count):
+            pending[executor.submit(_apply_chunk, fn, chunk, fail_fast)] = index
+
+    try:
+        _submit(window)
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=pending.__getitem__):
+                results = future.result()
+                if fail_fast and results and not results[-1]._is_ok:
+                    return results[-1]
+                completed.append((pending.pop(future), results))
+            _submit(len(done))
+    finally:
+        for future in pending:
+            future.cancel()
+
+    if ordered:
+        completed.sort(key=lambda chunk: chunk[0])
+    results = (result for _, chunk in completed for result in chunk)
+    if fail_fast:
+        return traverse(_identity, results, unit=unit)
+    return partition(results)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+import re
+from functools import lru_cache
+from typing import Iterable, Any
+from .option import Option, Some, Nothing
+
+
+# a key, or a bracketed index / quoted key, optionally followed by a dot
+_SEGMENT = re.compile(r"""\s*(?:(?P<key>[^.\[\]\s]+)|\[\s*(?:(?P<index>-?\d+)|'(?P<single>[^']*)'|"(?P<double>[^"]*)")\s*\])\s*(?P<dot>\.)?""")
+
+
+def _parse(expr: str) -> tuple[str | int, ...]:
+    # "a.b[0]['c.d']" -> ('a', 'b', 0, 'c.d'), a plain key may only start the path or follow a dot
+    keys: list[str | int] = []
+    position = 0
+    after_dot = True
+    while True:
+        match = _SEGMENT.match(expr, position)
+        if match is None or (match['key'] is not None and not after_dot):
+            raise ValueError(f'Invalid path {expr!r} at position {position}')
+        if match['index'] is not None:
+            keys.append(int(match['index']))
+        else:
+            keys.append(next(key for key in (match['key'], match['single'], match['double']) if key is not None))
+        after_dot = match['dot'] is not None
+        position = match.end()
+        if position == len(expr):
+            break
+    if after_dot:
+        raise ValueError(f'Invalid path {expr!r}, it ends with a dot')
+    return tuple(keys)
+
+
+class Path:
+    # A parsed path expression, applying it subscripts the document once per key inside a single `try`
+    # and only wraps the final value. A missing key or index, a `None` or a value that can't be
+    # subscripted anywhere along the path gives `Nothing`.
+    __slots__ = ('_expr', '_keys', '_get', '_batch')
+
+    def __init__(self, expr: str) -> None:
+        self._expr = expr
+        self._keys = _parse(expr)
+        self._get, self._batch = _generate(self._keys)
+
+    @property
+    def keys(self) -> tuple[str | int, ...]:
+        return self._keys
+
+    def __call__(self, doc: Any) -> Option[Any]:
+        return self._get(doc)
+
+    def batch(self, docs: Iterable[Any]) -> list[Option[Any]]:
+        return self._batch(docs)
+
+    def __repr__(self) -> str:
+        return f'Path({self._expr!r})'
+
+
+def _generate(keys: tuple[str | int, ...]) -> tuple[Any, Any]:
+    # generated once per path, the keys are inlined as constants
+    lookup = ''.join(f'[{key!r}]' for key in keys)
+    source = '\n'.join([
+        'def _get(doc):',
+        '    try:',
+        f'        value = doc{lookup}',
+        '    except (KeyError, IndexError, TypeError):',
+        '        return _nothing',
+        '    return _nothing if value is None else _some(value)',
+        '',
+        'def _batch(docs):',
+        '    results = []',
+        '    append = results.append',
+        '    for doc in docs:',
+        '        try:',
+        f'            value = doc{lookup}',
+        '        except (KeyError, IndexError, TypeError):',
+        '            append(_nothing)',
+        '            continue',
+        '        append(_nothing if value is None else _some(value))',
+        '    return results',
+    ])
+    namespace: dict[str, Any] = {'_some': Some, '_nothing': Nothing()}
+    exec(source, namespace)
+    return namespace['_get'], namespace['_batch']
+
+
+@lru_cache(maxsize=256)
+def _compile(expr: str) -> Path:
+    return Path(expr)
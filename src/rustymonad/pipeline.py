@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Callable, Any
+from .monad import Monad
+from .result import Ok
+
+
+T = TypeVar('T')
+U = TypeVar('U')
+V = TypeVar('V')
+
+Stage = tuple[bool, Callable[[Any], Any]]
+
+
+def _compose(stages: tuple[Stage, ...]) -> Callable[[Any, Callable[[Any], Monad[Any]]], Monad[Any]]:
+    # Generates one straight-line function for the whole pipeline, every stage is bound as a default
+    # argument so that calling it only costs a local lookup.
+    params = ''.join(f', _f{i}=_f{i}' for i in range(len(stages)))
+    lines = [f'def _pipeline(value, unit{params}):', '    result = None']
+    for i, (is_bind, _) in enumerate(stages):
+        if is_bind and i == len(stages) - 1:
+            lines.append(f'    return _f{i}(value)')
+        elif is_bind:
+            lines += [f'    result = _f{i}(value)', '    if not result._is_ok:', '        return result', '    value = result._value']
+        else:
+            lines.append(f'    value = _f{i}(value)')
+    if not stages or not stages[-1][0]:
+        # trailing map stages are wrapped like the last bind result
+        lines.append('    return unit(value) if result is None else type(result)(value)')
+    namespace: dict[str, Any] = {f'_f{i}': fn for i, (_, fn) in enumerate(stages)}
+    exec('\n'.join(lines), namespace)
+    return namespace['_pipeline']
+
+
+class Pipeline(Generic[T, U]):
+    # A Kleisli composition of `and_then` (bind) and `map` stages, composed once and applied many times.
+    # Applying it passes plain values between stages, so no intermediate `Ok`/`Some` is allocated
+    # and only the monad returned by the last bind stage (or the failing one) reaches the caller.
+    __slots__ = ('_stages', '_unit', '_composed')
+
+    def __init__(self, fn: Callable[[T], Monad[U]] | None = None, *, unit: Callable[[Any], Monad[Any]] = Ok) -> None:
+        self._stages: tuple[Stage, ...] = () if fn is None else ((True, fn),)
+        self._unit = unit
+        self._composed: Callable[[Any, Callable[[Any], Monad[Any]]], Monad[Any]] | None = None
+
+    def _extend(self, *stages: Stage) -> Pipeline[T, Any]:
+        pipeline: Pipeline[T, Any] = Pipeline(unit=self._unit)
+        pipeline._stages = self._stages + stages
+        return pipeline
+
+    def and_then(self, fn: Callable[[U], Monad[V]]) -> Pipeline[T, V]:
+        return self._extend((True, fn))
+
+    def map(self, fn: Callable[[U], V]) -> Pipeline[T, V]:
+        return self._extend((False, fn))
+
+    def __rshift__(self, fn: Callable[[U], Monad[V]] | Pipeline[U, V]) -> Pipeline[T, V]:
+        if isinstance(fn, Pipeline):
+            return self._extend(*fn._stages)
+        return self._extend((True, fn))
+
+    def __call__(self, value: T) -> Monad[U]:
+        composed = self._composed or self._compose()
+        return composed(value, self._unit)
+
+    def run(self, monad: Monad[T]) -> Monad[U]:
+        # applies the pipeline to the value of an existing monad, failures pass through untouched
+        if not monad._is_ok:
+            return monad
+        composed = self._composed or self._compose()
+        return composed(monad._value, type(monad))
+
+    def _compose(self) -> Callable[[Any, Callable[[Any], Monad[Any]]], Monad[Any]]:
+        # unguarded, threads racing here only build the same function twice
+        self._composed = _compose(self._stages)
+        return self._composed
+
+    def __len__(self) -> int:
+        return len(self._stages)
+
+    def __repr__(self) -> str:
+        stages = ' '.join(('>> ' if is_bind else 'map ') + getattr(fn, '__qualname__', repr(fn)) for is_bind, fn in self._stages)
+        return f'Pipeline({stages})'
@@ -0,0 +1,161 @@
+from __future__ import annotations
+import dis
+import os
+import random
+import sys
+import threading
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from inspect import CO_GENERATOR
+from types import CodeType, FrameType
+from typing import NamedTuple, Any
+from .monad import Monad, _add_hook, _remove_hook
+from .option import Nothing
+from .result import Err
+from .utils import _drive, _drive_deadline, _drive_instrumented, _BIND
+
+
+class Origin(NamedTuple):
+    file: str
+    line: int
+    function: str
+    # the position of the `yield` in the do-block that was being evaluated, None outside of do-blocks
+    step: int | None
+
+
+# The mean time between two samples, 0.0 samples every construction. Set while the sampler is running,
+# together with the event that stops it.
+_interval = 0.0
+_stop: threading.Event | None = None
+# The origins of the most recently sampled `Err` values by `id`. The entry keeps its `Err` alive so
+# that the id can't be reused while it is in the table, the size bounds what is kept alive.
+_TRACED_SIZE = 1024
+_traced: OrderedDict[int, tuple[Err[Any], Origin]] = OrderedDict()
+_PACKAGE_DIR = os.path.dirname(__file__)
+_counts: Counter[Origin] = Counter()
+_lock = threading.Lock()
+_random = random.expovariate
+# the frames that send values into do-block generators
+_DRIVER_CODES = frozenset([_drive.__code__, _drive_deadline.__code__, _drive_instrumented.__code__])
+
+
+@lru_cache(maxsize=None)
+def _step_offsets(code: CodeType) -> list[int]:
+    # the offsets of the yields of a do-block, or of the binds once it has been compiled
+    if _BIND in code.co_varnames:
+        return [ins.offset for ins in dis.get_instructions(code) if ins.opname == 'STORE_FAST' and ins.argval == _BIND]
+    return [ins.offset for ins in dis.get_instructions(code) if ins.opname == 'YIELD_VALUE']
+
+
+def _step(frame: FrameType | None) -> int | None:
+    while frame is not None:
+        code = frame.f_code
+        if _BIND in code.co_varnames or (
+                code.co_flags & CO_GENERATOR and frame.f_back is not None and frame.f_back.f_code in _DRIVER_CODES):
+            return bisect_left(_step_offsets(code), frame.f_lasti)
+        frame = frame.f_back
+    return None
+
+
+def _origin(depth: int) -> Origin:
+    # The first frame outside of this package. An error created by the package while handling an
+    # exception (`try_notation`, `try_catch`) is blamed on the line that raised it instead.
+    start = sys._getframe(depth)
+    frame = start
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    file, line, function = frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name
+    if frame is not start and (exc := sys.exc_info()[1]) is not None and (tb := exc.__traceback__) is not None:
+        while tb.tb_next is not None:
+            tb = tb.tb_next
+        file, line, function = tb.tb_frame.f_code.co_filename, tb.tb_lineno, tb.tb_frame.f_code.co_name
+    return Origin(file, line, function, _step(start))
+
+
+def _record(origin: Origin) -> None:
+    with _lock:
+        _counts[origin] += 1
+
+
+def _arm(stop: threading.Event) -> None:
+    # The next `Err` and the next `Nothing` sample themselves and put back the plain constructors, so
+    # in between samples a construction costs exactly what it costs with provenance disabled.
+    with _lock:
+        if stop.is_set():
+            return
+        _add_hook(Err, 'provenance', _sample_err)
+        _add_hook(Nothing, 'provenance', _sample_nothing)
+
+
+def _sampler(interval: float, stop: threading.Event) -> None:
+    # exponentially distributed delays, so that the samples don't fall into step with a periodic workload
+    while not stop.wait(_random(1.0 / interval)):
+        _arm(stop)
+
+
+def _sample_err(err: Err[Any]) -> None:
+    if _interval:
+        _remove_hook(Err, 'provenance')
+    origin = _origin(3)
+    with _lock:
+        _counts[origin] += 1
+        _traced[id(err)] = (err, origin)
+        if len(_traced) > _TRACED_SIZE:
+            _traced.popitem(last=False)
+
+
+def _sample_nothing(nothing: Nothing) -> None:
+    # the singleton can't carry its origin, it is only counted
+    if _interval:
+        _remove_hook(Nothing, 'provenance')
+    _record(_origin(3))
+
+
+def enable_provenance(interval: float = 0.01) -> None:
+    # Records the origin of the first `Err`/`Nothing` created after each `interval` seconds on average,
+    # like a sampling profiler the counts are proportional to how often each origin fails. The hooks
+    # are only installed while a sample is due, and with `interval=0` every construction is recorded.
+    global _interval, _stop
+    if interval < 0.0:
+        raise ValueError('interval must not be negative')
+    disable_provenance()
+    with _lock:
+        _interval = interval
+        if interval == 0.0:
+            _add_hook(Err, 'provenance', _sample_err)
+            _add_hook(Nothing, 'provenance', _sample_nothing)
+            return
+        _stop = threading.Event()
+        threading.Thread(target=_sampler, args=(interval, _stop), name='rustymonad-provenance', daemon=True).start()
+
+
+def disable_provenance() -> None:
+    # the recorded origins are kept until `clear_origins`
+    global _interval, _stop
+    with _lock:
+        if _stop is not None:
+            _stop.set()
+            _stop = None
+        _remove_hook(Err, 'provenance')
+        _remove_hook(Nothing, 'provenance')
+        _interval = 0.0
+
+
+def origin_of(monad: Monad[Any]) -> Origin | None:
+    # None for values that weren't sampled, or were sampled longer than `_TRACED_SIZE` samples ago
+    with _lock:
+        entry = _traced.get(id(monad))
+    return entry[1] if entry is not None and entry[0] is monad else None
+
+
+def top_origins(n: int | None = 10) -> list[tuple[Origin, int]]:
+    # the most frequent origins with their sampled counts
+    with _lock:
+        return _counts.most_common(n)
+
+
+def clear_origins() -> None:
+    with _lock:
+        _counts.clear()
+        _traced.clear()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+from functools import wraps
+from typing import TypeVar, Callable, ParamSpec, Any
+
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+
+class Recur(tuple):
+    # The (args, kwargs) of the next call, returned by a trampolined function instead of calling itself.
+    # A tuple subclass so that creating one doesn't run a Python level `__init__`.
+    __slots__ = ()
+
+    @property
+    def args(self) -> tuple:
+        return self[0]
+
+    @property
+    def kwargs(self) -> dict[str, Any]:
+        return self[1]
+
+    def __repr__(self) -> str:
+        return f'Recur({self[0]!r}, {self[1]!r})'
+
+
+def recur(*args: Any, **kwargs: Any) -> Any:
+    return Recur((args, kwargs))
+
+
+def trampoline(func: Callable[P, T]) -> Callable[P, T]:
+    # Calls `func` again with the arguments of every `recur(...)` it returns, so the recursion runs in
+    # a loop with constant stack space. Option chains must bind the step with `flatmap` or `>>`,
+    # `Some.and_then` would wrap it in `Some`.
+    @wraps(func)
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        result = func(*args, **kwargs)
+        while type(result) is Recur:
+            args, kwargs = result
+            result = func(*args, **kwargs) if kwargs else func(*args)
+        return result
+    return _wrapper
@@ -0,0 +1,276 @@
+from __future__ import annotations
+import asyncio
+import inspect
+import random
+import threading
+import time
+from collections import deque
+from functools import wraps
+from typing import TypeVar, Callable, ParamSpec, NamedTuple, Literal, Any, overload
+from .monad import Monad
+from .result import Err
+from . import metrics as _metrics
+
+
+P = ParamSpec('P')
+M = TypeVar('M', bound=Monad)
+State = Literal['closed', 'open', 'half_open']
+
+
+class BreakerInfo(NamedTuple):
+    state: State
+    calls: int
+    failures: int
+    rejected: int
+    opened: int
+    half_opened: int
+    closed: int
+
+
+class _Breaker:
+    # The state shared by the calls of one decorated function. It is only touched under the lock and
+    # never across an `await`, so the same instance serves threads and coroutines.
+    __slots__ = ('window', 'min_calls', 'threshold', 'reset_timeout', 'probes', 'error', 'clock', 'lock',
+                 'outcomes', 'failures_in_window', 'state', 'opened_at', 'probing', 'cached',
+                 'calls', 'failures', 'rejected', 'opened', 'half_opened', 'closed')
+
+    def __init__(self, window: int, min_calls: int, threshold: float, reset_timeout: float, probes: int,
+                 error: Any, clock: Callable[[], float]) -> None:
+        self.window = window
+        self.min_calls = min_calls
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self.error = error
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        self.outcomes: deque[bool] = deque(maxlen=self.window)
+        self.failures_in_window = 0
+        self.state: State = 'closed'
+        self.opened_at = 0.0
+        self.probing = 0
+        self.cached: Monad[Any] | None = None
+        self.calls = self.failures = self.rejected = self.opened = self.half_opened = self.closed = 0
+
+    def acquire(self) -> tuple[Monad[Any] | None, bool]:
+        # (the cached `Err` to return instead of calling, whether the call is a half-open probe)
+        with self.lock:
+            if self.state == 'open' and self.clock() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self.half_opened += 1
+            if self.state == 'closed':
+                self.calls += 1
+                return None, False
+            if self.state == 'half_open' and self.probing < self.probes:
+                self.probing += 1
+                self.calls += 1
+                return None, True
+            self.rejected += 1
+            return self.cached, False
+
+    def release(self, result: Monad[Any] | None, probe: bool) -> None:
+        # `result` is None when the call raised
+        ok = result is not None and result._is_ok
+        with self.lock:
+            if probe:
+                self.probing -= 1
+            if not ok:
+                self.failures += 1
+            if probe or self.state == 'half_open':
+                if ok:
+                    self._close()
+                elif self.state == 'half_open':
+                    self._open(result)
+                return
+            if self.state != 'closed':
+                return
+            if len(self.outcomes) == self.window and not self.outcomes[0]:
+                self.failures_in_window -= 1
+            self.outcomes.append(ok)
+            if not ok:
+                self.failures_in_window += 1
+                if len(self.outcomes) >= self.min_calls and self.failures_in_window >= self.threshold * len(self.outcomes):
+                    self._open(result)
+
+    def _open(self, result: Monad[Any] | None) -> None:
+        # caches the `Err` returned while open, the failure that opened it unless `error` is given
+        self.state = 'open'
+        self.opened_at = self.clock()
+        self.opened += 1
+        if self.error is not None:
+            self.cached = Err(self.error)
+        elif result is not None:
+            self.cached = result
+        elif self.cached is None:
+            self.cached = Err('circuit breaker is open')
+
+    def _close(self) -> None:
+        self.state = 'closed'
+        self.closed += 1
+        self.outcomes.clear()
+        self.failures_in_window = 0
+
+    def info(self) -> BreakerInfo:
+        with self.lock:
+            state = self.state
+            if state == 'open' and self.clock() - self.opened_at >= self.reset_timeout:
+                state = 'half_open'
+            return BreakerInfo(state, self.calls, self.failures, self.rejected, self.opened, self.half_opened, self.closed)
+
+
+@overload
+def circuit_breaker(func: Callable[P, M]) -> Callable[P, M]: ...
+@overload
+def circuit_breaker(*, window: int = 20, min_calls: int = 10, threshold: float = 0.5, reset_timeout: float = 30.0,
+                    probes: int = 1, error: Any = None,
+                    clock: Callable[[], float] = time.monotonic) -> Callable[[Callable[P, M]], Callable[P, M]]: ...
+def circuit_breaker(func=None, *, window=20, min_calls=10, threshold=0.5, reset_timeout=30.0, probes=1, error=None,
+                    clock=time.monotonic):
+    # Opens once `threshold` of the last `window` calls (and at least `min_calls` of them) returned `Err`,
+    # then returns the `Err` that opened it (or `Err(error)`) without calling. After `reset_timeout`
+    # seconds up to `probes` calls are let through, the first success closes it again and a failure
+    # reopens it. An exception counts as a failure and is re-raised.
+    if func is None:
+        return lambda func: circuit_breaker(func, window=window, min_calls=min_calls, threshold=threshold,
+                                            reset_timeout=reset_timeout, probes=probes, error=error, clock=clock)
+    if not 0.0 < threshold <= 1.0:
+        raise ValueError('threshold must be in (0, 1]')
+    if not 0 < min_calls <= window:
+        raise ValueError('min_calls must be in [1, window]')
+    breaker = _Breaker(window, min_calls, threshold, reset_timeout, probes, error, clock)
+
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def _async_wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+            rejected, probe = breaker.acquire()
+            if rejected is not None:
+                return rejected  # type: ignore
+            result = None
+            try:
+                result = await func(*args, **kwargs)
+                return result
+            finally:
+                breaker.release(result, probe)
+        wrapper = _async_wrapper
+    else:
+        @wraps(func)
+        def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+            rejected, probe = breaker.acquire()
+            if rejected is not None:
+                return rejected  # type: ignore
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            finally:
+                breaker.release(result, probe)
+        wrapper = _wrapper
+
+    def reset() -> None:
+        with breaker.lock:
+            breaker.reset()
+
+    wrapper.breaker_info = breaker.info  # type: ignore[attr-defined]
+    wrapper.breaker_reset = reset  # type: ignore[attr-defined]
+    return wrapper
+
+
+class _Backoff:
+    # The retry schedule shared by the sync and async wrappers, `delay` decides after every failed
+    # attempt how long to wait before the next one.
+    __slots__ = ('attempts', 'retry_if', 'base_delay', 'max_delay', 'multiplier', 'jitter', 'budget', 'random')
+
+    def __init__(self, attempts: int, retry_if: Callable[[Any], bool] | None, base_delay: float, max_delay: float,
+                 multiplier: float, jitter: float, budget: float | None, random: Callable[[], float]) -> None:
+        self.attempts = attempts
+        self.retry_if = retry_if
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.budget = budget
+        self.random = random
+
+    def delay(self, result: Monad[Any], attempt: int, elapsed: float) -> tuple[float | None, str]:
+        # (the seconds to sleep or None to stop, the outcome reported when stopping)
+        if result._is_ok:
+            return None, 'ok'
+        if self.retry_if is not None and not self.retry_if(result._value):
+            return None, 'err'
+        if attempt >= self.attempts:
+            return None, 'exhausted'
+        # exponential, capped, then shortened by up to `jitter` of itself so that clients spread out
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (attempt - 1))
+        delay -= delay * self.jitter * self.random()
+        if self.budget is not None and elapsed + delay >= self.budget:
+            return None, 'budget'
+        return delay, ''
+
+
+def _report(name: str, outcome: str, attempts: int, duration: float) -> None:
+    if (sink := _metrics._sink) is not None:
+        sink.increment('retry_result.calls', {'function': name, 'outcome': outcome})
+        sink.increment('retry_result.attempts', {'function': name}, attempts)
+        sink.timing('retry_result.duration', duration, {'function': name})
+
+
+@overload
+def retry_result(func: Callable[P, M]) -> Callable[P, M]: ...
+@overload
+def retry_result(*, attempts: int = 3, retry_if: Callable[[Any], bool] | None = None, base_delay: float = 0.1,
+                 max_delay: float = 10.0, multiplier: float = 2.0, jitter: float = 1.0, budget: float | None = None,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], Any] | None = None,
+                 random: Callable[[], float] = random.random) -> Callable[[Callable[P, M]], Callable[P, M]]: ...
+def retry_result(func=None, *, attempts=3, retry_if=None, base_delay=0.1, max_delay=10.0, multiplier=2.0, jitter=1.0,
+                 budget=None, clock=time.monotonic, sleep=None, random=random.random):
+    # Calls again while the result is an `Err` that `retry_if` accepts (every `Err` by default), up to
+    # `attempts` calls in total. The n-th retry waits `base_delay * multiplier ** (n - 1)` seconds capped
+    # at `max_delay`, minus a random part of up to `jitter` of it. No retry is started that would end
+    # after `budget` seconds, the last `Err` is returned instead. Exceptions aren't retried. Async
+    # functions sleep with `asyncio.sleep`, `sleep` must then be a coroutine function.
+    if func is None:
+        return lambda func: retry_result(func, attempts=attempts, retry_if=retry_if, base_delay=base_delay,
+                                         max_delay=max_delay, multiplier=multiplier, jitter=jitter, budget=budget,
+                                         clock=clock, sleep=sleep, random=random)
+    if attempts < 1:
+        raise ValueError('attempts must be at least 1')
+    if not 0.0 <= jitter <= 1.0:
+        raise ValueError('jitter must be in [0, 1]')
+    backoff = _Backoff(attempts, retry_if, base_delay, max_delay, multiplier, jitter, budget, random)
+    name = func.__qualname__
+
+    if inspect.iscoroutinefunction(func):
+        sleep_async = asyncio.sleep if sleep is None else sleep
+
+        @wraps(func)
+        async def _async_wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+            start = clock()
+            attempt = 0
+            while True:
+                attempt += 1
+                result = await func(*args, **kwargs)
+                delay, outcome = backoff.delay(result, attempt, clock() - start)
+                if delay is None:
+                    _report(name, outcome, attempt, clock() - start)
+                    return result
+                await sleep_async(delay)
+        return _async_wrapper
+
+    sleep_sync = time.sleep if sleep is None else sleep
+
+    @wraps(func)
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        start = clock()
+        attempt = 0
+        while True:
+            attempt += 1
+            result = func(*args, **kwargs)
+            delay, outcome = backoff.delay(result, attempt, clock() - start)
+            if delay is None:
+                _report(name, outcome, attempt, clock() - start)
+                return result
+            sleep_sync(delay)
+    return _wrapper
@@ -1,119 +1,148 @@
 from __future__ import annotations
-from abc import ABC, abstractmethod
-from typing import TypeVar, Callable, Any
-from .monad import Monad
+from typing import TypeVar, Callable, Iterable, Any
+from .monad import Monad, _Propagate, _collect, _force, _set_value
 
 
 T = TypeVar('T')
 U = TypeVar('U')
 E = TypeVar('E')
 F = TypeVar('F')
+C = TypeVar('C')
 
 
-class Result(Monad[T | E], ABC):
-    @abstractmethod
-    def expect(self, msg: str) -> T:
+class Result(Monad[T | E]):
+    # A plain class rather than an ABC, so that `isinstance` and `match` take the fast path of `type`.
+    # Variants are told apart by the class-level `_is_ok` tag instead of calling `__bool__`.
+    __slots__ = ()
+
+    def __init__(self, value: Any) -> None:
+        raise TypeError(f'{type(self).__name__} cannot be instantiated directly, use `Ok(value)` or `Err(error)`')
+
+    def expect(self, msg: str | Callable[[], str]) -> T:
         raise NotImplementedError
     
-    @abstractmethod
-    def expect_err(self, msg: str) -> E:
+    def expect_err(self, msg: str | Callable[[], str]) -> E:
         raise NotImplementedError
 
-    @abstractmethod
     def unwrap(self) -> T:
         raise NotImplementedError
     
-    @abstractmethod
     def unwrap_err(self) -> E:
         raise NotImplementedError
 
-    @abstractmethod
     def unwrap_or(self, default: T) -> T:
         raise NotImplementedError
 
-    @abstractmethod
+    def unwrap_or_else(self, fn: Callable[[E], T]) -> T:
+        raise NotImplementedError
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        raise NotImplementedError
+
+    def map_or_else(self, default: Callable[[E], U], fn: Callable[[T], U]) -> U:
+        raise NotImplementedError
+
+    def and_(self, other: Result[U, E] | Callable[[], Result[U, E]]) -> Result[U, E]:
+        raise NotImplementedError
+
+    def or_(self, other: Result[T, F] | Callable[[], Result[T, F]]) -> Result[T, F]:
+        raise NotImplementedError
+
     def and_then(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
         raise NotImplementedError
 
-    @abstractmethod
     def or_else(self, fn: Callable[[E], Result[U, E]]) -> Result[U, E]:
         raise NotImplementedError
     
-    @abstractmethod
     def inspect(self, fn: Callable[[T], None]) -> Result[T, E]:
         raise NotImplementedError
 
-    @abstractmethod
     def inspect_err(self, fn: Callable[[E], None]) -> Result[T, E]:
         raise NotImplementedError
     
-    @abstractmethod
     def is_ok_and(self, fn: Callable[[T], bool]) -> bool:
         raise NotImplementedError
     
-    @abstractmethod
     def is_err_and(self, fn: Callable[[E], bool]) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def ok(self) -> Option[T]:
         raise NotImplementedError
     
-    @abstractmethod
     def err(self) -> Option[E]:
         raise NotImplementedError
 
-    @abstractmethod
     def map(self, fn: Callable[[T], U]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def flatmap(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def is_ok(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def is_err(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
+    def q(self) -> T:
+        # like Rust's `?`, the value of `Ok`, or `Err` returned by the enclosing `@propagate` function
+        raise NotImplementedError
+
     def __bool__(self) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def __eq__(self, other: object) -> bool:
         raise NotImplementedError
 
-    @abstractmethod
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         raise NotImplementedError
 
-    @abstractmethod
     def __repr__(self) -> str:
         raise NotImplementedError
     
     @staticmethod
-    def try_catch(fn: Callable[[T], U]) -> Callable[[T], Result[U, str]]:
-        def _wrapper(*args, **kwargs):
-            try:
-                return Ok(fn(*args, **kwargs))
-            except Exception as e:
-                return Err(str(e))
+    def try_catch(fn: Callable[[T], U], keep_exception: bool = False, tb_frames: int | None = None) -> Callable[[T], Result[U, Any]]:
+        # `keep_exception` stores the exception itself in `Err` instead of its message, so formatting
+        # is deferred until the message is read. `tb_frames` limits its traceback to the innermost
+        # frames (0 drops it) so that retained errors don't pin every frame and its locals.
+        if not keep_exception:
+            def _wrapper(*args, **kwargs):
+                try:
+                    return Ok(fn(*args, **kwargs))
+                except Exception as e:
+                    return Err(str(e))
+        elif tb_frames is None:
+            def _wrapper(*args, **kwargs):
+                try:
+                    return Ok(fn(*args, **kwargs))
+                except Exception as e:
+                    return Err(e)
+        else:
+            def _wrapper(*args, **kwargs):
+                try:
+                    return Ok(fn(*args, **kwargs))
+                except Exception as e:
+                    return Err(_trim_traceback(e, tb_frames))
         return _wrapper
 
+    @staticmethod
+    def collect(results: Iterable[Result[T, E]], into: Callable[[Iterable[T]], C] = list) -> Result[C, E]:
+        collected, failure = _collect(results, into)
+        return Ok(collected) if failure is None else failure
+
 
 class Ok(Result[T, Any]):
+    __slots__ = ()
+    _variant = 'Ok'
+
     def __init__(self, value: T) -> None:
-        super().__init__(value)
+        _set_value(self, value)
 
-    def expect(self, msg: str) -> T:
+    def expect(self, msg: str | Callable[[], str]) -> T:
         return self._value
     
-    def expect_err(self, msg: str):
-        raise Exception(f'{msg}: {self._value}')
+    def expect_err(self, msg: str | Callable[[], str]):
+        raise Exception(f'{_force(msg)}: {self._value}')
 
     def unwrap(self) -> T:
         return self._value
@@ -127,6 +156,21 @@ class Ok(Result[T, Any]):
     def unwrap_or(self, default: T) -> T:
         return self._value
 
+    def unwrap_or_else(self, fn: Callable[[E], T]) -> T:
+        return self._value
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        return fn(self._value)
+
+    def map_or_else(self, default: Callable[[E], U], fn: Callable[[T], U]) -> U:
+        return fn(self._value)
+
+    def and_(self, other: Result[U, E] | Callable[[], Result[U, E]]) -> Result[U, E]:
+        return _force(other)
+
+    def or_(self, other: Result[T, F] | Callable[[], Result[T, F]]) -> Result[T, Any]:
+        return self
+
     def and_then(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
         return fn(self._value)
 
@@ -164,6 +208,9 @@ class Ok(Result[T, Any]):
     def is_err(self) -> bool:
         return False
 
+    def q(self) -> T:
+        return self._value
+
     def __bool__(self) -> bool:
         return True
 
@@ -172,6 +219,8 @@ class Ok(Result[T, Any]):
             return self._value == other._value
         return False
 
+    __hash__ = Monad.__hash__
+
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[U]:
         return fn(self._value)
 
@@ -180,13 +229,17 @@ class Ok(Result[T, Any]):
 
 
 class Err(Result[Any, E]):
-    def __init__(self, value: E) -> None:
-        super().__init__(value)
+    __slots__ = ()
+    _is_ok = False
+    _variant = 'Err'
 
-    def expect(self, msg: str):
-        raise Exception(f'{msg}: {self._value}')
+    def __init__(self, value: T) -> None:
+        _set_value(self, value)
+
+    def expect(self, msg: str | Callable[[], str]):
+        raise Exception(f'{_force(msg)}: {self._value}')
     
-    def expect_err(self, msg: str) -> E:
+    def expect_err(self, msg: str | Callable[[], str]) -> E:
         return self._value
 
     def unwrap(self):
@@ -201,6 +254,21 @@ class Err(Result[Any, E]):
     def unwrap_or(self, default: T) -> T:
         return default
 
+    def unwrap_or_else(self, fn: Callable[[E], T]) -> T:
+        return fn(self._value)
+
+    def map_or(self, default: U, fn: Callable[[T], U]) -> U:
+        return default
+
+    def map_or_else(self, default: Callable[[E], U], fn: Callable[[T], U]) -> U:
+        return default(self._value)
+
+    def and_(self, other: Result[U, E] | Callable[[], Result[U, E]]) -> Result[Any, E]:
+        return self
+
+    def or_(self, other: Result[T, F] | Callable[[], Result[T, F]]) -> Result[T, F]:
+        return _force(other)
+
     def and_then(self, fn: Callable[[T], Result[U, E]]) -> Result[U, E]:
         return self
 
@@ -238,6 +306,9 @@ class Err(Result[Any, E]):
     def is_err(self) -> bool:
         return True
 
+    def q(self):
+        raise _Propagate(self)
+
     def __bool__(self) -> bool:
         return False
 
@@ -246,6 +317,8 @@ class Err(Result[Any, E]):
             return self._value == other._value
         return False
 
+    __hash__ = Monad.__hash__
+
     def __rshift__(self, fn: Callable[[T], Monad[U]]) -> Monad[Any]:
         return self
 
@@ -253,4 +326,23 @@ class Err(Result[Any, E]):
         return f'Result::Err({self._value!r})'
 
 
+def _trim_traceback(exc: BaseException, frames: int) -> BaseException:
+    # keeps the innermost `frames` frames of the traceback of `exc` and of its chained exceptions
+    seen: set[int] = set()
+    chained: BaseException | None = exc
+    while chained is not None and id(chained) not in seen:
+        seen.add(id(chained))
+        tb = chained.__traceback__
+        depth = 0
+        node = tb
+        while node is not None:
+            depth += 1
+            node = node.tb_next
+        for _ in range(depth - frames if frames > 0 else depth):
+            tb = tb.tb_next  # type: ignore[union-attr]
+        chained.__traceback__ = tb
+        chained = chained.__cause__ or chained.__context__
+    return exc
+
+
 from .option import Option, Some, Nothing
@@ -0,0 +1,115 @@
+from __future__ import annotations
+from itertools import islice
+from typing import TypeVar, Generic, Callable, Iterable, Iterator, Literal, Any
+from .monad import Monad
+from .option import Option, Some, Nothing
+from .result import Result, Ok
+
+
+T = TypeVar('T')
+U = TypeVar('U')
+A = TypeVar('A')
+
+Policy = Literal['keep', 'fail_fast', 'skip']
+
+
+def _error_of(item: Monad[Any]) -> Any:
+    return None if isinstance(item, Nothing) else item._value
+
+
+class ResultStream(Generic[T]):
+    # A lazy, single-pass view over an iterator of results. Every adapter returns a new stream
+    # wrapping a generator, so nothing is materialized and memory stays constant.
+    # The policy decides what iterating the stream does with failures: 'keep' passes them on,
+    # 'fail_fast' stops after passing on the first one, 'skip' drops and counts them in `skipped`.
+    __slots__ = ('_iterable', '_policy', '_skipped')
+    _unit: Callable[[Any], Monad[Any]] = Ok
+    _collect = staticmethod(Result.collect)
+
+    def __init__(self, iterable: Iterable[Monad[T]], policy: Policy = 'keep') -> None:
+        if policy not in ('keep', 'fail_fast', 'skip'):
+            raise ValueError(f'Unknown policy: {policy!r}')
+        self._iterable = iterable
+        self._policy = policy
+        self._skipped = [0]
+
+    @property
+    def skipped(self) -> int:
+        return self._skipped[0]
+
+    def _chain(self, iterable: Iterable[Monad[U]]) -> Any:
+        # the derived streams share one counter, so `skipped` can be read on any stream of the chain
+        stream = type(self)(iterable, self._policy)
+        stream._skipped = self._skipped
+        return stream
+
+    def __iter__(self) -> Iterator[Monad[T]]:
+        if self._policy == 'keep':
+            yield from self._iterable
+        elif self._policy == 'fail_fast':
+            for item in self._iterable:
+                yield item
+                if not item._is_ok:
+                    return
+        else:
+            for item in self._iterable:
+                if item._is_ok:
+                    yield item
+                else:
+                    self._skipped[0] += 1
+
+    def map_ok(self, fn: Callable[[T], U]) -> Any:
+        unit = self._unit
+        return self._chain(unit(fn(item._value)) if item._is_ok else item for item in self._iterable)
+
+    def and_then(self, fn: Callable[[T], Monad[U]]) -> Any:
+        return self._chain(fn(item._value) if item._is_ok else item for item in self._iterable)
+
+    def filter_ok(self, fn: Callable[[T], bool]) -> Any:
+        return self._chain(item for item in self._iterable if not item._is_ok or fn(item._value))
+
+    def inspect_err(self, fn: Callable[[Any], None]) -> Any:
+        def _inspect(iterable: Iterable[Monad[T]]) -> Iterator[Monad[T]]:
+            for item in iterable:
+                if not item._is_ok:
+                    fn(_error_of(item))
+                yield item
+        return self._chain(_inspect(self._iterable))
+
+    def take_while_ok(self) -> Any:
+        def _take(iterable: Iterable[Monad[T]]) -> Iterator[Monad[T]]:
+            for item in iterable:
+                if not item._is_ok:
+                    return
+                yield item
+        return self._chain(_take(self._iterable))
+
+    def chunked(self, size: int) -> Iterator[list[Monad[T]]]:
+        # lists of up to `size` items, after the policy is applied
+        if size < 1:
+            raise ValueError('size must be at least 1')
+        iterator = iter(self)
+        while chunk := list(islice(iterator, size)):
+            yield chunk
+
+    def try_fold(self, init: A, fn: Callable[[A, T], Monad[A]]) -> Monad[A]:
+        # folds the values while `fn` succeeds, the first failure (of the stream or of `fn`) is returned
+        accumulator = init
+        for item in self:
+            if not item._is_ok:
+                return item
+            result = fn(accumulator, item._value)
+            if not result._is_ok:
+                return result
+            accumulator = result._value
+        return self._unit(accumulator)
+
+    def collect(self, into: Callable[[Iterable[T]], Any] = list) -> Monad[Any]:
+        return self._collect(self, into)
+
+
+class OptionStream(ResultStream[T]):
+    # the same adapters over options, `Some` counts as ok and `Nothing` as an error without payload
+    __slots__ = ()
+    _unit = Some
+    _collect = staticmethod(Option.collect)
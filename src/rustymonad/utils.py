@@ -1,42 +1,485 @@
-from functools import wraps
-from typing import TypeVar, Callable, Generator, TypeAlias, ParamSpec, Any
-from types import GeneratorType
-from .monad import Monad
-from .result import Result, Ok, Err
+import ast
+import asyncio
+import inspect
+import textwrap
+import time
+from functools import wraps, update_wrapper
+from typing import TypeVar, Callable, Generator, AsyncGenerator, Awaitable, Iterable, Iterator, TypeAlias, ParamSpec, Any, overload
+from types import GeneratorType, AsyncGeneratorType, FunctionType, CellType
+from .monad import Monad, _Propagate
+from .option import Option, Some, Nothing
+from .result import Result, Ok, Err, _trim_traceback
+from .recursion import Recur, trampoline as _trampoline
+from . import metrics as _metrics
+from . import deadlines as _deadlines
 
 
 P = ParamSpec('P')
 T = TypeVar('T')
+U = TypeVar('U')
+E = TypeVar('E')
+C = TypeVar('C')
 M = TypeVar('M', bound=Monad)
 DoRet: TypeAlias = Generator[Monad, Any, M]
+AsyncDoRet: TypeAlias = AsyncGenerator[Any, Any]
 
 
-def do_notation(func: Callable[P, DoRet[M]]) -> Callable[P, M]:
+@overload
+def do_notation(func: Callable[P, DoRet[M]]) -> Callable[P, M]: ...
+@overload
+def do_notation(*, compile: bool = False, trampoline: bool = False,
+                deadline: float | None = None) -> Callable[[Callable[P, DoRet[M]]], Callable[P, M]]: ...
+def do_notation(func=None, *, compile=False, trampoline=False, deadline=None):
+    # `trampoline` lets the block `return recur(...)` to run again with new arguments instead of recursing,
+    # `deadline` runs every call inside `with deadline(seconds)`
+    if func is None:
+        return lambda func: do_notation(func, compile=compile, trampoline=trampoline, deadline=deadline)
+    if deadline is not None:
+        return _bounded_do_block(do_notation(func, compile=compile, trampoline=trampoline), deadline)
+    if compile and (compiled := _compile_do_block(func)) is not None:
+        return _trampoline(compiled) if trampoline else compiled
+    if trampoline:
+        return _trampolined_do_block(func)
+
+    @wraps(func)
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        if _metrics._sink is not None:
+            return _drive_instrumented(func, args, kwargs)
+        if (limit := _deadlines._current.get()) is not None:
+            return _drive_deadline(func(*args, **kwargs), limit)
+        return _drive(func(*args, **kwargs))
+    return _wrapper
+
+
+def _bounded_do_block(func: Callable[P, M], seconds: float) -> Callable[P, M]:
+    @wraps(func)
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        with _deadlines.deadline(seconds):
+            return func(*args, **kwargs)
+    return _wrapper
+
+
+def _trampolined_do_block(func: Callable[P, DoRet[M]]) -> Callable[P, M]:
     @wraps(func)
     def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        while True:
+            result = _drive_fallback(func, args, kwargs)
+            if type(result) is not Recur:
+                return result
+            args, kwargs = result  # type: ignore[misc]
+    return _wrapper
+
+
+def _drive_fallback(func: Callable[..., DoRet[M]], args: tuple, kwargs: dict[str, Any]) -> M:
+    # the driver for the calls that can't take the fast path, compiled blocks fall back to it as well
+    if _metrics._sink is not None:
+        return _drive_instrumented(func, args, kwargs)
+    if (limit := _deadlines._current.get()) is not None:
+        return _drive_deadline(func(*args, **kwargs), limit)
+    return _drive(func(*args, **kwargs))
+
+
+def _drive(generator: DoRet[M]) -> M:
+    # sends the values straight back instead of binding them through `flatmap`
+    if not isinstance(generator, GeneratorType):
+        raise TypeError('do-notation expected a generator')
+    send = generator.send
+    value = None
+    try:
+        while True:
+            result = send(value)
+            if not isinstance(result, Monad):
+                raise TypeError(f'Expected monad type, got {type(result)}')
+            if not result._is_ok:
+                return result  # type: ignore
+            value = result._value
+    except StopIteration as e:
+        return e.value
+
+
+def _drive_deadline(generator: DoRet[M], limit: _deadlines.Deadline) -> M:
+    # `_drive`, stopping before the next bind once the deadline has passed
+    if not isinstance(generator, GeneratorType):
+        raise TypeError('do-notation expected a generator')
+    send = generator.send
+    clock = limit.clock
+    value = None
+    try:
+        while True:
+            if clock() >= limit.expires_at:
+                return limit.exceeded()  # type: ignore[return-value]
+            result = send(value)
+            if not isinstance(result, Monad):
+                raise TypeError(f'Expected monad type, got {type(result)}')
+            if not result._is_ok:
+                return result  # type: ignore
+            value = result._value
+    except StopIteration as e:
+        return e.value
+
+
+def _drive_instrumented(func: Callable[..., DoRet[M]], args: tuple, kwargs: dict[str, Any]) -> M:
+    # the generator driver, reporting the timing of every step and where the block short-circuits
+    sink = _metrics._sink
+    name = func.__qualname__
+    limit = _deadlines._current.get()
+    start = time.perf_counter()
+    sink.increment('do_notation.calls', {'function': name})
+    try:
         generator = func(*args, **kwargs)
-        if isinstance(generator, GeneratorType):
-            monad = Monad(None)
+        if not isinstance(generator, GeneratorType):
+            raise TypeError('do-notation expected a generator')
+        step = 0
+        value = None
+        while True:
+            if limit is not None and limit.expired():
+                sink.increment('do_notation.deadline', {'function': name, 'step': step})
+                return limit.exceeded()  # type: ignore[return-value]
+            step_start = time.perf_counter()
+            try:
+                result = generator.send(value)
+            except StopIteration as e:
+                return e.value
+            sink.timing('do_notation.step', time.perf_counter() - step_start, {'function': name, 'step': step})
+            if not isinstance(result, Monad):
+                raise TypeError(f'Expected monad type, got {type(result)}')
+            if not result._is_ok:
+                sink.increment('do_notation.short_circuit', {'function': name, 'step': step})
+                return result  # type: ignore
+            value = result._value
+            step += 1
+    finally:
+        sink.timing('do_notation.duration', time.perf_counter() - start, {'function': name})
+
+
+def async_do_notation(func: Callable[P, AsyncDoRet]) -> Callable[P, Awaitable[Any]]:
+    # An async generator can't `return` a value, the monad bound by its last `yield` is the result.
+    # Yielding a tuple binds its items concurrently and sends back a tuple of their values.
+    @wraps(func)
+    async def _wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+        generator = func(*args, **kwargs)
+        if not isinstance(generator, AsyncGeneratorType):
+            raise TypeError('async-do-notation expected an async generator')
+        result = None
+        limit = _deadlines._current.get()
+        try:
             while True:
+                if limit is not None and limit.expired():
+                    return limit.exceeded()
                 try:
-                    result = monad.flatmap(generator.send)
-                    if not isinstance(result, Monad):
-                        raise TypeError(f'Expected monad type, got {type(result)}')
-                    elif (not result) or (result is monad):
-                        return result  # type: ignore
-                    monad = result
-                except StopIteration as e:
-                    return e.value
-        else:
-            raise TypeError('do-notation expected a generator')
+                    bind = await generator.asend(None if result is None else result._value)
+                except StopAsyncIteration:
+                    return result
+                if isinstance(bind, tuple):
+                    result = await _bind_concurrently(bind)
+                else:
+                    result = await _bind(bind)
+                if not result._is_ok:
+                    return result
+        finally:
+            await generator.aclose()
     return _wrapper
 
 
-def try_notation(func: Callable[P, T]) -> Callable[P, Result[T, str]]:
+async def _bind(bind: Any) -> Monad:
+    if inspect.isawaitable(bind):
+        bind = await bind
+    if not isinstance(bind, Monad):
+        raise TypeError(f'Expected monad type, got {type(bind)}')
+    return bind
+
+
+async def _bind_concurrently(binds: tuple) -> Monad:
+    # short-circuits on the first falsy monad and cancels the binds still running
+    results: list[Any] = [None] * len(binds)
+    pending: dict[asyncio.Future, int] = {}
+    try:
+        for index, bind in enumerate(binds):
+            if inspect.isawaitable(bind):
+                pending[asyncio.ensure_future(bind)] = index
+        for index, bind in enumerate(binds):
+            if not inspect.isawaitable(bind):
+                results[index] = await _bind(bind)
+                if not results[index]._is_ok:
+                    return results[index]
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for future in sorted(done, key=pending.__getitem__):
+                index = pending.pop(future)
+                results[index] = await _bind(future.result())
+                if not results[index]._is_ok:
+                    return results[index]
+    finally:
+        for future in pending:
+            future.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+    values = tuple(result._value for result in results)
+    return type(results[0])(values) if results else Monad(values)
+
+
+def propagate(func: Callable[P, M]) -> Callable[P, M]:
+    # Turns the failure raised by `.q()` back into the return value, the generator-free alternative
+    # to `do_notation` for plain (and async) functions.
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def _async_wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+            try:
+                return await func(*args, **kwargs)
+            except _Propagate as signal:
+                return signal.args[0]
+        return _async_wrapper  # type: ignore[return-value]
+
     @wraps(func)
-    def _wrapper(*args, **kwargs) -> Result[T, str]:
+    def _wrapper(*args: P.args, **kwargs: P.kwargs) -> M:
+        try:
+            return func(*args, **kwargs)
+        except _Propagate as signal:
+            return signal.args[0]
+    return _wrapper
+
+
+@overload
+def try_notation(func: Callable[P, T]) -> Callable[P, Result[T, str]]: ...
+@overload
+def try_notation(*, keep_exception: bool = False, tb_frames: int | None = None) -> Callable[[Callable[P, T]], Callable[P, Result[T, Any]]]: ...
+def try_notation(func=None, *, keep_exception=False, tb_frames=None):
+    if func is None:
+        return lambda func: try_notation(func, keep_exception=keep_exception, tb_frames=tb_frames)
+    if not keep_exception:
+        convert = str
+    elif tb_frames is None:
+        convert = _identity
+    else:
+        convert = lambda e: _trim_traceback(e, tb_frames)
+
+    @wraps(func)
+    def _wrapper(*args, **kwargs) -> Result[T, Any]:
+        if _metrics._sink is not None:
+            return _call_instrumented(func, convert, args, kwargs)
         try:
             return Ok(func(*args, **kwargs))
         except Exception as e:
-            return Err(str(e))
+            return Err(convert(e))
     return _wrapper
+
+
+def _identity(value: T) -> T:
+    return value
+
+
+def _call_instrumented(func: Callable[..., T], convert: Callable[[Exception], Any], args: tuple, kwargs: dict[str, Any]) -> Result[T, Any]:
+    sink = _metrics._sink
+    name = func.__qualname__
+    start = time.perf_counter()
+    try:
+        return Ok(func(*args, **kwargs))
+    except Exception as e:
+        sink.increment('try_notation.exception', {'function': name, 'exception': type(e).__qualname__})
+        return Err(convert(e))
+    finally:
+        sink.timing('try_notation.duration', time.perf_counter() - start, {'function': name})
+
+
+def traverse(fn: Callable[[T], M], iterable: Iterable[T], into: Callable[[Iterable[Any]], C] = list, *,
+             unit: type[Ok] | type[Some] = Ok) -> Monad[C]:
+    # `unit` fixes the type of the result, an empty iterable included: `Ok` collects the results of `fn`
+    # into a `Result`, `Some` collects its options into an `Option`
+    if unit is Ok:
+        kind = Result
+    elif unit is Some:
+        kind = Option
+    else:
+        raise ValueError('unit must be Ok or Some')
+    # Collected in one pass without peeking at the first result, so an empty iterable needs no
+    # sentinel, and every result is checked as it is pulled, not only the first.
+    failure = None
+
+    def _values() -> Iterator[Any]:
+        nonlocal failure
+        for result in map(fn, iterable):
+            if not isinstance(result, kind):
+                raise TypeError(f'Expected {kind.__name__} from `fn` with unit={unit.__name__}, got {type(result).__name__}')
+            if not result._is_ok:
+                failure = result
+                return
+            yield result._value
+
+    collected = into(_values())
+    return unit(collected) if failure is None else failure
+
+
+def partition(iterable: Iterable[Monad[Any]]) -> tuple[list[Any], list[Any]]:
+    # (the values of the successes, the errors of the failures), a `Nothing` counts as the error `None`
+    oks: list[Any] = []
+    errs: list[Any] = []
+    for item in iterable:
+        if item._is_ok:
+            oks.append(item._value)
+        else:
+            errs.append(None if isinstance(item, Nothing) else item._value)
+    return oks, errs
+
+
+_BIND = '_do_notation_bind'
+_MONAD = '_do_notation_monad'
+_METRICS = '_do_notation_metrics'
+_DEADLINE = '_do_notation_deadline'
+_FALLBACK = '_do_notation_fallback'
+_COMPILED = '_do_notation_compiled'
+_NESTED_SCOPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef,
+                  ast.GeneratorExp, ast.ListComp, ast.SetComp, ast.DictComp)
+
+
+class _NotCompilable(Exception):
+    pass
+
+
+def _walk_scope(node: ast.AST):
+    # like `ast.walk`, but stays out of nested functions, classes and comprehensions
+    for child in ast.iter_child_nodes(node):
+        yield child
+        if not isinstance(child, _NESTED_SCOPES):
+            yield from _walk_scope(child)
+
+
+def _contains_yield(node: ast.AST) -> bool:
+    return any(isinstance(n, (ast.Yield, ast.YieldFrom, ast.Await)) for n in _walk_scope(node))
+
+
+def _bind_statements(stmt: ast.stmt) -> list[ast.stmt]:
+    # `target = yield expr` becomes:
+    #     _do_notation_bind = expr
+    #     if not isinstance(_do_notation_bind, _do_notation_monad):
+    #         raise TypeError(...)
+    #     if not _do_notation_bind._is_ok:
+    #         return _do_notation_bind
+    #     target = _do_notation_bind._value
+    yielded = stmt.value.value or ast.Constant(None)  # type: ignore[attr-defined]
+    if _contains_yield(yielded):
+        raise _NotCompilable
+    template = ast.parse(textwrap.dedent(f'''
+        {_BIND} = None
+        if not isinstance({_BIND}, {_MONAD}):
+            raise TypeError(f'Expected monad type, got {{type({_BIND})}}')
+        if not {_BIND}._is_ok:
+            return {_BIND}
+    ''')).body
+    template[0].value = yielded  # type: ignore[attr-defined]
+    if not isinstance(stmt, ast.Expr):
+        stmt.value = ast.Attribute(ast.Name(_BIND, ast.Load()), '_value', ast.Load())  # type: ignore[attr-defined]
+        template.append(stmt)
+    for node in template:
+        ast.copy_location(node, stmt)
+    return template
+
+
+def _rewrite_body(body: list[ast.stmt]) -> list[ast.stmt]:
+    rewritten = []
+    for stmt in body:
+        if isinstance(stmt, (ast.Expr, ast.Assign, ast.AnnAssign, ast.AugAssign)) and isinstance(stmt.value, ast.Yield):
+            rewritten.extend(_bind_statements(stmt))
+            continue
+        if isinstance(stmt, (ast.If, ast.For, ast.While)):
+            stmt.body = _rewrite_body(stmt.body)
+            stmt.orelse = _rewrite_body(stmt.orelse)
+        elif isinstance(stmt, ast.Match):
+            for match_case in stmt.cases:
+                match_case.body = _rewrite_body(match_case.body)
+        # anything that still yields (inside expressions, `try` or `with` blocks) can't be rewritten safely
+        if _contains_yield(stmt) or isinstance(stmt, (ast.AsyncFor, ast.AsyncWith)):
+            raise _NotCompilable
+        rewritten.append(stmt)
+    return rewritten
+
+
+def _fallback_prologue(arguments: ast.arguments) -> ast.stmt:
+    # `if metrics are enabled or a deadline is set: return <the generator driver>(*the same arguments)`
+    call = ast.Call(
+        func=ast.Name(_FALLBACK, ast.Load()),
+        args=[
+            *(ast.Name(arg.arg, ast.Load()) for arg in (*arguments.posonlyargs, *arguments.args)),
+            *([ast.Starred(ast.Name(arguments.vararg.arg, ast.Load()), ast.Load())] if arguments.vararg else []),
+        ],
+        keywords=[
+            *(ast.keyword(arg.arg, ast.Name(arg.arg, ast.Load())) for arg in arguments.kwonlyargs),
+            *([ast.keyword(None, ast.Name(arguments.kwarg.arg, ast.Load()))] if arguments.kwarg else []),
+        ],
+    )
+    enabled = ast.Compare(ast.Attribute(ast.Name(_METRICS, ast.Load()), '_sink', ast.Load()), [ast.IsNot()], [ast.Constant(None)])
+    current = ast.Call(ast.Attribute(ast.Name(_DEADLINE, ast.Load()), 'get', ast.Load()), [], [])
+    bounded = ast.Compare(current, [ast.IsNot()], [ast.Constant(None)])
+    return ast.If(ast.BoolOp(ast.Or(), [enabled, bounded]), [ast.Return(call)], [])
+
+
+def _compile_do_block(func: Callable) -> FunctionType | None:
+    # Rewrites the `yield` binds of a do-block into straight-line code with early returns.
+    # Returns None when the function can't be rewritten, the generator driver is used then.
+    code = getattr(func, '__code__', None)
+    if code is None or not inspect.isgeneratorfunction(func) or '__class__' in code.co_freevars:
+        return None
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(func)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    fndef = tree.body[0] if tree.body else None
+    if not isinstance(fndef, ast.FunctionDef) or fndef.name != func.__name__:
+        return None
+    if any(isinstance(node, ast.Name) and node.id.startswith('__') and not node.id.endswith('__')
+           for node in ast.walk(fndef)):
+        return None  # private names would have been mangled inside a class body
+    try:
+        fndef.body = _rewrite_body(fndef.body)
+    except _NotCompilable:
+        return None
+    fndef.body.insert(0, _fallback_prologue(fndef.args))
+
+    # defaults and annotations are taken from the original function instead of being re-evaluated
+    fndef.decorator_list = []
+    fndef.returns = None
+    fndef.args.defaults = []
+    fndef.args.kw_defaults = [None] * len(fndef.args.kwonlyargs)
+    for arg in (*fndef.args.posonlyargs, *fndef.args.args, *fndef.args.kwonlyargs, fndef.args.vararg, fndef.args.kwarg):
+        if arg is not None:
+            arg.annotation = None
+
+    # Free variables are declared in a factory function so that the rewritten function closes over
+    # the same cells as the original one. It is defined under a name that can't collide, so that a
+    # block calling itself by its global name still resolves that name as a global.
+    fndef.name = _COMPILED
+    free_names = (*code.co_freevars, _MONAD, _METRICS, _DEADLINE, _FALLBACK)
+    factory = ast.FunctionDef(
+        name='_do_notation_factory',
+        args=ast.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+        body=[
+            *(ast.Assign([ast.Name(name, ast.Store())], ast.Constant(None)) for name in free_names),
+            fndef,
+        ],
+        decorator_list=[],
+    )
+    module = ast.Module([ast.copy_location(factory, fndef)], type_ignores=[])
+    ast.fix_missing_locations(module)
+    ast.increment_lineno(module, code.co_firstlineno - 1)
+    try:
+        factory_code = compile(module, code.co_filename, 'exec')
+    except SyntaxError:
+        return None
+
+    factory_code = next(c for c in factory_code.co_consts if getattr(c, 'co_name', None) == factory.name)
+    new_code = next(c for c in factory_code.co_consts if getattr(c, 'co_name', None) == _COMPILED)
+    names = {'co_name': code.co_name}
+    if hasattr(code, 'co_qualname'):
+        names['co_qualname'] = code.co_qualname
+    new_code = new_code.replace(**names)
+    cells = dict(zip(code.co_freevars, func.__closure__ or ()))
+    cells[_MONAD] = CellType(Monad)
+    cells[_METRICS] = CellType(_metrics)
+    cells[_DEADLINE] = CellType(_deadlines._current)
+    cells[_FALLBACK] = CellType(lambda *args, **kwargs: _drive_fallback(func, args, kwargs))
+    if any(name not in cells for name in new_code.co_freevars):
+        return None
+
+    compiled = FunctionType(new_code, func.__globals__, func.__name__, func.__defaults__,
+                            tuple(cells[name] for name in new_code.co_freevars))
+    compiled.__kwdefaults__ = func.__kwdefaults__
+    return update_wrapper(compiled, func)
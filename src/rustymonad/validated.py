@@ -0,0 +1,76 @@
+from __future__ import annotations
+from typing import TypeVar, Generic, Callable, Iterable, Any
+from .result import Result, Ok, Err
+
+
+T = TypeVar('T')
+U = TypeVar('U')
+E = TypeVar('E')
+
+
+class Errors(list):
+    # The errors accumulated by `Validated`, merged flat instead of nested when they are combined again.
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f'Errors({list.__repr__(self)})'
+
+
+def _accumulate(results: Iterable[Result[Any, Any]]) -> tuple[list[Any], Errors | None]:
+    # unlike `Result.collect`, every result is consumed so that all of the errors are reported
+    values: list[Any] = []
+    errors: Errors | None = None
+    for result in results:
+        if result._is_ok:
+            values.append(result._value)
+            continue
+        if errors is None:
+            errors = Errors()
+        if isinstance(error := result._value, Errors):
+            errors.extend(error)
+        else:
+            errors.append(error)
+    return values, errors
+
+
+class Validated(Generic[T]):
+    # Runs independent checks on a record once and accumulates every `Err` in a single `Errors` list.
+    # The record passes as `Ok(record)`, or `Ok(into(*values))` to build something from the check values.
+    __slots__ = ('_checks', '_into')
+
+    def __init__(self, *checks: Callable[[T], Result[Any, Any]], into: Callable[..., Any] | None = None) -> None:
+        self._checks = checks
+        self._into = into
+
+    def __call__(self, record: T) -> Result[Any, Errors]:
+        values, errors = _accumulate([check(record) for check in self._checks])
+        if errors is not None:
+            return Err(errors)
+        return Ok(record if self._into is None else self._into(*values))
+
+    def batch(self, records: Iterable[T]) -> tuple[list[Any], dict[int, Errors]]:
+        # (the valid records or built values, the errors of the invalid ones keyed by index)
+        checks = self._checks
+        into = self._into
+        valid: list[Any] = []
+        invalid: dict[int, Errors] = {}
+        for index, record in enumerate(records):
+            values, errors = _accumulate([check(record) for check in checks])
+            if errors is not None:
+                invalid[index] = errors
+            else:
+                valid.append(record if into is None else into(*values))
+        return valid, invalid
+
+    @staticmethod
+    def zip(*results: Result[Any, Any]) -> Result[tuple[Any, ...], Errors]:
+        values, errors = _accumulate(results)
+        return Ok(tuple(values)) if errors is None else Err(errors)
+
+    @staticmethod
+    def map_n(fn: Callable[..., U], *results: Result[Any, Any]) -> Result[U, Errors]:
+        values, errors = _accumulate(results)
+        return Ok(fn(*values)) if errors is None else Err(errors)
+
+    def __repr__(self) -> str:
+        return f'Validated({len(self._checks)} checks)'
@@ -0,0 +1,120 @@
+import threading
+import time
+import unittest
+from src.rustymonad import Result, Ok, Err, Some, Nothing, memoize_result
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.calls: list[str] = []
+
+    def lookup(self, key: str) -> Result[str, str]:
+        self.calls.append(key)
+        if key.startswith('bad'):
+            return Err(f'missing {key}')
+        return Ok(key.upper())
+
+    def test_cache_ok_ttl(self):
+        lookup = memoize_result(ttl=10, clock=self.clock)(self.lookup)
+        self.assertEqual(lookup('a'), Ok('A'))
+        self.assertEqual(lookup('a'), Ok('A'))
+        self.assertEqual(self.calls, ['a'])
+
+        self.clock.now = 10
+        self.assertEqual(lookup('a'), Ok('A'))
+        self.assertEqual(self.calls, ['a', 'a'])
+        self.assertEqual(lookup.cache_info(), (1, 2, 0, 1, 1, 128))
+
+        lookup.cache_clear()
+        self.assertEqual(lookup.cache_info(), (0, 0, 0, 0, 0, 128))
+
+    def test_cache_err_policy(self):
+        uncached = memoize_result(clock=self.clock)(self.lookup)
+        uncached('bad')
+        uncached('bad')
+        self.assertEqual(self.calls, ['bad', 'bad'])
+
+        self.calls.clear()
+        negative = memoize_result(err_ttl=1, clock=self.clock)(self.lookup)
+        self.assertEqual(negative('bad'), Err('missing bad'))
+        self.assertEqual(negative('bad'), Err('missing bad'))
+        self.clock.now = 1
+        negative('bad')
+        self.assertEqual(self.calls, ['bad', 'bad'])
+
+    def test_cache_lru(self):
+        lookup = memoize_result(maxsize=2, clock=self.clock)(self.lookup)
+        for key in ('a', 'b', 'a', 'c', 'a', 'b'):
+            lookup(key)
+        self.assertEqual(self.calls, ['a', 'b', 'c', 'b'])
+        self.assertEqual(lookup.cache_info().evictions, 2)
+
+    def test_cache_keys(self):
+        @memoize_result
+        def describe(option, *, default: str = '-') -> Result[str, str]:
+            self.calls.append(repr(option))
+            return Ok(str(option.unwrap_or(default)))
+
+        self.assertEqual(describe(Some(1)), Ok('1'))
+        self.assertEqual(describe(Some(1)), Ok('1'))
+        self.assertEqual(describe(Nothing()), Ok('-'))
+        self.assertEqual(describe(Nothing(), default='?'), Ok('?'))
+        self.assertEqual(len(self.calls), 3)
+
+    def test_cache_single_flight(self):
+        started = threading.Event()
+
+        @memoize_result
+        def slow(key: str) -> Result[str, str]:
+            self.calls.append(key)
+            started.set()
+            time.sleep(0.05)
+            return Ok(key)
+
+        results: list[Result[str, str]] = []
+        threads = [threading.Thread(target=lambda: results.append(slow('k'))) for _ in range(8)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [Ok('k')] * 8)
+        self.assertEqual(self.calls, ['k'])
+        self.assertEqual(slow.cache_info().shared, 7)
+
+    def test_cache_exception(self):
+        @memoize_result
+        def broken(key: str) -> Result[str, str]:
+            self.calls.append(key)
+            raise RuntimeError(key)
+
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                broken('x')
+        self.assertEqual(self.calls, ['x', 'x'])
+
+    def test_cache_not_a_monad(self):
+        @memoize_result
+        def untyped(key: str) -> Result[str, str]:
+            self.calls.append(key)
+            return None  # type: ignore[return-value]
+
+        # the key doesn't stay in flight, a second call runs again instead of waiting forever
+        for _ in range(2):
+            with self.assertRaises(TypeError):
+                untyped('x')
+        self.assertEqual(self.calls, ['x', 'x'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import io
+import pickle
+import unittest
+from src.rustymonad import Monad, Some, Nothing, Ok, Err
+from src.rustymonad import codec
+
+
+class CodecTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.values = [
+            Nothing(),
+            Some(None),
+            Ok(True),
+            Err(False),
+            Ok(0),
+            Ok(-1),
+            Ok(2 ** 70),
+            Ok(-2 ** 70),
+            Some(1.5),
+            Err('错误 message'),
+            Ok([1, 'a', None, [Some(2), Nothing()]]),
+            Ok({'user': {'id': 7, 'tags': ['x']}, 'error': Err('nested')}),
+            Some(Ok(Some(Err('deep')))),
+        ]
+
+    def test_codec_roundtrip(self):
+        for value in self.values:
+            with self.subTest(value=value):
+                decoded = codec.loads(codec.dumps(value))
+                self.assertEqual(decoded, value)
+                self.assertIs(type(decoded), type(value))
+        self.assertIs(codec.loads(codec.dumps(Nothing())), Nothing())
+        self.assertEqual(codec.loads(codec.dumps(Ok((1, 2)))), Ok([1, 2]))
+        self.assertEqual(len(codec.dumps(Ok(1))), 3)
+
+    def test_codec_errors(self):
+        with self.assertRaises(TypeError):
+            codec.dumps(Ok(object()))
+        with self.assertRaises(TypeError):
+            codec.dumps(Ok({1: 'a'}))
+        with self.assertRaises(TypeError):
+            codec.dumps(Monad(1))
+        with self.assertRaises(ValueError):
+            codec.loads(codec.dumps(Ok('abc'))[:-1])
+        with self.assertRaises(ValueError):
+            codec.loads(codec.dumps(Ok(1)) + b'\x00')
+        with self.assertRaises(ValueError):
+            codec.loads(b'\xff')
+
+    def test_codec_stream(self):
+        stream = io.BytesIO()
+        codec.dump_iter(iter(self.values), stream)
+        stream.seek(0)
+        self.assertEqual(list(codec.load_iter(stream)), self.values)
+
+        truncated = io.BytesIO(b''.join(codec.iter_dumps(self.values))[:-1])
+        with self.assertRaises(ValueError):
+            list(codec.load_iter(truncated))
+
+    def test_codec_pickle(self):
+        for value in self.values:
+            with self.subTest(value=value):
+                self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+        self.assertEqual(Ok(1).__reduce__(), (Ok, (1,)))
+        self.assertEqual(Nothing().__reduce__(), (Nothing, ()))
+
+
+if __name__ == '__main__':
+    unittest.main()
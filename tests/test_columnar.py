@@ -0,0 +1,103 @@
+import unittest
+from array import array
+from src.rustymonad import Some, Nothing, Ok, Err
+from src.rustymonad import OptionArray, ResultArray
+from src.rustymonad import columnar
+
+
+class ColumnarTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.options = OptionArray.from_options([Some(1), Nothing(), Some(3), Some(4)], typecode='q')
+        self.results = ResultArray.from_results([Ok(1.0), Err('bad'), Ok(3.0), Ok(4.0)], typecode='d')
+        self.objects = ResultArray.from_results([Ok('a'), Err(ValueError('x')), Ok('c')])
+
+    def test_columnar_access(self):
+        self.assertEqual(len(self.options), 4)
+        self.assertEqual(list(self.options), [Some(1), Nothing(), Some(3), Some(4)])
+        self.assertEqual(self.options[-1], Some(4))
+        self.assertIs(self.options[1], Nothing())
+
+        self.assertEqual(list(self.results), [Ok(1.0), Err('bad'), Ok(3.0), Ok(4.0)])
+        self.assertEqual(self.results[-3], Err('bad'))
+        match self.results[2]:
+            case Ok(v):
+                self.assertEqual(v, 3.0)
+            case _:
+                self.fail('expected Ok')
+
+        self.assertEqual(OptionArray.from_values([1, None, 3]).partition(), ([1, 3], [1]))
+
+    def test_columnar_slice(self):
+        values = OptionArray.from_values([1, None, 3])
+        self.assertIsInstance(values[0:2], OptionArray)
+        self.assertEqual(list(values[0:2]), [Some(1), Nothing()])
+        self.assertEqual(list(self.options[::-2]), [Some(4), Nothing()])
+
+        self.assertEqual(list(self.results[1:]), [Err('bad'), Ok(3.0), Ok(4.0)])
+        self.assertEqual(self.results[1:][0], Err('bad'))
+        self.assertEqual(list(self.results[2:]), [Ok(3.0), Ok(4.0)])
+        self.assertEqual(list(self.objects[:0]), [])
+        with self.assertRaises(TypeError):
+            self.options['0']
+        with self.assertRaises(TypeError):
+            self.results[1.0]
+
+    def test_columnar_buffers(self):
+        if columnar.np is None:
+            self.assertIsInstance(self.options._values, array)
+            self.assertIsInstance(self.results._values, array)
+        else:
+            self.assertEqual(self.options._values.dtype.char, 'q')
+        self.assertIsInstance(self.objects._values, list)
+        self.assertEqual(self.objects._errors.keys(), {1})
+
+    def test_columnar_map(self):
+        self.assertEqual(list(self.options.map(lambda x: x * 10, typecode='q')), [Some(10), Nothing(), Some(30), Some(40)])
+        self.assertEqual(list(self.options.map(str)), [Some('1'), Nothing(), Some('3'), Some('4')])
+        self.assertEqual(list(self.results.map(lambda x: x / 2, typecode='d')), [Ok(0.5), Err('bad'), Ok(1.5), Ok(2.0)])
+        self.assertEqual(list(self.results.map_err(str.upper)), [Ok(1.0), Err('BAD'), Ok(3.0), Ok(4.0)])
+
+        evens = self.options.and_then(lambda x: Some(x // 2) if x % 2 == 0 else Nothing(), typecode='q')
+        self.assertEqual(list(evens), [Nothing(), Nothing(), Nothing(), Some(2)])
+
+        checked = self.results.and_then(lambda x: Ok(x) if x > 2 else Err('small'))
+        self.assertEqual(list(checked), [Err('small'), Err('bad'), Ok(3.0), Ok(4.0)])
+
+    def test_columnar_filter(self):
+        self.assertEqual(list(self.options.filter(lambda x: x > 1)), [Nothing(), Nothing(), Some(3), Some(4)])
+        self.assertEqual(list(self.results.filter(lambda x: x < 4, 'too large')), [Ok(1.0), Err('bad'), Ok(3.0), Err('too large')])
+        self.assertEqual(list(self.options), [Some(1), Nothing(), Some(3), Some(4)])
+
+    def test_columnar_unwrap(self):
+        self.assertEqual(list(self.options.unwrap_or(0)), [1, 0, 3, 4])
+        self.assertEqual(list(self.results.unwrap_or(-1.0)), [1.0, -1.0, 3.0, 4.0])
+        self.assertEqual(self.objects.unwrap_or('?'), ['a', '?', 'c'])
+
+        values, missing = self.options.partition()
+        self.assertEqual((list(values), missing), ([1, 3, 4], [1]))
+        oks, errs = self.results.partition()
+        self.assertEqual((list(oks), errs), ([1.0, 3.0, 4.0], {1: 'bad'}))
+
+    @unittest.skipIf(columnar.np is None, 'numpy is not installed')
+    def test_columnar_vectorized(self):
+        doubled = self.results.map(lambda xs: xs * 2, vectorized=True)
+        self.assertEqual(list(doubled), [Ok(2.0), Err('bad'), Ok(6.0), Ok(8.0)])
+        large = self.options.filter(lambda xs: xs > 3, vectorized=True)
+        self.assertEqual(list(large), [Nothing(), Nothing(), Nothing(), Some(4)])
+        with self.assertRaises(TypeError):
+            self.objects.map(str.upper, vectorized=True)
+
+
+    def test_columnar_vectorized_unavailable(self):
+        numpy, columnar.np = columnar.np, None
+        try:
+            with self.assertRaises(ImportError):
+                self.results.map(lambda xs: xs * 2, vectorized=True)
+            with self.assertRaises(ImportError):
+                self.options.filter(lambda xs: xs > 3, vectorized=True)
+        finally:
+            columnar.np = numpy
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+import asyncio
+import time
+import unittest
+from src.rustymonad import Result, Ok, Err, DoRet, do_notation, async_do_notation
+from src.rustymonad import DeadlineExceeded, deadline, current_deadline, call_with_deadline, wait_with_deadline
+from src.rustymonad import InMemorySink, enable_metrics, disable_metrics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+CLOCK = FakeClock()
+
+
+def backend(name: str, seconds: float) -> Result[str, str]:
+    CLOCK.now += seconds
+    return Ok(name)
+
+
+def fetch_all() -> DoRet[Result[list[str], str]]:
+    user = yield backend('user', 0.1)
+    orders = yield backend('orders', 0.1)
+    prices = yield backend('prices', 0.1)
+    return Ok([user, orders, prices])
+
+
+class DeadlineTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        CLOCK.now = 0.0
+
+    def test_deadline_do_notation(self):
+        for compiled in (False, True):
+            with self.subTest(compile=compiled):
+                process = do_notation(compile=compiled)(fetch_all)
+                CLOCK.now = 0.0
+                self.assertEqual(process(), Ok(['user', 'orders', 'prices']))
+
+                # the third bind isn't started once 0.2s of the 0.15s budget are spent
+                CLOCK.now = 0.0
+                with deadline(0.15, clock=CLOCK):
+                    self.assertEqual(process(), Err(DeadlineExceeded(0.15)))
+                self.assertAlmostEqual(CLOCK.now, 0.2)
+                self.assertIsNone(current_deadline())
+
+                CLOCK.now = 0.0
+                with deadline(1, clock=CLOCK):
+                    self.assertEqual(process(), Ok(['user', 'orders', 'prices']))
+
+    def test_deadline_argument(self):
+        process = do_notation(deadline=0.15)(fetch_all)
+        self.assertEqual(process.__name__, 'fetch_all')
+        self.assertEqual(process(), Ok(['user', 'orders', 'prices']))
+
+        @do_notation(deadline=0.0)
+        def bounded() -> DoRet[Result[int, str]]:
+            value = yield Ok(1)
+            return Ok(value)
+        self.assertEqual(bounded(), Err(DeadlineExceeded(0.0)))
+
+    def test_deadline_nested(self):
+        with deadline(1, clock=CLOCK) as outer:
+            CLOCK.now = 0.5
+            # an inner deadline can't outlive the outer one
+            with deadline(10, clock=CLOCK) as inner:
+                self.assertIs(current_deadline(), inner)
+                self.assertEqual(inner.remaining(), 0.5)
+            with deadline(0.1, clock=CLOCK) as inner:
+                self.assertAlmostEqual(inner.remaining(), 0.1)
+            self.assertIs(current_deadline(), outer)
+        with self.assertRaises(ValueError):
+            deadline(-1)
+
+    def test_deadline_metrics(self):
+        sink = InMemorySink()
+        enable_metrics(sink)
+        try:
+            with deadline(0.15, clock=CLOCK):
+                self.assertEqual(do_notation(fetch_all)(), Err(DeadlineExceeded(0.15)))
+        finally:
+            disable_metrics()
+        self.assertEqual(sink.count('do_notation.deadline', function='fetch_all', step=2), 1)
+
+    def test_deadline_call(self):
+        def slow(seconds: float) -> Result[float, str]:
+            time.sleep(seconds)
+            return Ok(seconds)
+
+        self.assertEqual(call_with_deadline(slow, 0.0), Ok(0.0))
+        with deadline(0.05):
+            self.assertEqual(call_with_deadline(slow, 0.0), Ok(0.0))
+            # the worker sees the caller's deadline
+            self.assertIsNotNone(call_with_deadline(lambda: Ok(current_deadline())).unwrap())
+            self.assertEqual(call_with_deadline(slow, 0.5), Err(DeadlineExceeded(0.05)))
+            self.assertEqual(call_with_deadline(slow, 0.0), Err(DeadlineExceeded(0.05)))
+
+    def test_deadline_async(self):
+        async def slow(seconds: float) -> Result[float, str]:
+            await asyncio.sleep(seconds)
+            return Ok(seconds)
+
+        @async_do_notation
+        async def fetch_both():
+            yield wait_with_deadline(slow(0.0))
+            yield wait_with_deadline(slow(0.5))
+
+        async def run():
+            self.assertEqual(await wait_with_deadline(slow(0.0)), Ok(0.0))
+            with deadline(0.05):
+                self.assertEqual(await wait_with_deadline(slow(0.0)), Ok(0.0))
+                self.assertEqual(await fetch_both(), Err(DeadlineExceeded(0.05)))
+                self.assertEqual(await wait_with_deadline(slow(0.0)), Err(DeadlineExceeded(0.05)))
+
+        asyncio.run(run())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+from src.rustymonad import Result, Ok, Err, Nothing, DoRet, do_notation, try_notation
+from src.rustymonad import InMemorySink, enable_metrics, disable_metrics
+
+
+def safe_div(x: float, y: float) -> Result[float, str]:
+    if y == 0:
+        return Err('division by zero')
+    return Ok(x / y)
+
+
+def calc_process(a: float, b: float) -> DoRet[Result[float, str]]:
+    quotient = yield safe_div(a, b)
+    doubled = yield Ok(quotient * 2)
+    return Ok(doubled)
+
+
+class MetricsTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.err_init = Err.__init__
+        self.sink = InMemorySink()
+        enable_metrics(self.sink)
+
+    def tearDown(self) -> None:
+        disable_metrics()
+
+    def test_metrics_creation(self):
+        Err('a')
+        Err('b')
+        Nothing()
+        self.assertEqual(self.sink.count('err.created'), 2)
+        self.assertEqual(self.sink.count('err.created', function='test_metrics_creation'), 2)
+        self.assertEqual(self.sink.count('nothing.created'), 1)
+
+        disable_metrics()
+        Err('c')
+        self.assertEqual(self.sink.count('err.created'), 2)
+        self.assertIs(Err.__init__, self.err_init)
+        self.assertEqual(Err('d'), Err('d'))
+
+    def test_metrics_do_notation(self):
+        for compiled in (False, True):
+            with self.subTest(compile=compiled):
+                self.sink.clear()
+                process = do_notation(compile=compiled)(calc_process)
+                self.assertEqual(process(1, 2), Ok(1.0))
+                self.assertEqual(process(1, 0), Err('division by zero'))
+                self.assertEqual(self.sink.count('do_notation.calls', function='calc_process'), 2)
+                self.assertEqual(self.sink.count('do_notation.short_circuit', step=0), 1)
+                self.assertEqual(self.sink.count('do_notation.short_circuit', step=1), 0)
+                self.assertEqual(len(self.sink.timings('do_notation.duration', function='calc_process')), 2)
+                self.assertEqual(len(self.sink.timings('do_notation.step', step=1)), 1)
+                self.assertEqual(self.sink.count('err.created', function='safe_div'), 1)
+
+    def test_metrics_try_notation(self):
+        parse = try_notation(int)
+        self.assertEqual(parse('1'), Ok(1))
+        parse('x')
+        parse('y')
+        self.assertEqual(self.sink.count('try_notation.exception', exception='ValueError'), 2)
+        self.assertEqual(len(self.sink.timings('try_notation.duration', function='int')), 3)
+        self.assertEqual(self.sink.count('err.created', function='test_metrics_try_notation'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,18 @@
 import unittest
-from src.rustymonad import Monad
+import tracemalloc
+from src.rustymonad import Monad, Some, Nothing, Ok, Err
+
+
+def allocated_bytes_per_instance(factory, count: int = 10000) -> float:
+    instances = [None] * count
+    tracemalloc.start()
+    try:
+        for i in range(count):
+            instances[i] = factory()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return current / count
 
 
 class MonadTestCase(unittest.TestCase):
@@ -24,6 +37,52 @@ class MonadTestCase(unittest.TestCase):
         self.assertNotEqual(self.number_monad, Monad(0))
 
         self.assertEqual(self.number_monad >> (lambda x: Monad(x + 2)) >> (lambda x: Monad(x * x)), Monad(9))
+
+    def test_monad_slots(self):
+        for cls in (Monad, Some, Ok, Err):
+            with self.subTest(cls=cls.__name__):
+                self.assertFalse(hasattr(cls(1), '__dict__'))
+                with self.assertRaises(AttributeError):
+                    cls(1).other = 0
+        self.assertFalse(hasattr(Nothing(), '__dict__'))
+
+    def test_monad_frozen(self):
+        for monad in (Monad(1), Some(1), Ok(1), Err(1), Nothing()):
+            with self.subTest(monad=monad):
+                with self.assertRaises(AttributeError):
+                    monad._value = 2
+                with self.assertRaises(AttributeError):
+                    del monad._value
+                self.assertNotEqual(monad._value, 2)
+
+    def test_monad_hash(self):
+        self.assertEqual(hash(Ok(1)), hash(Ok(1)))
+        self.assertEqual(hash(Ok(1)), hash(Ok(1.0)))
+        self.assertEqual(hash(Nothing()), hash(Nothing()))
+        self.assertEqual(len({Ok(1), Ok(1), Err(1), Some(1), Monad(1), Nothing(), Nothing()}), 5)
+        self.assertNotEqual(Monad(1), Some(1))
+        self.assertNotEqual(Ok(1), Err(1))
+
+        groups: dict[Err[str], int] = {}
+        for error in ('a', 'b', 'a'):
+            groups[Err(error)] = groups.get(Err(error), 0) + 1
+        self.assertEqual(groups, {Err('a'): 2, Err('b'): 1})
+
+        # computed once and cached
+        ok = Ok((1, 2))
+        self.assertEqual(hash(ok), hash(ok))
+        self.assertEqual(ok._hash, hash(ok))
+
+        with self.assertRaises(TypeError):
+            hash(Ok([1]))
+        self.assertEqual(Ok([1]), Ok([1]))
+
+    def test_monad_instance_size(self):
+        # measured on CPython 3.11: 48 bytes per slotted wrapper with its hash slot, 80 with an instance `__dict__`
+        for cls in (Monad, Some, Ok, Err):
+            with self.subTest(cls=cls.__name__):
+                self.assertLessEqual(allocated_bytes_per_instance(lambda: cls(None)), 56)
+        self.assertLess(allocated_bytes_per_instance(Nothing), 1)
         
 
 if __name__ == '__main__':
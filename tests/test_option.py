@@ -73,10 +73,66 @@ class OptionTestCase(unittest.TestCase):
         self.assertTrue(Some(None))
         self.assertTrue(Some(False))
 
+    def test_option_variants(self):
+        self.assertIs(type(Option), type)
+        self.assertTrue(self.some_value._is_ok)
+        self.assertFalse(self.no_value._is_ok)
+        self.assertIsInstance(self.some_value, Option)
+        self.assertIsInstance(self.no_value, Option)
+        with self.assertRaises(TypeError):
+            Option(1)
+
+        match self.some_value:
+            case Some(value):
+                self.assertEqual(value, 1)
+            case _:
+                self.fail('Some did not match')
+
+    def test_option_nothing_singleton(self):
+        self.assertIs(Nothing(), Nothing())
+        self.assertIs(Nothing(), self.no_value)
+        self.assertIs(Nothing()._value, Ellipsis)
+
     def test_option_convert(self):
         self.assertEqual(self.some_value.ok_or('error'), Ok(1))
         self.assertEqual(self.no_value.ok_or('error'), Err('error'))
 
+    def test_option_lazy(self):
+        def fail():
+            raise AssertionError('evaluated on Some')
+
+        self.assertEqual(self.some_value.unwrap_or_else(fail), 1)
+        self.assertEqual(self.no_value.unwrap_or_else(lambda: 9), 9)
+
+        self.assertEqual(self.some_value.map_or(0, lambda x: -x), -1)
+        self.assertEqual(self.no_value.map_or(0, lambda x: -x), 0)
+        self.assertEqual(self.some_value.map_or_else(fail, lambda x: -x), -1)
+        self.assertEqual(self.no_value.map_or_else(lambda: 0, lambda x: -x), 0)
+
+        self.assertEqual(self.some_value.ok_or_else(fail), Ok(1))
+        self.assertEqual(self.no_value.ok_or_else(lambda: 'error'), Err('error'))
+
+        self.assertEqual(self.some_value.and_(Some(2)), Some(2))
+        self.assertEqual(self.some_value.and_(lambda: Some(2)), Some(2))
+        self.assertEqual(self.no_value.and_(fail), Nothing())
+        self.assertEqual(self.some_value.or_(fail), Some(1))
+        self.assertEqual(self.no_value.or_(Some(2)), Some(2))
+        self.assertEqual(self.no_value.or_(lambda: Some(2)), Some(2))
+
+        self.assertEqual(self.some_value.expect(fail), 1)
+        with self.assertRaises(Exception) as cm:
+            self.no_value.expect(lambda: f'nothing in {self.id()}')
+        self.assertEqual(str(cm.exception), f'nothing in {self.id()}')
+
+    def test_option_collect(self):
+        self.assertEqual(Option.collect([Some(1), Some(2)]), Some([1, 2]))
+        self.assertEqual(Option.collect(iter([Some(1), Nothing(), Some(2)])), Nothing())
+        self.assertEqual(Option.collect((Some(c) for c in 'ab'), into=''.join), Some('ab'))
+
+        options = iter([Some(1), Nothing(), Some(2)])
+        Option.collect(options, into=tuple)
+        self.assertEqual(list(options), [Some(2)])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+import itertools
+import pickle
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from src.rustymonad import Result, Ok, Err, Some, Nothing, try_notation, par_traverse
+
+
+def checked_sqrt(x: int) -> Result[float, str]:
+    if x < 0:
+        return Err(f'negative: {x}')
+    return Ok(x ** 0.5)
+
+
+@try_notation
+def parse(text: str) -> int:
+    return int(text)
+
+
+def maybe_half(x: int):
+    return Some(x // 2) if x % 2 == 0 else Nothing()
+
+
+class ParallelTestCase(unittest.TestCase):
+    def test_parallel_pickle(self):
+        for value in (Ok(1), Err('e'), Some([1, 2]), Nothing()):
+            with self.subTest(value=value):
+                self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+        self.assertIs(pickle.loads(pickle.dumps(Nothing())), Nothing())
+
+    def test_parallel_threads(self):
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(par_traverse(checked_sqrt, [0, 1, 4, 9], executor), Ok([0.0, 1.0, 2.0, 3.0]))
+            self.assertEqual(par_traverse(checked_sqrt, range(10), executor, chunksize=3), Ok([x ** 0.5 for x in range(10)]))
+            self.assertEqual(par_traverse(checked_sqrt, [1, -4, 9], executor), Err('negative: -4'))
+            self.assertEqual(par_traverse(checked_sqrt, [], executor), Ok([]))
+            self.assertEqual(par_traverse(maybe_half, [2, 4], executor, unit=Some), Some([1, 2]))
+            self.assertIs(par_traverse(maybe_half, [2, 3], executor, unit=Some), Nothing())
+            self.assertEqual(par_traverse(maybe_half, [], executor, unit=Some), Some([]))
+
+            oks, errs = par_traverse(parse, ['1', 'x', '3', 'y'], executor, chunksize=2, fail_fast=False)
+            self.assertEqual(oks, [1, 3])
+            self.assertEqual(len(errs), 2)
+
+            oks, errs = par_traverse(checked_sqrt, [9, -1, 4], executor, ordered=False, fail_fast=False)
+            self.assertEqual(sorted(oks), [2.0, 3.0])
+            self.assertEqual(errs, ['negative: -1'])
+
+        self.assertEqual(par_traverse(parse, ['1', '2']), Ok([1, 2]))
+
+    def test_parallel_fail_fast(self):
+        calls: list[int] = []
+
+        def slow_check(x: int) -> Result[int, str]:
+            calls.append(x)
+            time.sleep(0.01)
+            return Err('first failed') if x == 0 else Ok(x)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(par_traverse(slow_check, range(50), executor), Err('first failed'))
+        self.assertLess(len(calls), 50)
+
+        with self.assertRaises(ValueError):
+            par_traverse(slow_check, [1], chunksize=0)
+        with self.assertRaises(ValueError):
+            par_traverse(slow_check, [1], window=0)
+
+    def test_parallel_window(self):
+        pulled: list[int] = []
+
+        def items():
+            # endless, a failure must stop the reading
+            for x in itertools.count():
+                pulled.append(x)
+                yield x
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(par_traverse(lambda x: Err(x) if x == 5 else Ok(x), items(), executor, chunksize=2),
+                             Err(5))
+            # 4 chunks in flight at once, refilled as they complete
+            self.assertLess(len(pulled), 20)
+            self.assertEqual(par_traverse(checked_sqrt, range(100), executor, window=1), Ok([x ** 0.5 for x in range(100)]))
+
+    def test_parallel_processes(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(par_traverse(checked_sqrt, range(8), executor, chunksize=4), Ok([x ** 0.5 for x in range(8)]))
+            self.assertEqual(par_traverse(parse, ['1', 'x'], executor), Err("invalid literal for int() with base 10: 'x'"))
+            self.assertIs(par_traverse(maybe_half, [3], executor, unit=Some), Nothing())
+            oks, errs = par_traverse(maybe_half, [1, 2, 3], executor, fail_fast=False)
+            self.assertEqual((oks, errs), ([1], [None, None]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from src.rustymonad import Option, Some, Nothing
+
+
+class PathTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.doc = {'a': {'b': [{'c': 1}, {'c': None}], 'c.d': 'dotted'}, 'list': [10, 20, 30]}
+
+    def test_path_get(self):
+        self.assertEqual(Option.path('a.b[0].c')(self.doc), Some(1))
+        self.assertEqual(Option.path('list[-1]')(self.doc), Some(30))
+        self.assertEqual(Option.path('a["c.d"]')(self.doc), Some('dotted'))
+        self.assertEqual(Option.path("a['b'][0]")(self.doc), Some({'c': 1}))
+        self.assertEqual(Option.path('[1]')([0, 5]), Some(5))
+
+        self.assertIs(Option.path('a.b[1].c')(self.doc), Nothing())
+        self.assertIs(Option.path('a.missing.c')(self.doc), Nothing())
+        self.assertIs(Option.path('a.b[5]')(self.doc), Nothing())
+        self.assertIs(Option.path('list.a')(self.doc), Nothing())
+        self.assertIs(Option.path('a.b[0].c.d')(self.doc), Nothing())
+        self.assertIs(Option.path('a')(None), Nothing())
+
+    def test_path_parse(self):
+        self.assertIs(Option.path('a.b[0].c'), Option.path('a.b[0].c'))
+        self.assertEqual(Option.path(' a . b [ 0 ] ').keys, ('a', 'b', 0))
+        self.assertEqual(Option.path('a[0][1]["x y"]').keys, ('a', 0, 1, 'x y'))
+        for expr in ('', 'a.', 'a..b', 'a b', 'a[x]', 'a]', 'a[0]b'):
+            with self.subTest(expr=expr):
+                with self.assertRaises(ValueError):
+                    Option.path(expr)
+
+    def test_path_batch(self):
+        docs = [{'a': {'b': 1}}, {'a': {}}, {'a': {'b': None}}, [], {'a': {'b': 2}}]
+        self.assertEqual(Option.path('a.b').batch(docs), [Some(1), Nothing(), Nothing(), Nothing(), Some(2)])
+        self.assertEqual(Option.path('a.b').batch(iter(docs[:1])), [Some(1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+from src.rustymonad import Result, Ok, Err, Option, Some, Nothing, Pipeline
+
+
+def parse(text: str) -> Result[int, str]:
+    if text.lstrip('-').isdigit():
+        return Ok(int(text))
+    return Err(f'not a number: {text}')
+
+
+def positive(x: int) -> Result[int, str]:
+    return Ok(x) if x > 0 else Err('not positive')
+
+
+def half(x: int) -> Option[int]:
+    return Some(x // 2) if x % 2 == 0 else Nothing()
+
+
+class PipelineTestCase(unittest.TestCase):
+    def test_pipeline_compose(self):
+        pipe = Pipeline(parse) >> positive >> (lambda x: Ok(x * 10))
+        self.assertEqual(len(pipe), 3)
+        self.assertEqual(pipe('4'), Ok(40))
+        self.assertEqual(pipe('-4'), Err('not positive'))
+        self.assertEqual(pipe('four'), Err('not a number: four'))
+
+        for text in ('4', '-4', 'four'):
+            with self.subTest(text=text):
+                chained = parse(text).and_then(positive).map(str).and_then(parse)
+                self.assertEqual(Pipeline(parse).and_then(positive).map(str).and_then(parse)(text), chained)
+
+        tail = Pipeline(positive).map(lambda x: x + 1)
+        self.assertEqual((Pipeline(parse) >> tail)('1'), Ok(2))
+        self.assertEqual(Pipeline(parse).map(lambda x: x + 1).map(str)('1'), Ok('2'))
+
+    def test_pipeline_option(self):
+        pipe = Pipeline(half, unit=Some) >> half
+        self.assertEqual(pipe(8), Some(2))
+        self.assertEqual(pipe(6), Nothing())
+        self.assertEqual(pipe.map(str)(8), Some('2'))
+        self.assertEqual(Pipeline(unit=Some).map(abs)(-1), Some(1))
+
+    def test_pipeline_run(self):
+        pipe = Pipeline(positive).map(lambda x: x * 2)
+        self.assertEqual(pipe.run(Ok(3)), Ok(6))
+        self.assertEqual(pipe.run(Ok(-3)), Err('not positive'))
+        self.assertEqual(pipe.run(Err('upstream')), Err('upstream'))
+        self.assertEqual(Pipeline().map(abs).run(Some(-2)), Some(2))
+        self.assertIs(Pipeline(half).run(Nothing()), Nothing())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import pickle
+import time
+import unittest
+from src.rustymonad import Result, Ok, Err, Some, Nothing, DoRet, do_notation, try_notation
+from src.rustymonad import InMemorySink, enable_metrics, disable_metrics
+from src.rustymonad import Origin, enable_provenance, disable_provenance, origin_of, top_origins, clear_origins
+from src.rustymonad import provenance
+
+
+def safe_div(x: float, y: float) -> Result[float, str]:
+    if y == 0:
+        return Err('division by zero')
+    return Ok(x / y)
+
+
+def calc_process(a: float, b: float) -> DoRet[Result[float, str]]:
+    doubled = yield Ok(a * 2)
+    quotient = yield safe_div(doubled, b)
+    return Ok(quotient)
+
+
+@try_notation
+def parse(text: str) -> int:
+    return int(text)
+
+
+class ProvenanceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.err_init = Err.__init__
+        # every construction is recorded
+        enable_provenance(0)
+
+    def tearDown(self) -> None:
+        disable_provenance()
+        clear_origins()
+
+    def test_provenance_origin(self):
+        err = safe_div(1, 0)
+        origin = origin_of(err)
+        self.assertEqual((origin.function, origin.step), ('safe_div', None))
+        self.assertEqual(origin.line, safe_div.__code__.co_firstlineno + 2)
+        self.assertTrue(origin.file.endswith('test_provenance.py'))
+
+        # sampled values are plain ones, the origin is kept aside
+        self.assertIs(type(err), Err)
+        self.assertEqual(err, Err('division by zero'))
+        self.assertEqual(hash(err), hash(Err('division by zero')))
+        self.assertEqual(repr(err), "Result::Err('division by zero')")
+        self.assertEqual(pickle.loads(pickle.dumps(err)), err)
+
+        self.assertEqual(origin_of(parse('x')).function, 'parse')
+        self.assertIsNone(origin_of(Ok(1)))
+
+    def test_provenance_do_notation(self):
+        for compiled in (False, True):
+            with self.subTest(compile=compiled):
+                origin = origin_of(do_notation(compile=compiled)(calc_process)(1, 0))
+                self.assertEqual((origin.function, origin.step), ('safe_div', 1))
+
+    def test_provenance_report(self):
+        for _ in range(3):
+            safe_div(1, 0)
+        Some(1).filter(lambda x: x > 1)
+        (origin, count), (nothing_origin, nothing_count) = top_origins(2)
+        self.assertEqual((origin.function, count), ('safe_div', 3))
+        self.assertEqual((nothing_origin.function, nothing_count), ('test_provenance_report', 1))
+        self.assertIsInstance(origin, Origin)
+
+        clear_origins()
+        disable_provenance()
+        self.assertIsNone(origin_of(safe_div(1, 0)))
+        self.assertEqual(top_origins(), [])
+        with self.assertRaises(ValueError):
+            enable_provenance(-1)
+
+    def test_provenance_sampling(self):
+        # between the samples the plain constructors are installed
+        enable_provenance(3600)
+        self.assertIs(Err.__init__, self.err_init)
+        self.assertIsNone(origin_of(Err(0)))
+
+        # once a sample is due only the next construction is recorded
+        provenance._arm(provenance._stop)
+        errors = [Err(i) for i in range(3)]
+        self.assertEqual([origin_of(err) is not None for err in errors], [True, False, False])
+        self.assertIs(Err.__init__, self.err_init)
+        self.assertEqual(top_origins(1)[0][1], 1)
+
+        clear_origins()
+        enable_provenance(0.001)
+        limit = time.monotonic() + 5
+        while origin_of(Err(0)) is None and time.monotonic() < limit:
+            time.sleep(0.001)
+        self.assertEqual(top_origins(1)[0][0].function, 'test_provenance_sampling')
+
+        # only the most recent samples keep their origin
+        clear_origins()
+        enable_provenance(0)
+        errors = [Err(i) for i in range(provenance._TRACED_SIZE + 1)]
+        self.assertIsNone(origin_of(errors[0]))
+        self.assertIsNotNone(origin_of(errors[-1]))
+
+    def test_provenance_disable(self):
+        disable_provenance()
+        self.assertIs(Err.__init__, self.err_init)
+        self.assertIsNone(origin_of(safe_div(1, 0)))
+        self.assertEqual(top_origins(), [])
+
+    def test_provenance_metrics(self):
+        sink = InMemorySink()
+        enable_metrics(sink)
+        try:
+            err = safe_div(1, 0)
+        finally:
+            disable_metrics()
+        self.assertEqual(sink.count('err.created', function='safe_div'), 1)
+        self.assertEqual(origin_of(err).function, 'safe_div')
+
+    def test_provenance_metrics_order(self):
+        # the hooks are independent, either feature can be disabled first
+        sink = InMemorySink()
+        for first, second in ((disable_metrics, disable_provenance), (disable_provenance, disable_metrics)):
+            with self.subTest(first=first.__name__):
+                enable_provenance(0)
+                enable_metrics(sink)
+                first()
+                err = safe_div(1, 0)
+                self.assertEqual(origin_of(err) is not None, first is disable_metrics)
+                second()
+                self.assertIs(Err.__init__, self.err_init)
+                self.assertIsNone(origin_of(safe_div(1, 0)))
+        self.assertEqual(sink.count('err.created'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
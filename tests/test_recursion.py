@@ -0,0 +1,50 @@
+import unittest
+from src.rustymonad import Result, Ok, Err, Some, Nothing, DoRet, do_notation, trampoline, recur
+
+DEPTH = 100_000
+
+
+@trampoline
+def count_down(n: int, total: int = 0) -> Result[int, str]:
+    if n < 0:
+        return Err('negative')
+    if n == 0:
+        return Ok(total)
+    return Ok(n).and_then(lambda x: recur(x - 1, total=total + x))
+
+
+def walk(n: int, total: int = 0) -> DoRet[Result[int, str]]:
+    value = yield (Ok(n) if n >= 0 else Err('negative'))
+    if value == 0:
+        return Ok(total)
+    step = yield Ok(1)
+    return recur(value - step, total + value)
+
+
+class RecursionTestCase(unittest.TestCase):
+    def test_recursion_trampoline(self):
+        self.assertEqual(count_down(DEPTH), Ok(DEPTH * (DEPTH + 1) // 2))
+        self.assertEqual(count_down(-1), Err('negative'))
+        self.assertEqual(count_down.__name__, 'count_down')
+
+        @trampoline
+        def find(n: int):
+            return Nothing() if n == 0 else Some(n) >> (lambda x: recur(x - 1))
+        self.assertIs(find(DEPTH), Nothing())
+
+    def test_recursion_do_notation(self):
+        for compiled in (False, True):
+            with self.subTest(compile=compiled):
+                process = do_notation(compile=compiled, trampoline=True)(walk)
+                self.assertEqual(process(DEPTH), Ok(DEPTH * (DEPTH + 1) // 2))
+                self.assertEqual(process(-1), Err('negative'))
+
+        @do_notation(trampoline=True)
+        def invalid(n: int) -> DoRet[Result[int, str]]:
+            yield n
+        with self.assertRaises(TypeError):
+            invalid(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import unittest
+from src.rustymonad import Result, Ok, Err, try_notation, circuit_breaker, retry_result
+from src.rustymonad import InMemorySink, enable_metrics, disable_metrics
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def sleep_async(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+class ResilienceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.calls = 0
+        self.healthy = True
+
+    def fetch(self, key: str) -> Result[str, str]:
+        self.calls += 1
+        return Ok(key) if self.healthy else Err(f'timeout fetching {key}')
+
+    def test_breaker_opens(self):
+        fetch = circuit_breaker(window=4, min_calls=4, threshold=0.5, reset_timeout=10, clock=self.clock)(self.fetch)
+        self.assertEqual(fetch('a'), Ok('a'))
+        self.assertEqual(fetch('a'), Ok('a'))
+        self.healthy = False
+        self.assertEqual(fetch('b'), Err('timeout fetching b'))
+        self.assertEqual(fetch.breaker_info().state, 'closed')
+        self.assertEqual(fetch('c'), Err('timeout fetching c'))
+        self.assertEqual(fetch.breaker_info().state, 'open')
+
+        # the Err that opened the circuit is returned without calling
+        self.assertEqual(fetch('d'), Err('timeout fetching c'))
+        self.assertEqual(self.calls, 4)
+        self.assertEqual(fetch.breaker_info(), ('open', 4, 2, 1, 1, 0, 0))
+
+    def test_breaker_half_open(self):
+        fetch = circuit_breaker(window=2, min_calls=2, reset_timeout=10, error='unavailable', clock=self.clock)(self.fetch)
+        self.healthy = False
+        fetch('a')
+        fetch('a')
+        self.assertEqual(fetch('a'), Err('unavailable'))
+
+        # a failed probe reopens the circuit for another `reset_timeout`
+        self.clock.now = 10
+        self.assertEqual(fetch.breaker_info().state, 'half_open')
+        self.assertEqual(fetch('b'), Err('timeout fetching b'))
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(fetch.breaker_info().state, 'open')
+        self.clock.now = 15
+        fetch('b')
+        self.assertEqual(self.calls, 3)
+
+        # a successful probe closes it
+        self.clock.now = 20
+        self.healthy = True
+        self.assertEqual(fetch('c'), Ok('c'))
+        self.assertEqual(fetch('c'), Ok('c'))
+        self.assertEqual(fetch.breaker_info(), ('closed', 5, 3, 2, 2, 2, 1))
+
+        fetch.breaker_reset()
+        self.assertEqual(fetch.breaker_info(), ('closed', 0, 0, 0, 0, 0, 0))
+
+    def test_breaker_window(self):
+        fetch = circuit_breaker(window=4, min_calls=2, threshold=0.75, clock=self.clock)(self.fetch)
+        for healthy in (False, True, False, True, False, True):
+            self.healthy = healthy
+            fetch('a')
+        self.assertEqual(fetch.breaker_info().state, 'closed')
+        self.healthy = False
+        fetch('a')
+        fetch('a')
+        self.assertEqual(fetch.breaker_info().state, 'open')
+
+        with self.assertRaises(ValueError):
+            circuit_breaker(window=2, min_calls=3)(self.fetch)
+
+    def test_breaker_try_notation(self):
+        @circuit_breaker(window=2, min_calls=2, clock=self.clock)
+        @try_notation
+        def parse(text: str) -> int:
+            self.calls += 1
+            return int(text)
+
+        self.assertEqual(parse('1'), Ok(1))
+        parse('x')
+        self.assertEqual(parse('2'), Err("invalid literal for int() with base 10: 'x'"))
+        self.assertEqual(self.calls, 2)
+
+    def test_breaker_exception(self):
+        @circuit_breaker(window=1, min_calls=1, clock=self.clock)
+        def broken() -> Result[int, str]:
+            raise RuntimeError('bug')
+
+        with self.assertRaises(RuntimeError):
+            broken()
+        self.assertEqual(broken(), Err('circuit breaker is open'))
+
+    def test_breaker_async(self):
+        @circuit_breaker(window=2, min_calls=2, reset_timeout=10, clock=self.clock)
+        async def fetch(key: str) -> Result[str, str]:
+            await asyncio.sleep(0)
+            return self.fetch(key)
+
+        async def run():
+            self.healthy = False
+            results = await asyncio.gather(*(fetch(str(i)) for i in range(4)))
+            self.clock.now = 10
+            self.healthy = True
+            probes = await asyncio.gather(fetch('x'), fetch('y'))
+            return results, probes
+
+        results, probes = asyncio.run(run())
+        self.assertEqual(self.calls, 5)
+        self.assertTrue(all(result.is_err() for result in results))
+        # only one probe goes through while half open
+        self.assertEqual(sorted(map(repr, probes)), sorted(map(repr, [Ok('x'), Err('timeout fetching 1')])))
+        self.assertEqual(fetch.breaker_info().state, 'closed')
+
+    def test_breaker_threads(self):
+        fetch = circuit_breaker(window=10, min_calls=10, clock=self.clock)(self.fetch)
+        barrier = threading.Barrier(8)
+
+        def run():
+            barrier.wait()
+            for _ in range(100):
+                fetch('a')
+
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(fetch.breaker_info(), ('closed', 800, 0, 0, 0, 0, 0))
+        self.assertEqual(self.calls, 800)
+
+
+    def flaky(self, failures: int, error: str = 'busy') -> Result[int, str]:
+        self.calls += 1
+        self.clock.now += 0.5
+        return Err(error) if self.calls <= failures else Ok(self.calls)
+
+    def retry(self, **kwargs):
+        return retry_result(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_retry_backoff(self):
+        fetch = self.retry(attempts=5, base_delay=1, jitter=0)(lambda: self.flaky(3))
+        self.assertEqual(fetch(), Ok(4))
+        self.assertEqual(self.clock.sleeps, [1, 2, 4])
+
+        self.calls = 0
+        self.clock.sleeps.clear()
+        fetch = self.retry(attempts=3, base_delay=1, max_delay=1.5, jitter=0)(lambda: self.flaky(5))
+        self.assertEqual(fetch(), Err('busy'))
+        self.assertEqual(self.calls, 3)
+        self.assertEqual(self.clock.sleeps, [1, 1.5])
+
+        with self.assertRaises(ValueError):
+            retry_result(attempts=0)(self.flaky)
+
+    def test_retry_jitter(self):
+        fetch = self.retry(attempts=3, base_delay=2, jitter=0.5, random=lambda: 0.5)(lambda: self.flaky(2))
+        self.assertEqual(fetch(), Ok(3))
+        self.assertEqual(self.clock.sleeps, [1.5, 3])
+
+    def test_retry_if(self):
+        fetch = self.retry(retry_if=lambda error: error == 'busy', base_delay=0)(lambda: self.flaky(5, 'not found'))
+        self.assertEqual(fetch(), Err('not found'))
+        self.assertEqual(self.calls, 1)
+
+    def test_retry_budget(self):
+        # 0.5s per call, the third call would start at 3.5s
+        fetch = self.retry(attempts=10, base_delay=1, jitter=0, budget=3)(lambda: self.flaky(5))
+        self.assertEqual(fetch(), Err('busy'))
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(self.clock.sleeps, [1])
+        self.assertLess(self.clock.now, 3)
+
+    def test_retry_async(self):
+        @retry_result(attempts=4, base_delay=1, jitter=0, clock=self.clock, sleep=self.clock.sleep_async)
+        async def fetch() -> Result[int, str]:
+            await asyncio.sleep(0)
+            return self.flaky(2)
+
+        self.assertEqual(asyncio.run(fetch()), Ok(3))
+        self.assertEqual(self.clock.sleeps, [1, 2])
+
+    def test_retry_metrics(self):
+        sink = InMemorySink()
+        enable_metrics(sink)
+        try:
+            fetch = self.retry(attempts=3, base_delay=1, jitter=0)(lambda: self.flaky(1))
+            fetch()
+            fetch()
+        finally:
+            disable_metrics()
+        self.assertEqual(sink.count('retry_result.calls', outcome='ok'), 2)
+        self.assertEqual(sink.count('retry_result.attempts'), 3)
+        self.assertEqual(sink.timings('retry_result.duration'), [2.0, 0.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
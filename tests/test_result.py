@@ -1,4 +1,6 @@
 import unittest
+from array import array
+from functools import partial
 from src.rustymonad import Result, Ok, Err
 from src.rustymonad import Some, Nothing
 
@@ -84,6 +86,20 @@ class ResultTestCase(unittest.TestCase):
         self.assertTrue(Ok(None))
         self.assertTrue(Ok(False))
 
+    def test_result_variants(self):
+        self.assertIs(type(Result), type)
+        self.assertTrue(self.ok_value._is_ok)
+        self.assertFalse(self.err_value._is_ok)
+        self.assertIsInstance(self.err_value, Result)
+        with self.assertRaises(TypeError):
+            Result(1)
+
+        match self.err_value:
+            case Ok(_):
+                self.fail('Err matched Ok')
+            case Err(error):
+                self.assertTrue(error.endswith('wrong'))
+
     def test_result_convert(self):
         self.assertEqual(self.ok_value.ok(), Some(100))
         self.assertEqual(self.ok_value.err(), Nothing())
@@ -91,6 +107,67 @@ class ResultTestCase(unittest.TestCase):
         self.assertEqual(self.err_value.ok(), Nothing())
         self.assertEqual(self.err_value.err(), Some('something wrong'))
 
+    def test_result_lazy(self):
+        def fail(*args):
+            raise AssertionError('evaluated on the other variant')
+
+        self.assertEqual(self.ok_value.unwrap_or_else(fail), 100)
+        self.assertEqual(self.err_value.unwrap_or_else(len), 15)
+
+        self.assertEqual(self.ok_value.map_or(0, lambda x: -x), -100)
+        self.assertEqual(self.err_value.map_or(0, lambda x: -x), 0)
+        self.assertEqual(self.ok_value.map_or_else(fail, lambda x: -x), -100)
+        self.assertEqual(self.err_value.map_or_else(len, fail), 15)
+
+        self.assertEqual(self.ok_value.and_(Ok(1)), Ok(1))
+        self.assertEqual(self.ok_value.and_(lambda: Err('later')), Err('later'))
+        self.assertEqual(self.err_value.and_(fail), Err('something wrong'))
+        self.assertEqual(self.ok_value.or_(fail), Ok(100))
+        self.assertEqual(self.err_value.or_(Ok(1)), Ok(1))
+        self.assertEqual(self.err_value.or_(lambda: Ok(1)), Ok(1))
+
+        self.assertEqual(self.ok_value.expect(fail), 100)
+        self.assertEqual(self.err_value.expect_err(fail), 'something wrong')
+        with self.assertRaises(Exception) as cm:
+            self.err_value.expect(lambda: 'opration failed')
+        self.assertEqual(str(cm.exception), 'opration failed: something wrong')
+        with self.assertRaises(Exception) as cm:
+            self.ok_value.expect_err(lambda: 'opration failed')
+        self.assertEqual(str(cm.exception), 'opration failed: 100')
+
+    def test_result_try_catch(self):
+        def chained() -> None:
+            try:
+                {}['key']
+            except KeyError as e:
+                raise RuntimeError('lookup failed') from e
+
+        self.assertEqual(Result.try_catch(int)('1'), Ok(1))
+        self.assertEqual(Result.try_catch(chained)(), Err('lookup failed'))
+
+        error = Result.try_catch(chained, keep_exception=True, tb_frames=0)().unwrap_err()
+        self.assertIsInstance(error, RuntimeError)
+        self.assertIsNone(error.__traceback__)
+        self.assertIsNone(error.__cause__.__traceback__)
+
+    def test_result_collect(self):
+        pulled: list[int] = []
+
+        def results(values: list[int]):
+            for value in values:
+                pulled.append(value)
+                yield Ok(value) if value >= 0 else Err(f'negative {value}')
+
+        self.assertEqual(Result.collect(results([1, 2, 3])), Ok([1, 2, 3]))
+        self.assertEqual(Result.collect(results([])), Ok([]))
+        pulled.clear()
+        self.assertEqual(Result.collect(results([1, -2, 3, -4])), Err('negative -2'))
+        self.assertEqual(pulled, [1, -2])
+
+        self.assertEqual(Result.collect(results([1, 2]), into=tuple), Ok((1, 2)))
+        self.assertEqual(Result.collect(results([1, 2]), into=partial(array, 'q')), Ok(array('q', [1, 2])))
+        self.assertEqual(Result.collect([Ok(('a', 1)), Ok(('b', 2))], into=dict), Ok({'a': 1, 'b': 2}))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+from src.rustymonad import Result, Ok, Err, Some, Nothing, ResultStream, OptionStream
+
+
+def parse(text: str) -> Result[int, str]:
+    if text.lstrip('-').isdigit():
+        return Ok(int(text))
+    return Err(f'bad line: {text}')
+
+
+class StreamTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pulled: list[str] = []
+
+    def lines(self, *lines: str):
+        for line in lines:
+            self.pulled.append(line)
+            yield line
+
+    def test_stream_adapters(self):
+        stream = ResultStream(map(parse, self.lines('1', 'x', '-2', '3')))
+        self.assertEqual(self.pulled, [])
+        results = list(stream.map_ok(lambda x: x * 10).filter_ok(lambda x: x != -20))
+        self.assertEqual(results, [Ok(10), Err('bad line: x'), Ok(30)])
+
+        stream = ResultStream(map(parse, ['4', '-1', 'y'])).and_then(lambda x: Ok(x) if x > 0 else Err('negative'))
+        self.assertEqual(list(stream), [Ok(4), Err('negative'), Err('bad line: y')])
+
+        errors: list[str] = []
+        stream = ResultStream(map(parse, ['1', 'x', 'y'])).inspect_err(errors.append)
+        self.assertEqual(len(list(stream)), 3)
+        self.assertEqual(errors, ['bad line: x', 'bad line: y'])
+
+    def test_stream_take_while_ok(self):
+        stream = ResultStream(map(parse, self.lines('1', '2', 'x', '3'))).take_while_ok()
+        self.assertEqual(list(stream), [Ok(1), Ok(2)])
+        self.assertEqual(self.pulled, ['1', '2', 'x'])
+
+    def test_stream_policies(self):
+        stream = ResultStream(map(parse, self.lines('1', 'x', '2')), policy='fail_fast').map_ok(str)
+        self.assertEqual(list(stream), [Ok('1'), Err('bad line: x')])
+        self.assertEqual(self.pulled, ['1', 'x'])
+
+        stream = ResultStream(map(parse, ['1', 'x', '2', 'y']), policy='skip').map_ok(str)
+        self.assertEqual(list(stream), [Ok('1'), Ok('2')])
+        self.assertEqual(stream.skipped, 2)
+
+        # the counter is shared along the chain, the source stream sees the skipped failures too
+        source = ResultStream([Ok(1), Err('x'), Ok(2)], policy='skip')
+        self.assertEqual(source.map_ok(lambda x: x * 2).try_fold(0, lambda acc, x: Ok(acc + x)), Ok(6))
+        self.assertEqual(source.skipped, 1)
+
+        with self.assertRaises(ValueError):
+            ResultStream([], policy='ignore')  # type: ignore[arg-type]
+
+    def test_stream_chunked(self):
+        stream = ResultStream(map(parse, ['1', 'x', '2', '3', '4']), policy='skip')
+        self.assertEqual(list(stream.chunked(2)), [[Ok(1), Ok(2)], [Ok(3), Ok(4)]])
+        self.assertEqual(stream.skipped, 1)
+        with self.assertRaises(ValueError):
+            next(ResultStream([]).chunked(0))
+
+    def test_stream_fold(self):
+        add = lambda total, x: Ok(total + x)
+        self.assertEqual(ResultStream(map(parse, ['1', '2', '3'])).try_fold(0, add), Ok(6))
+        self.assertEqual(ResultStream(map(parse, self.lines('1', 'x', '3'))).try_fold(0, add), Err('bad line: x'))
+        self.assertEqual(self.pulled, ['1', 'x'])
+        self.assertEqual(ResultStream(map(parse, ['1', 'x', '3']), policy='skip').try_fold(0, add), Ok(4))
+        capped = lambda total, x: Ok(total + x) if total + x < 3 else Err('overflow')
+        self.assertEqual(ResultStream(map(parse, ['1', '2', '3'])).try_fold(0, capped), Err('overflow'))
+
+        self.assertEqual(ResultStream(map(parse, ['1', '2'])).collect(tuple), Ok((1, 2)))
+        self.assertEqual(ResultStream(map(parse, ['1', 'x'])).collect(), Err('bad line: x'))
+
+    def test_stream_option(self):
+        half = lambda x: Some(x // 2) if x % 2 == 0 else Nothing()
+        stream = OptionStream(map(half, [4, 3, 8])).map_ok(lambda x: x + 1)
+        self.assertEqual(list(stream), [Some(3), Nothing(), Some(5)])
+
+        missing: list[None] = []
+        stream = OptionStream([Some(1), Nothing()]).inspect_err(missing.append)
+        list(stream)
+        self.assertEqual(missing, [None])
+
+        self.assertEqual(OptionStream(map(half, [2, 4])).try_fold(0, lambda a, x: Some(a + x)), Some(3))
+        self.assertEqual(OptionStream(map(half, [2, 4])).collect(), Some([1, 2]))
+        self.assertEqual(OptionStream(map(half, [2, 3]), policy='skip').collect(), Some([1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import sys
+import threading
+import time
+import unittest
+from src.rustymonad import Result, Ok, Err, Some, Nothing, DoRet, do_notation, traverse, memoize_result
+
+THREADS = 8
+ITERATIONS = 2000
+
+
+def parse(text: str) -> Result[int, str]:
+    return Ok(int(text)) if text.isdigit() else Err(f'bad number: {text}')
+
+
+@do_notation
+def add(a: str, b: str) -> DoRet[Result[int, str]]:
+    x = yield parse(a)
+    y = yield parse(b)
+    return Ok(x + y)
+
+
+@do_notation(compile=True)
+def add_compiled(a: str, b: str) -> DoRet[Result[int, str]]:
+    x = yield parse(a)
+    y = yield parse(b)
+    return Ok(x + y)
+
+
+def workload(iterations: int) -> list[str]:
+    # returns the mismatches, an empty list when every result is correct
+    errors = []
+    for i in range(iterations):
+        for process in (add, add_compiled):
+            if process(str(i), '1') != Ok(i + 1) or process(str(i), 'x') != Err('bad number: x'):
+                errors.append(f'{process.__name__}({i})')
+        if Nothing() is not Nothing() or Some(i).filter(lambda x: x < 0) is not Nothing():
+            errors.append(f'Nothing({i})')
+        if traverse(parse, [str(i), '2']) != Ok([i, 2]):
+            errors.append(f'traverse({i})')
+    return errors
+
+
+def run_threads(count: int, target) -> float:
+    barrier = threading.Barrier(count + 1)
+
+    def _run():
+        barrier.wait()
+        target()
+
+    threads = [threading.Thread(target=_run) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+class ThreadingTestCase(unittest.TestCase):
+    def test_threading_correctness(self):
+        errors: list[str] = []
+        lock = threading.Lock()
+
+        def _target():
+            mismatches = workload(ITERATIONS // 4)
+            with lock:
+                errors.extend(mismatches)
+
+        run_threads(THREADS, _target)
+        self.assertEqual(errors, [])
+
+    def test_threading_memoize(self):
+        calls = []
+
+        @memoize_result(maxsize=None)
+        def square(x: int) -> Result[int, str]:
+            calls.append(x)
+            return Ok(x * x)
+
+        results: list[list[Result[int, str]]] = []
+        run_threads(THREADS, lambda: results.append([square(i % 50) for i in range(ITERATIONS)]))
+        self.assertEqual(len(results), THREADS)
+        for result in results:
+            self.assertEqual(result, [Ok((i % 50) ** 2) for i in range(ITERATIONS)])
+        self.assertEqual(sorted(calls), list(range(50)))
+        info = square.cache_info()
+        self.assertEqual(info.misses, 50)
+        self.assertEqual(info.hits + info.misses + info.shared, THREADS * ITERATIONS)
+
+    def test_threading_scaling(self):
+        # Throughput only scales on free-threaded builds, with the GIL the threads take turns.
+        if getattr(sys, '_is_gil_enabled', lambda: True)():
+            self.skipTest('the GIL is enabled')
+        threads = min(THREADS, os.cpu_count() or 1)
+        if threads < 2:
+            self.skipTest('a single cpu')
+        single = run_threads(1, lambda: workload(ITERATIONS))
+        parallel = run_threads(threads, lambda: workload(ITERATIONS))
+        # `threads` times the work in the same time would be perfectly linear
+        speedup = threads * single / parallel
+        self.assertGreater(speedup, threads * 0.6, f'speedup {speedup:.1f}x on {threads} threads')
+
+
+if __name__ == '__main__':
+    unittest.main()
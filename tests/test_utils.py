@@ -1,6 +1,10 @@
+import asyncio
+import inspect
+import time
+import traceback
 import unittest
-from src.rustymonad import Result, Ok, Err
-from src.rustymonad import DoRet, do_notation, try_notation
+from src.rustymonad import Result, Ok, Err, Option, Some, Nothing
+from src.rustymonad import DoRet, AsyncDoRet, do_notation, async_do_notation, try_notation, propagate, traverse, partition
 
 
 number = int | float
@@ -21,6 +25,15 @@ class ResultUtils:
         return Ok(math.sqrt(x))
     
 
+@do_notation(compile=True)
+def count_down(n: int) -> DoRet[Result[int, str]]:
+    value = yield (Ok(n) if n >= 0 else Err('negative'))
+    if value == 0:
+        return Ok(0)
+    rest = yield count_down(value - 1)
+    return Ok(value + rest)
+
+
 class UtilsTestCase(unittest.TestCase):
     def test_utils_do_notation(self):
 
@@ -35,6 +48,138 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(calc_process(-9, 2), Err('sqrt negative'))
         self.assertEqual(calc_process(-9, 0), Err('sqrt negative'))
 
+    def test_utils_do_notation_compile(self):
+        offset = 10
+
+        def lookup(key: str, table: dict[str, int]) -> Option[int]:
+            return Some(table[key]) if key in table else Nothing()
+
+        def calc_process(a: number, b: number, *, scale: number = 1) -> DoRet[Result[float, str]]:
+            root = yield ResultUtils.safe_sqrt(a)
+            quotient: float = yield ResultUtils.safe_div(root, b)
+            yield ResultUtils.safe_sqrt(quotient)
+            return Ok(quotient * scale + offset)
+
+        def sum_process(keys: list[str], table: dict[str, int]) -> DoRet[Option[int]]:
+            total = 0
+            for key in keys:
+                if key.startswith('_'):
+                    continue
+                total += yield lookup(key, table)
+            while total > 100:
+                total = yield Some(total // 2)
+            match total:
+                case 0:
+                    return Nothing()
+                case _:
+                    last = yield Some(total)
+            return Some(last)
+
+        def invalid_process() -> DoRet[Result[int, str]]:
+            value = yield 1
+            return Ok(value)
+
+        for process in (calc_process, sum_process, invalid_process):
+            compiled_process = do_notation(compile=True)(process)
+            self.assertFalse(inspect.isgeneratorfunction(compiled_process))
+            self.assertEqual(compiled_process.__code__.co_firstlineno, process.__code__.co_firstlineno)
+
+        table = {'a': 1, 'b': 50, 'c': 300}
+        for compiled in (False, True):
+            with self.subTest(compile=compiled):
+                calc = do_notation(compile=compiled)(calc_process)
+                self.assertEqual(calc(9, 2), Ok(11.5))
+                self.assertEqual(calc(9, 2, scale=2), Ok(13.0))
+                self.assertEqual(calc(9, 0), Err('division by zero'))
+                self.assertEqual(calc(-9, 2), Err('sqrt negative'))
+                self.assertEqual(calc(9, -3), Err('sqrt negative'))
+                self.assertEqual(calc.__name__, 'calc_process')
+
+                summing = do_notation(compile=compiled)(sum_process)
+                self.assertEqual(summing(['a', 'b'], table), Some(51))
+                self.assertEqual(summing(['a', '_x', 'c'], table), Some(75))
+                self.assertEqual(summing(['a', 'x'], table), Nothing())
+                self.assertEqual(summing([], table), Nothing())
+
+                with self.assertRaises(TypeError):
+                    do_notation(compile=compiled)(invalid_process)()
+
+        offset = 20
+        self.assertEqual(do_notation(compile=True)(calc_process)(9, 2), Ok(21.5))
+
+    def test_utils_do_notation_compile_recursive(self):
+        # the recursive call resolves `count_down` as a global instead of falling back to the generator driver
+        self.assertEqual(count_down.__code__.co_name, 'count_down')
+        self.assertFalse(inspect.isgeneratorfunction(count_down))
+        self.assertEqual(count_down(10), Ok(55))
+        self.assertEqual(count_down(-1), Err('negative'))
+
+    def test_utils_do_notation_compile_fallback(self):
+
+        @do_notation(compile=True)
+        def calc_process(a: number, b: number) -> DoRet[Result[float, str]]:
+            # yields nested in expressions or `try` blocks are left to the generator driver
+            total = (yield ResultUtils.safe_sqrt(a)) + (yield ResultUtils.safe_sqrt(b))
+            try:
+                quotient = yield ResultUtils.safe_div(total, b)
+            except ZeroDivisionError:
+                return Err('unreachable')
+            return Ok(quotient)
+
+        self.assertEqual(calc_process.__code__.co_name, '_wrapper')
+        self.assertEqual(calc_process(9, 4), Ok(1.25))
+        self.assertEqual(calc_process(9, 0), Err('division by zero'))
+        self.assertEqual(calc_process(-9, 1), Err('sqrt negative'))
+
+    def test_utils_async_do_notation(self):
+        cancelled: list[str] = []
+        cleaned_up: list[bool] = []
+
+        async def fetch(name: str, delay: float, result: Result[str, str]) -> Result[str, str]:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+            return result
+
+        @async_do_notation
+        async def gather_process(fail: bool) -> AsyncDoRet:
+            try:
+                first = yield fetch('first', 0, Ok('a'))
+                second, third, fourth = yield (
+                    fetch('second', 0.05, Ok('b')),
+                    fetch('third', 0.01, Err('third failed') if fail else Ok('c')),
+                    Ok('d'),
+                )
+                yield Ok(first + second + third + fourth)
+            finally:
+                cleaned_up.append(True)
+
+        start = time.perf_counter()
+        self.assertEqual(asyncio.run(gather_process(False)), Ok('abcd'))
+        self.assertLess(time.perf_counter() - start, 0.1)
+        self.assertEqual(cancelled, [])
+
+        self.assertEqual(asyncio.run(gather_process(True)), Err('third failed'))
+        self.assertEqual(cancelled, ['second'])
+        self.assertEqual(cleaned_up, [True, True])
+
+        @async_do_notation
+        async def option_process(value: int) -> AsyncDoRet:
+            half = yield Some(value // 2) if value % 2 == 0 else Nothing()
+            yield Some(half + 1)
+
+        self.assertEqual(asyncio.run(option_process(4)), Some(3))
+        self.assertEqual(asyncio.run(option_process(3)), Nothing())
+
+        @async_do_notation
+        async def invalid_process() -> AsyncDoRet:
+            yield 1
+
+        with self.assertRaises(TypeError):
+            asyncio.run(invalid_process())
+
     def test_utils_try_notation(self):
 
         @try_notation
@@ -44,6 +189,93 @@ class UtilsTestCase(unittest.TestCase):
         self.assertEqual(div_with_try(1, 2), Ok(0.5))
         self.assertEqual(div_with_try(1, 0), Err('division by zero'))
 
+    def test_utils_try_notation_keep_exception(self):
+
+        def parse(text: str) -> int:
+            def inner() -> int:
+                return int(text)
+            return inner()
+
+        kept = try_notation(keep_exception=True)(parse)
+        self.assertEqual(kept.__name__, 'parse')
+        self.assertEqual(kept('1'), Ok(1))
+        error = kept('x').unwrap_err()
+        self.assertIsInstance(error, ValueError)
+        self.assertEqual([frame.name for frame in traceback.extract_tb(error.__traceback__)], ['_wrapper', 'parse', 'inner'])
+
+        trimmed = try_notation(keep_exception=True, tb_frames=1)(parse)('x').unwrap_err()
+        self.assertEqual([frame.name for frame in traceback.extract_tb(trimmed.__traceback__)], ['inner'])
+        self.assertIsNone(try_notation(keep_exception=True, tb_frames=0)(parse)('x').unwrap_err().__traceback__)
+
+        match kept('x'):
+            case Err(ValueError() as e):
+                self.assertIn('invalid literal', str(e))
+            case _:
+                self.fail('expected Err(ValueError)')
+
+    def test_utils_propagate(self):
+
+        @propagate
+        def calc_process(a: number, b: number) -> Result[float, str]:
+            quotient = ResultUtils.safe_div(a, b).q()
+            try:
+                doubled = Ok(quotient * 2).q()
+            except Exception:
+                self.fail('the propagation signal must not be an Exception')
+            return Ok(doubled)
+
+        self.assertEqual(calc_process(1, 2), Ok(1.0))
+        self.assertEqual(calc_process(1, 0), Err('division by zero'))
+        self.assertEqual(calc_process.__name__, 'calc_process')
+
+        @propagate
+        def first_char(text: str) -> Option[str]:
+            stripped = Some(text.strip()).filter(bool).q()
+            return Some(stripped[0])
+
+        self.assertEqual(first_char(' ab'), Some('a'))
+        self.assertIs(first_char('  '), Nothing())
+
+        @propagate
+        async def async_process(a: number, b: number) -> Result[float, str]:
+            await asyncio.sleep(0)
+            return Ok(ResultUtils.safe_div(a, b).q())
+
+        self.assertEqual(asyncio.run(async_process(1, 0)), Err('division by zero'))
+
+        with self.assertRaises(BaseException) as context:
+            Err('outside').q()
+        self.assertNotIsInstance(context.exception, Exception)
+        self.assertIn('@propagate', str(context.exception))
+
+    def test_utils_traverse(self):
+        self.assertEqual(traverse(ResultUtils.safe_sqrt, [4, 9, 16]), Ok([2.0, 3.0, 4.0]))
+        self.assertEqual(traverse(ResultUtils.safe_sqrt, []), Ok([]))
+        self.assertEqual(traverse(lambda x: Some(x) if x else Nothing(), [1, 2], into=tuple, unit=Some), Some((1, 2)))
+        self.assertEqual(traverse(lambda x: Some(x) if x else Nothing(), [1, 0, 2], unit=Some), Nothing())
+        # the empty input has the type chosen by `unit`
+        self.assertEqual(traverse(lambda x: Some(x), [], unit=Some), Some([]))
+        with self.assertRaises(TypeError):
+            traverse(lambda x: Some(x), [1])
+        with self.assertRaises(ValueError):
+            traverse(lambda x: Some(x), [1], unit=Nothing)
+        # a value that isn't a Result is rejected wherever it appears, a leading None included
+        with self.assertRaises(TypeError):
+            traverse(lambda x: None, [1, 2])
+        with self.assertRaises(TypeError):
+            traverse(lambda x: Ok(x) if x == 1 else None, [1, 2])
+        with self.assertRaises(TypeError):
+            traverse(lambda x: Ok(x) if x == 1 else Some(x), [1, 2])
+
+        lines = iter(['1', '2', 'x', '4'])
+        self.assertEqual(traverse(try_notation(int), lines), Err("invalid literal for int() with base 10: 'x'"))
+        self.assertEqual(list(lines), ['4'])
+
+    def test_utils_partition(self):
+        self.assertEqual(partition([Ok(1), Err('a'), Ok(2), Err('b')]), ([1, 2], ['a', 'b']))
+        self.assertEqual(partition(iter([Some(1), Nothing()])), ([1], [None]))
+        self.assertEqual(partition([]), ([], []))
+
 
 if __name__ == '__main__':
     unittest.main()
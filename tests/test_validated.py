@@ -0,0 +1,56 @@
+import unittest
+from src.rustymonad import Result, Ok, Err, Validated, Errors
+
+
+def check_name(record: dict) -> Result[str, str]:
+    if not record.get('name'):
+        return Err('name is required')
+    return Ok(record['name'])
+
+
+def check_age(record: dict) -> Result[int, str]:
+    if not 0 <= record.get('age', -1) < 150:
+        return Err('age is out of range')
+    return Ok(record['age'])
+
+
+class ValidatedTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.calls = 0
+
+    def counted(self, record: dict) -> Result[dict, str]:
+        self.calls += 1
+        return Ok(record)
+
+    def test_validated_call(self):
+        validate = Validated(check_name, check_age, self.counted)
+        self.assertEqual(validate({'name': 'aki', 'age': 20}), Ok({'name': 'aki', 'age': 20}))
+        self.assertEqual(validate({'age': 200}), Err(['name is required', 'age is out of range']))
+        self.assertIsInstance(validate({}).unwrap_err(), Errors)
+        self.assertEqual(self.calls, 3)
+
+        build = Validated(check_name, check_age, into=lambda name, age: f'{name}:{age}')
+        self.assertEqual(build({'name': 'aki', 'age': 20}), Ok('aki:20'))
+
+    def test_validated_zip(self):
+        self.assertEqual(Validated.zip(Ok(1), Ok(2)), Ok((1, 2)))
+        self.assertEqual(Validated.zip(Err('a'), Ok(2), Err('b')), Err(['a', 'b']))
+        self.assertEqual(Validated.zip(), Ok(()))
+        self.assertEqual(Validated.map_n(lambda a, b: a + b, Ok(1), Ok(2)), Ok(3))
+        self.assertEqual(Validated.map_n(lambda a, b: a + b, Err('a'), Err('b')), Err(['a', 'b']))
+
+        # accumulated errors are merged flat
+        nested = Validated.zip(Validated.zip(Err('a'), Err('b')), Err('c'))
+        self.assertEqual(nested, Err(['a', 'b', 'c']))
+
+    def test_validated_batch(self):
+        validate = Validated(check_name, check_age, self.counted)
+        records = [{'name': 'aki', 'age': 20}, {'age': 200}, {'name': 'sun', 'age': -1}]
+        valid, invalid = validate.batch(records)
+        self.assertEqual(valid, [records[0]])
+        self.assertEqual(invalid, {1: ['name is required', 'age is out of range'], 2: ['age is out of range']})
+        self.assertEqual(self.calls, len(records))
+
+
+if __name__ == '__main__':
+    unittest.main()